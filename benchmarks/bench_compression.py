@@ -0,0 +1,158 @@
+"""
+Benchmark reading gzip and zstd compressed inputs against plain files.
+
+For each data kind and size the script compresses a generated file (see generate_data.py)
+with every codec and level, then times the same processing function on the plain and on
+each compressed copy:
+- csv  -> analyze_Speed_speed
+- json -> count_people_by_gender
+- text -> count_word_occurrences
+
+Besides the compression ratio and the compression time, it reports the extra processing time
+the decompression costs and the break-even read speed: the bytes saved divided by that extra
+time. Compression pays off when the storage the files are read from is slower than that, and
+costs time when it is faster (for example a warm page cache or a fast NVMe drive).
+
+By default the files are read from a warm page cache, which measures the pure CPU cost.
+With --cold each file is dropped from the page cache before every run (Linux/Unix only,
+through posix_fadvise), so the saved I/O shows up in the timings as well.
+The columnar cache is turned off so every run really parses the file. Compressed copies are
+kept in bench_data/compressed/ and reused, so the compression time is only shown when a copy is made.
+
+Execution Command: py benchmarks/bench_compression.py [--kinds csv json text] [--sizes 10MB 100MB] [--cold]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import time
+import pathlib
+import argparse
+
+# Making sure Python can find utils_*.py in the root folder and the processors in the processed folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'processed')))
+
+# Import from local project modules
+from utils_logger import logger
+import utils_columnar
+from utils_compression import compress_file, zstandard
+from generate_data import ensure_dataset, parse_size
+from sowers_process_csv import analyze_Speed_speed
+from sowers_process_json import count_people_by_gender
+from sowers_process_text import count_word_occurrences
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Processing function timed on each kind of data
+PROCESSORS: dict = {
+    "csv": lambda file_path: analyze_Speed_speed(file_path),
+    "json": lambda file_path: count_people_by_gender(file_path, streaming=True),
+    "text": lambda file_path: count_word_occurrences(file_path, "CAPITAL LETTER"),
+}
+
+# Codec suffix and levels compared; zstd is skipped when zstandard is not installed
+CODECS: list = [(".gz", 1), (".gz", 6), (".zst", 1), (".zst", 3), (".zst", 9)]
+
+# Measure parsing, not reading cached columns
+utils_columnar.set_cache_enabled(False)
+
+#####################################
+# Define Functions
+#####################################
+
+def drop_from_page_cache(file_path: pathlib.Path) -> None:
+    """Ask the OS to evict a file from the page cache, so the next read comes from storage."""
+    with file_path.open('rb') as file:
+        os.fsync(file.fileno())
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+def time_processing(kind: str, file_path: pathlib.Path, repeat: int, cold: bool) -> float:
+    """Return the fastest of several runs of the kind's processing function on a file, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        if cold:
+            drop_from_page_cache(file_path)
+        started_at = time.perf_counter()
+        PROCESSORS[kind](file_path)
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+def compressed_copy(file_path: pathlib.Path, suffix: str, level: int) -> tuple:
+    """
+    Return a compressed copy of a file and the seconds it took to compress, reusing an existing copy.
+
+    Returns:
+        tuple: (path of the copy, compression seconds or None if the copy already existed).
+    """
+    target = file_path.parent.joinpath("compressed", f"{file_path.name}.level{level}{suffix}")
+    if target.exists():
+        return target, None
+    started_at = time.perf_counter()
+    compress_file(file_path, target, level=level)
+    return target, time.perf_counter() - started_at
+
+def benchmark_file(kind: str, file_path: pathlib.Path, repeat: int, cold: bool) -> list:
+    """Time the plain file and every compressed copy of it and return one result row per codec."""
+    plain_bytes = file_path.stat().st_size
+    plain_seconds = time_processing(kind, file_path, repeat, cold)
+    rows = [{"codec": "plain", "bytes": plain_bytes, "ratio": 1.0, "compress_s": None,
+             "process_s": plain_seconds, "extra_s": 0.0, "break_even_mb_s": None}]
+    for suffix, level in CODECS:
+        if suffix == ".zst" and zstandard is None:
+            continue
+        copy, compress_seconds = compressed_copy(file_path, suffix, level)
+        copy_bytes = copy.stat().st_size
+        seconds = time_processing(kind, copy, repeat, cold)
+        extra = seconds - plain_seconds
+        rows.append({
+            "codec": f"{suffix.lstrip('.')}-{level}",
+            "bytes": copy_bytes,
+            "ratio": plain_bytes / copy_bytes,
+            "compress_s": compress_seconds,
+            "process_s": seconds,
+            "extra_s": extra,
+            # Reading slower than this from storage makes the compressed file the faster one to process
+            "break_even_mb_s": (plain_bytes - copy_bytes) / 1024 / 1024 / extra if extra > 0 else float("inf"),
+        })
+    return rows
+
+#####################################
+# Main Execution
+#####################################
+
+def main():
+    """Run the comparison for each kind and size and print a table."""
+    parser = argparse.ArgumentParser(description="Compare processing plain and gzip/zstd compressed inputs.")
+    parser.add_argument("--kinds", nargs="+", default=list(PROCESSORS), choices=list(PROCESSORS))
+    parser.add_argument("--sizes", nargs="+", default=["10MB"], help="Data sizes such as 1MB, 100MB or 1GB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest is reported.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the generated data.")
+    parser.add_argument("--cold", action="store_true", help="Drop each file from the page cache before every run.")
+    args = parser.parse_args()
+
+    if args.cold and not hasattr(os, "posix_fadvise"):
+        parser.error("--cold needs os.posix_fadvise, which this platform does not have")
+    if zstandard is None:
+        logger.warning("zstandard is not installed, only gzip is compared (pip install zstandard)")
+
+    print(f"{'kind':<6}{'size':>7} {'codec':<8}{'MiB':>9}{'ratio':>7}{'compress s':>12}{'process s':>11}"
+          f"{'extra s':>9}  break-even MiB/s")
+    for size in args.sizes:
+        for kind in args.kinds:
+            file_path = ensure_dataset(kind, parse_size(size), args.seed)
+            logger.info(f"Benchmarking compressed {kind} input on {file_path}...")
+            for row in benchmark_file(kind, file_path, args.repeat, args.cold):
+                compress = f"{row['compress_s']:.3f}" if row["compress_s"] is not None else "-"
+                break_even = "-" if row["break_even_mb_s"] is None else f"{row['break_even_mb_s']:.1f}"
+                if row["break_even_mb_s"] == float("inf"):
+                    break_even = "always (no extra time)"
+                print(f"{kind:<6}{size:>7} {row['codec']:<8}{row['bytes'] / 1024 / 1024:>9.2f}{row['ratio']:>7.2f}"
+                      f"{compress:>12}{row['process_s']:>11.3f}{row['extra_s']:>9.3f}  {break_even}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark the full-load and read-only streaming modes of count_word_in_column().
+
+The script times each mode and records its peak Python memory with tracemalloc, then
+checks that both modes return the same count. The columnar cache is turned off so the
+streaming mode really parses the workbook. Without a workbook argument it first
+generates a synthetic sales workbook of the requested size.
+
+Execution Command: py benchmarks/bench_excel_scan.py [workbook.xlsx] [--rows 200000] [--column C] [--word "United States"]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import time
+import pathlib
+import argparse
+import tracemalloc
+
+# Making sure Python can find utils_logger.py in the root folder and the processors in the processed folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'processed')))
+
+# Import from local project modules
+from utils_logger import logger
+import utils_columnar
+from sowers_process_excel import count_word_in_column
+from generate_data import generate_sales_workbook
+
+#####################################
+# Declare Global Variables
+#####################################
+
+benchmark_folder_name = "bench_data"
+
+# Measure parsing, not reading cached columns
+utils_columnar.set_cache_enabled(False)
+
+#####################################
+# Define Functions
+#####################################
+
+def measure(function, *args, **kwargs) -> tuple:
+    """
+    Return a function's result, elapsed seconds and peak traced memory in bytes.
+
+    The function runs twice: once untraced for the timing, because tracemalloc slows
+    allocation-heavy code a lot, and once under tracemalloc for the memory peak.
+    """
+    started_at = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - started_at
+    tracemalloc.start()
+    function(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+def run_benchmark(file_path: pathlib.Path, column_letter: str, word: str) -> dict:
+    """Time both modes of count_word_in_column() on one workbook and check they agree."""
+    results = {}
+    for mode, read_only in (("full load", False), ("read-only stream", True)):
+        count, elapsed, peak = measure(count_word_in_column, file_path, column_letter, word, read_only=read_only)
+        results[mode] = {"count": count, "seconds": elapsed, "peak_bytes": peak}
+        logger.info(f"{mode}: count={count} time={elapsed:.2f}s peak memory={peak / 1024 / 1024:.1f} MiB")
+    counts = {result["count"] for result in results.values()}
+    if len(counts) != 1:
+        raise AssertionError(f"Modes disagree on the count: {results}")
+    return results
+
+#####################################
+# Main Execution
+#####################################
+
+def main():
+    """Generate a workbook if needed and compare the two scan modes."""
+    parser = argparse.ArgumentParser(description="Compare full-load and read-only Excel column scans.")
+    parser.add_argument("workbook", nargs="?", help="Workbook to scan; a synthetic one is generated if omitted.")
+    parser.add_argument("--rows", type=int, default=200_000, help="Rows in the generated workbook.")
+    parser.add_argument("--column", default="C", help="Column letter to scan.")
+    parser.add_argument("--word", default="United States", help="Word to count.")
+    args = parser.parse_args()
+
+    if args.workbook:
+        file_path = pathlib.Path(args.workbook)
+    else:
+        file_path = pathlib.Path(benchmark_folder_name, f"sales_{args.rows}.xlsx")
+        if not file_path.exists():
+            logger.info(f"Generating {args.rows:,}-row workbook at {file_path}...")
+            generate_sales_workbook(file_path, args.rows)
+
+    results = run_benchmark(file_path, args.column, args.word)
+    full, stream = results["full load"], results["read-only stream"]
+    print(f"{'mode':<18}{'count':>10}{'seconds':>10}{'peak MiB':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<18}{result['count']:>10}{result['seconds']:>10.2f}{result['peak_bytes'] / 1024 / 1024:>10.1f}")
+    print(f"speedup {full['seconds'] / max(stream['seconds'], 1e-9):.1f}x, "
+          f"memory reduction {full['peak_bytes'] / max(stream['peak_bytes'], 1):.1f}x")
+
+if __name__ == "__main__":
+    main()
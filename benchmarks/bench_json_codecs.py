@@ -0,0 +1,93 @@
+"""
+Benchmark the JSON codec backends in utils_json.py on synthetic people files.
+
+For each size the script generates a people document ({"people": [...]}) and compares
+every installed backend (orjson, ujson, json) on:
+- decoding the whole document, as count_people_by_gender() does without streaming,
+- encoding it with indent=2, as write_json_file() does,
+- encoding and decoding it as JSON Lines, one record at a time.
+
+Execution Command: py benchmarks/bench_json_codecs.py [--sizes 1000 10000 100000 1000000 10000000] [--repeat 3]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import time
+import random
+import argparse
+
+# Making sure Python can find the utils_*.py files in the root folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Import from local project modules
+from utils_logger import logger
+import utils_json
+from generate_data import make_person
+
+#####################################
+# Define Functions
+#####################################
+
+def generate_people(count: int, seed: int = 42) -> dict:
+    """Build a deterministic people document with the same fields as fetched_data/people.json."""
+    rng = random.Random(seed)
+    return {"people": [make_person(rng, count) for _ in range(count)]}
+
+def best_time(function, repeat: int) -> float:
+    """Return the fastest of several timed runs of a function, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+def benchmark_size(count: int, repeat: int) -> list:
+    """Time every installed backend on one document size and return one result row per backend."""
+    document = generate_people(count)
+    utils_json.set_backend("json")
+    document_text = utils_json.dumps(document).encode("utf-8")
+    line_texts = [utils_json.dumps(person).encode("utf-8") for person in document["people"]]
+
+    rows = []
+    for backend, installed in utils_json.AVAILABLE_BACKENDS.items():
+        if not installed:
+            continue
+        utils_json.set_backend(backend)
+        rows.append({
+            "records": count,
+            "backend": backend,
+            "decode_s": best_time(lambda: utils_json.loads(document_text), repeat),
+            "encode_indent2_s": best_time(lambda: utils_json.dumps(document, indent=2), repeat),
+            "ndjson_encode_s": best_time(lambda: [utils_json.dumps(person) for person in document["people"]], repeat),
+            "ndjson_decode_s": best_time(lambda: [utils_json.loads(line) for line in line_texts], repeat),
+            "mb": len(document_text) / 1024 / 1024,
+        })
+    utils_json.set_backend("auto")
+    return rows
+
+#####################################
+# Main Execution
+#####################################
+
+def main():
+    """Run the codec comparison for each requested size and print a table."""
+    parser = argparse.ArgumentParser(description="Compare JSON codec backends on synthetic people files.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Record counts to test; add 10000000 for the largest size (needs several GB of RAM).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the fastest is reported.")
+    args = parser.parse_args()
+
+    installed = [backend for backend, available in utils_json.AVAILABLE_BACKENDS.items() if available]
+    logger.info(f"Benchmarking JSON backends {installed} on sizes {args.sizes}...")
+    print(f"{'records':>10} {'backend':<8}{'MB':>8}{'decode':>10}{'encode(2)':>11}{'nd-enc':>10}{'nd-dec':>10}")
+    for count in args.sizes:
+        for row in benchmark_size(count, args.repeat):
+            print(f"{row['records']:>10} {row['backend']:<8}{row['mb']:>8.1f}{row['decode_s']:>10.3f}"
+                  f"{row['encode_indent2_s']:>11.3f}{row['ndjson_encode_s']:>10.3f}{row['ndjson_decode_s']:>10.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Generate deterministic synthetic data files for the benchmarks, from kilobytes to gigabytes.
+
+Every generator takes a target size and a seed, so the same arguments always produce the
+same file. The files have the same shape as the fetched originals:
+- csv:  Pokémon CSV with the pokemon_all_generations.csv header (Speed and the other stats, types, generation).
+- json: people document {"people": [...]} with the people.json fields (kind "ndjson" writes JSON Lines).
+- xlsx: AdventureWorks-style sales workbook with the country in column C.
+- text: ISO 8859-1 character table lines like geographical_characters.txt, repeated to size.
+
+CSV, JSON and text are written record by record, so memory stays small even for multi-GB files.
+XLSX size cannot be known while writing, so its row count is estimated from the target size.
+
+Execution Command: py benchmarks/generate_data.py [--kinds csv json xlsx text] [--sizes 1MB 100MB 2GB] [--seed 42]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import re
+import json
+import random
+import pathlib
+import argparse
+import unicodedata
+
+import openpyxl
+
+# Making sure Python can find utils_logger.py in the root folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Import from local project modules
+from utils_logger import logger
+
+#####################################
+# Declare Global Variables
+#####################################
+
+benchmark_folder_name = "bench_data"
+
+POKEMON_HEADER = ["#", "Name", "Type 1", "Type 2", "HP", "Attack", "Defense", "Sp. Atk", "Sp. Def",
+                  "Speed", "Generation", "Legendary"]
+POKEMON_TYPES = ["Grass", "Poison", "Fire", "Flying", "Water", "Bug", "Normal", "Electric", "Ground",
+                 "Fairy", "Fighting", "Psychic", "Rock", "Steel", "Ice", "Ghost", "Dragon", "Dark"]
+NAME_SYLLABLES = ["bul", "ba", "saur", "char", "man", "der", "squir", "tle", "pi", "ka", "chu", "ee", "vee", "mew"]
+
+FIRST_NAMES = ["Joe", "James", "Emily", "Maria", "Wei", "Aisha", "Lukas", "Sofia", "Kenji", "Ana"]
+LAST_NAMES = ["Jackson", "Smith", "Jones", "Garcia", "Chen", "Khan", "Müller", "Rossi", "Sato", "Silva"]
+
+COUNTRIES = ["United States", "Canada", "Germany", "France", "United Kingdom", "Australia"]
+
+# Rough compressed size of one generated sales row, used to turn a target size into a row count
+XLSX_BYTES_PER_ROW = 35
+
+# Generators by data kind, filled in below the functions
+GENERATORS: dict = {}
+
+# File suffix of each data kind
+SUFFIXES = {"csv": ".csv", "json": ".json", "ndjson": ".jsonl", "xlsx": ".xlsx", "text": ".txt"}
+
+#####################################
+# Define Functions
+#####################################
+
+def parse_size(size: str) -> int:
+    """
+    Turn a size like "500KB", "10MB" or "2GB" (or a plain byte count) into bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*", str(size), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Cannot parse size '{size}', expected something like 500KB, 10MB or 2GB")
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** " KMG".index(unit.upper() or " "))
+
+def pokemon_row(rng: random.Random, number: int) -> list:
+    """Build one Pokémon CSV row; about 1 in 200 rows has a blank Speed."""
+    name = "".join(rng.choice(NAME_SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+    type_1 = rng.choice(POKEMON_TYPES)
+    type_2 = rng.choice(POKEMON_TYPES + [""] * 10)
+    stats = [rng.randint(5, 255) for _ in range(6)]
+    if rng.random() < 0.005:
+        stats[5] = ""
+    legendary = "TRUE" if rng.random() < 0.08 else "FALSE"
+    return [number, name, type_1, type_2, *stats, rng.randint(1, 9), legendary]
+
+def generate_pokemon_csv(file_path: pathlib.Path, target_bytes: int, seed: int = 42) -> int:
+    """Write a Pokémon-schema CSV file of about target_bytes and return its number of rows."""
+    rng = random.Random(seed)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    rows = 0
+    written = 0
+    with file_path.open('w', encoding='utf-8', newline='') as file:
+        line = ",".join(POKEMON_HEADER) + "\n"
+        while True:
+            file.write(line)
+            written += len(line)
+            if written >= target_bytes:
+                break
+            rows += 1
+            line = ",".join(str(value) for value in pokemon_row(rng, rows)) + "\n"
+    return rows
+
+def make_person(rng: random.Random, count: int) -> dict:
+    """Build one people record with the same fields as fetched_data/people.json."""
+    return {
+        "firstName": rng.choice(FIRST_NAMES),
+        "lastName": f"{rng.choice(LAST_NAMES)}{rng.randint(0, count)}",
+        "gender": rng.choice(["male", "female"]),
+        "age": rng.randint(18, 90),
+        "number": str(rng.randint(10**9, 10**10 - 1)),
+    }
+
+def generate_people_json(file_path: pathlib.Path, target_bytes: int, seed: int = 42, ndjson: bool = False) -> int:
+    """
+    Write a people file of about target_bytes and return its number of records.
+
+    Args:
+        file_path (pathlib.Path): Output file.
+        target_bytes (int): Approximate file size.
+        seed (int): Random seed.
+        ndjson (bool): Write JSON Lines (one record per line) instead of a {"people": [...]} document.
+    """
+    rng = random.Random(seed)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # Rough record count so lastName numbers have a realistic spread
+    expected = max(1, target_bytes // 110)
+    records = 0
+    written = 0
+    with file_path.open('w', encoding='utf-8') as file:
+        if not ndjson:
+            file.write('{\n    "people": [\n')
+        while written < target_bytes or records == 0:
+            text = json.dumps(make_person(rng, expected), ensure_ascii=False)
+            if ndjson:
+                text += "\n"
+            elif records:
+                text = ",\n        " + text
+            else:
+                text = "        " + text
+            file.write(text)
+            written += len(text)
+            records += 1
+        if not ndjson:
+            file.write("\n    ]\n}\n")
+    return records
+
+def generate_sales_workbook(file_path: pathlib.Path, rows: int, seed: int = 42) -> None:
+    """Write a synthetic AdventureWorks-style sales workbook with the country in column C."""
+    rng = random.Random(seed)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Sales")
+    sheet.append(["SalesOrderLineKey", "Region", "Country", "Product", "Quantity", "Unit Price"])
+    for row_number in range(1, rows + 1):
+        sheet.append([
+            row_number,
+            rng.choice(["North America", "Europe", "Pacific"]),
+            rng.choice(COUNTRIES),
+            f"Product {rng.randint(1, 500)}",
+            rng.randint(1, 10),
+            round(rng.uniform(2, 3500), 2),
+        ])
+    workbook.save(file_path)
+
+def generate_sales_xlsx(file_path: pathlib.Path, target_bytes: int, seed: int = 42) -> int:
+    """Write a sales workbook of roughly target_bytes and return its number of rows."""
+    rows = max(1, target_bytes // XLSX_BYTES_PER_ROW)
+    generate_sales_workbook(file_path, rows, seed)
+    return rows
+
+def character_table_lines() -> list:
+    """Return the ISO 8859-1 character table as "hex  NAME" entries, like geographical_characters.txt."""
+    entries = []
+    for code in list(range(0x20, 0x7F)) + list(range(0xA0, 0x100)):
+        name = unicodedata.name(chr(code), "")
+        if name:
+            entries.append(f"{code:02X}  {name}")
+    return entries
+
+def generate_text_corpus(file_path: pathlib.Path, target_bytes: int, seed: int = 42) -> int:
+    """Write a two-column character table text file of about target_bytes and return its number of lines."""
+    rng = random.Random(seed)
+    entries = character_table_lines()
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    lines = 0
+    written = 0
+    with file_path.open('w', encoding='utf-8') as file:
+        while written < target_bytes:
+            line = f"{rng.choice(entries):<32}{rng.choice(entries)}\n"
+            file.write(line)
+            written += len(line.encode('utf-8'))
+            lines += 1
+    return lines
+
+def dataset_path(kind: str, target_bytes: int, seed: int = 42, folder: str = benchmark_folder_name) -> pathlib.Path:
+    """Return the file name used for one generated dataset."""
+    return pathlib.Path(folder, f"{kind}_{target_bytes}_{seed}{SUFFIXES[kind]}")
+
+def ensure_dataset(kind: str, target_bytes: int, seed: int = 42, folder: str = benchmark_folder_name) -> pathlib.Path:
+    """
+    Return the path of a generated dataset, generating it first if it does not exist yet.
+
+    Args:
+        kind (str): "csv", "json", "ndjson", "xlsx" or "text".
+        target_bytes (int): Approximate file size.
+        seed (int): Random seed; the same kind, size and seed always give the same file.
+        folder (str): Folder for the generated files.
+    """
+    file_path = dataset_path(kind, target_bytes, seed, folder)
+    if not file_path.exists():
+        logger.info(f"Generating {kind} data of about {target_bytes:,} bytes at {file_path}...")
+        # Write under a temporary name so an interrupted run does not leave a truncated dataset behind
+        temp_path = file_path.with_name(file_path.stem + ".part" + file_path.suffix)
+        items = GENERATORS[kind](temp_path, target_bytes, seed)
+        os.replace(temp_path, file_path)
+        logger.info(f"Generated {file_path} with {items:,} records ({file_path.stat().st_size:,} bytes)")
+    return file_path
+
+GENERATORS.update({
+    "csv": generate_pokemon_csv,
+    "json": generate_people_json,
+    "ndjson": lambda file_path, target_bytes, seed: generate_people_json(file_path, target_bytes, seed, ndjson=True),
+    "xlsx": generate_sales_xlsx,
+    "text": generate_text_corpus,
+})
+
+#####################################
+# Main Execution
+#####################################
+
+def main():
+    """Generate the requested kinds and sizes of data."""
+    parser = argparse.ArgumentParser(description="Generate deterministic benchmark data files.")
+    parser.add_argument("--kinds", nargs="+", default=["csv", "json", "xlsx", "text"], choices=sorted(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", default=["1MB"], help="Target sizes such as 100KB, 10MB or 2GB.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument("--folder", default=benchmark_folder_name, help="Output folder.")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        for kind in args.kinds:
+            print(ensure_dataset(kind, parse_size(size), args.seed, args.folder))
+
+if __name__ == "__main__":
+    main()
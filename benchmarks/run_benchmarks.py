@@ -0,0 +1,232 @@
+"""
+Benchmark the four core processing functions on generated data and compare against a stored baseline.
+
+Cases (function -> generated data, counter used for items per second):
+- analyze_Speed_speed     -> Pokémon CSV,           rows
+- count_people_by_gender  -> people JSON,           records
+- count_word_in_column    -> AdventureWorks XLSX,   cells
+- count_word_occurrences  -> character table text,  characters
+
+Each case runs in a fresh process, so its peak RSS is not inflated by earlier cases. The fastest
+of --repeat runs is reported with MB/s, items/s and the peak RSS it added over the idle process.
+Data comes from generate_data.py and is cached in bench_data/, so the same sizes and seed always
+measure the same files.
+
+With --save-baseline the results are stored in benchmarks/baseline.json; later runs print each
+case's time relative to it and mark anything slower than --tolerance as a REGRESSION.
+Baselines are only comparable on the same machine.
+
+The columnar cache (utils_columnar.py) is off by default so the cases measure parsing;
+--columnar-cache turns it on to measure warm-cache runs instead (the first repeat fills the cache).
+
+Execution Command: py benchmarks/run_benchmarks.py [--sizes 1MB 10MB 100MB] [--cases count_word_occurrences] [--save-baseline] [--fail-on-regression]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import json
+import time
+import pathlib
+import argparse
+import platform
+import multiprocessing
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+# Making sure Python can find utils_*.py in the root folder and the processors in the processed folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'processed')))
+
+# Import from local project modules
+from utils_logger import logger
+from utils_metrics import collect_metrics, peak_rss_bytes
+from utils_columnar import set_cache_enabled
+from generate_data import ensure_dataset, parse_size
+from sowers_process_csv import analyze_Speed_speed
+from sowers_process_json import count_people_by_gender
+from sowers_process_excel import count_word_in_column
+from sowers_process_text import count_word_occurrences
+
+#####################################
+# Declare Global Variables
+#####################################
+
+default_baseline_file = pathlib.Path(os.path.dirname(__file__), "baseline.json")
+
+# Benchmark cases: data kind to generate, function call, and the metrics counter that counts items
+BENCHMARK_CASES: dict = {
+    "analyze_Speed_speed": {
+        "kind": "csv",
+        "run": lambda file_path: analyze_Speed_speed(file_path),
+        "items": "rows",
+    },
+    "count_people_by_gender": {
+        "kind": "json",
+        "run": lambda file_path: count_people_by_gender(file_path),
+        "items": "records",
+    },
+    "count_word_in_column": {
+        "kind": "xlsx",
+        "run": lambda file_path: count_word_in_column(file_path, "C", "United States"),
+        "items": "cells",
+    },
+    "count_word_occurrences": {
+        "kind": "text",
+        "run": lambda file_path: count_word_occurrences(file_path, "CAPITAL LETTER"),
+        "items": "characters",
+    },
+}
+
+#####################################
+# Define Functions
+#####################################
+
+def run_case(case: str, file_path: pathlib.Path, repeat: int, columnar_cache: bool = False) -> dict:
+    """
+    Worker: time one case on one file, in the fresh process this runs in.
+
+    Returns:
+        dict: Fastest seconds, item count, peak RSS and the RSS added over the idle process.
+    """
+    spec = BENCHMARK_CASES[case]
+    set_cache_enabled(columnar_cache)
+    idle_peak = peak_rss_bytes()
+    timings = []
+    for _ in range(repeat):
+        with collect_metrics(case) as stage:
+            started_at = time.perf_counter()
+            result = spec["run"](file_path)
+            timings.append(time.perf_counter() - started_at)
+    peak = peak_rss_bytes()
+    return {
+        "seconds": min(timings),
+        "items": stage.counters.get(spec["items"], 0),
+        "peak_rss_bytes": peak,
+        "peak_rss_increase_bytes": peak - idle_peak if peak is not None else None,
+        # The processors log errors and return an empty result instead of raising
+        "ok": bool(result),
+    }
+
+def run_benchmarks(cases: list, sizes: list, repeat: int, seed: int, columnar_cache: bool = False) -> dict:
+    """
+    Run every case at every size, each in its own process.
+
+    Returns:
+        dict: Maps "case@size" to the case result plus the size, file and throughput figures.
+    """
+    results = {}
+    spawn = multiprocessing.get_context("spawn")
+    for size in sizes:
+        for case in cases:
+            file_path = ensure_dataset(BENCHMARK_CASES[case]["kind"], parse_size(size), seed)
+            file_bytes = file_path.stat().st_size
+            logger.info(f"Benchmarking {case} on {file_path} ({file_bytes:,} bytes)...")
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                result = executor.submit(run_case, case, file_path, repeat, columnar_cache).result()
+            seconds = max(result["seconds"], 1e-9)
+            result.update({
+                "case": case,
+                "size": size,
+                "file": str(file_path),
+                "bytes": file_bytes,
+                "mb_per_second": file_bytes / 1024 / 1024 / seconds,
+                "items_per_second": result["items"] / seconds,
+            })
+            results[f"{case}@{size}"] = result
+    return results
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    Compare each result's time with the baseline.
+
+    Returns:
+        dict: Maps "case@size" to (time ratio to the baseline, True if slower than 1 + tolerance),
+            for the results that have a baseline entry.
+    """
+    comparison = {}
+    for key, result in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous or not previous.get("seconds"):
+            continue
+        ratio = result["seconds"] / previous["seconds"]
+        comparison[key] = (ratio, ratio > 1 + tolerance)
+    return comparison
+
+def machine_info() -> dict:
+    """Describe the machine the benchmarks ran on, stored with the baseline."""
+    return {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+#####################################
+# Main Execution
+#####################################
+
+def main():
+    """Run the benchmark cases, print a table and compare with or save the baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the core processing functions on generated data.")
+    parser.add_argument("--sizes", nargs="+", default=["1MB", "10MB"], help="Data sizes such as 100KB, 10MB or 2GB.")
+    parser.add_argument("--cases", nargs="+", default=list(BENCHMARK_CASES), choices=list(BENCHMARK_CASES))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is reported.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed of the generated data.")
+    parser.add_argument("--baseline", default=default_baseline_file, help="Baseline results file.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed slowdown before a REGRESSION, 0.10 = 10%%.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 if any case regressed.")
+    parser.add_argument("--output", help="Also write the results to this JSON file.")
+    parser.add_argument("--columnar-cache", action="store_true", help="Measure with the columnar cache on.")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.cases, args.sizes, args.repeat, args.seed, args.columnar_cache)
+    baseline_file = pathlib.Path(args.baseline)
+    baseline = {}
+    if baseline_file.exists():
+        with baseline_file.open('r', encoding='utf-8') as file:
+            baseline = json.load(file)
+    comparison = compare_to_baseline(results, baseline, args.tolerance)
+
+    print(f"{'case':<24}{'size':>7}{'seconds':>10}{'MB/s':>9}{'items/s':>14}{'peak MiB':>10}{'+MiB':>8}  vs baseline")
+    for key, result in results.items():
+        added = result["peak_rss_increase_bytes"]
+        peak = result["peak_rss_bytes"]
+        versus = "-"
+        if key in comparison:
+            ratio, regressed = comparison[key]
+            versus = f"{ratio:.2f}x" + (" REGRESSION" if regressed else "")
+        if not result["ok"]:
+            versus += " (empty result, see the log)"
+        print(f"{result['case']:<24}{result['size']:>7}{result['seconds']:>10.3f}{result['mb_per_second']:>9.1f}"
+              f"{result['items_per_second']:>14,.0f}"
+              f"{peak / 1024 / 1024 if peak is not None else float('nan'):>10.1f}"
+              f"{added / 1024 / 1024 if added is not None else float('nan'):>8.1f}  {versus}")
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "machine": machine_info(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "columnar_cache": args.columnar_cache,
+        "results": results,
+    }
+    if args.output:
+        pathlib.Path(args.output).write_text(json.dumps(report, indent=4), encoding='utf-8')
+    if args.save_baseline:
+        # Keep baseline entries of cases and sizes that were not run this time
+        report["results"] = {**baseline.get("results", {}), **results}
+        baseline_file.write_text(json.dumps(report, indent=4), encoding='utf-8')
+        logger.info(f"Saved benchmark baseline to {baseline_file}")
+
+    regressions = [key for key, (_, regressed) in comparison.items() if regressed]
+    if regressions:
+        logger.warning(f"Slower than the baseline by more than {args.tolerance:.0%}: {regressions}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
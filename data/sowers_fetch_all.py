@@ -0,0 +1,224 @@
+"""
+This script fetches every data source listed in a manifest file concurrently and saves them in the fetched_data folder by:
+
+Reading a JSON manifest of jobs, where each job has a "kind" (csv, excel, json or text), a "url" and a "filename".
+Running the matching fetch_*_file() function for each job on a bounded thread pool.
+Limiting how many downloads hit the same host at once so no single server gets flooded:
+jobs wait in a queue per host and are only handed to the pool while their host is below
+its limit, so a busy host never ties up workers that could be downloading from another one.
+Logging how long each job took and a summary of the whole run.
+
+Because the downloads overlap, the total wall time is close to the slowest single download
+instead of the sum of all of them.
+
+Execution Command: py data/sowers_fetch_all.py [manifest.json] [--workers 8] [--per-host 4] [--stream]
+
+"""
+#####################################
+# Import Modules at the Top
+#####################################
+import sys
+import os
+import json
+import time
+import pathlib
+import argparse
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urlsplit
+
+# Making sure Python can find utils_logger.py in the root folder and the fetchers in this folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+
+# Import from local project modules
+from utils_logger import logger
+from utils_http import HTTP_SETTINGS, configure_http
+from utils_fetch import file_changed
+from sowers_get_csv import fetch_csv_file
+from sowers_get_excel import fetch_excel_file
+from sowers_get_json import fetch_json_file
+from sowers_get_text import fetch_txt_file
+
+#####################################
+# Declare Global Variables
+#####################################
+
+fetched_folder_name = "fetched_data"
+default_manifest_path = pathlib.Path(os.path.dirname(__file__), "fetch_manifest.json")
+
+# Map each manifest "kind" to the fetcher that handles it
+FETCHERS = {
+    "csv": fetch_csv_file,
+    "excel": fetch_excel_file,
+    "json": fetch_json_file,
+    "text": fetch_txt_file,
+}
+
+#####################################
+# Define Functions
+#####################################
+
+def load_manifest(manifest_path: pathlib.Path) -> list:
+    """
+    Read a fetch manifest and check that every job is usable.
+
+    Args:
+        manifest_path (pathlib.Path): Path to a JSON file holding a list of {"kind", "url", "filename"} jobs.
+
+    Returns:
+        list: The jobs from the manifest.
+
+    Raises:
+        ValueError: If a job is missing a field, uses an unknown kind, or writes the same file as an earlier job.
+    """
+    with pathlib.Path(manifest_path).open('r', encoding='utf-8') as file:
+        jobs = json.load(file)
+    filenames = {}
+    for index, job in enumerate(jobs):
+        missing = {"kind", "url", "filename"} - job.keys()
+        if missing:
+            raise ValueError(f"Manifest job {index} is missing {sorted(missing)}")
+        if job["kind"] not in FETCHERS:
+            raise ValueError(f"Manifest job {index} has unknown kind '{job['kind']}', expected one of {sorted(FETCHERS)}")
+        # Two concurrent jobs writing one file would overwrite each other's download
+        filename = os.path.normcase(os.path.normpath(job["filename"]))
+        if filename in filenames:
+            raise ValueError(f"Manifest jobs {filenames[filename]} and {index} both write '{job['filename']}'")
+        filenames[filename] = index
+    return jobs
+
+def run_job(job: dict, folder_name: str, stream: bool, queued_at: float) -> dict:
+    """
+    Fetch one manifest job.
+
+    Args:
+        job (dict): A manifest job with "kind", "url" and "filename".
+        folder_name (str): Name of the folder to save the file.
+        stream (bool): Passed through to the fetcher to stream the download to disk.
+        queued_at (float): time.perf_counter() when the job was queued, to report how long it waited.
+
+    Returns:
+        dict: The job plus "ok" (bool), "changed" (bool, whether the file content changed since the last fetch),
+            "seconds" (time spent downloading) and "waited" (time spent queued for the host or a worker).
+    """
+    started_at = time.perf_counter()
+    ok = FETCHERS[job["kind"]](folder_name, job["filename"], job["url"], stream=stream)
+    finished_at = time.perf_counter()
+    return {
+        **job,
+        "ok": bool(ok),
+        "changed": bool(ok) and file_changed(pathlib.Path(folder_name, job["filename"])),
+        "seconds": finished_at - started_at,
+        "waited": started_at - queued_at,
+    }
+
+def fetch_all(jobs: list, folder_name: str = fetched_folder_name, max_workers: int = 8,
+              per_host_limit: int = 4, stream: bool = False) -> list:
+    """
+    Run all fetch jobs concurrently and report per-job timing.
+
+    Args:
+        jobs (list): Manifest jobs, see load_manifest().
+        folder_name (str): Name of the folder to save the files.
+        max_workers (int): Maximum number of downloads running at once.
+        per_host_limit (int): Maximum number of downloads running at once against any one host.
+        stream (bool): Stream each download to disk instead of holding it in memory.
+
+    Returns:
+        list: One result dict per job, in completion order (see run_job()).
+
+    Raises:
+        ValueError: If max_workers or per_host_limit is less than 1.
+
+    Example:
+        fetch_all(load_manifest("data/fetch_manifest.json"), max_workers=16)
+    """
+    if max_workers < 1 or per_host_limit < 1:
+        raise ValueError(f"max_workers and per_host_limit must be at least 1, got {max_workers} and {per_host_limit}")
+    # Keep at least one pooled connection per concurrent download from the same host
+    if HTTP_SETTINGS["pool_maxsize"] < per_host_limit:
+        configure_http(pool_maxsize=per_host_limit)
+
+    # One queue of waiting jobs per host, in manifest order
+    queues = defaultdict(deque)
+    for job in jobs:
+        queues[urlsplit(job["url"]).netloc].append(job)
+    running_per_host = defaultdict(int)
+
+    results = []
+    run_started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch") as executor:
+        running = {}
+        while queues or running:
+            # Hand out jobs round-robin over the hosts, only while the host and the pool have room
+            submitted = True
+            while submitted and len(running) < max_workers:
+                submitted = False
+                for host in list(queues):
+                    if len(running) >= max_workers:
+                        break
+                    if running_per_host[host] >= per_host_limit:
+                        continue
+                    job = queues[host].popleft()
+                    if not queues[host]:
+                        del queues[host]
+                    running[executor.submit(run_job, job, folder_name, stream, run_started_at)] = (host, job)
+                    running_per_host[host] += 1
+                    submitted = True
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                host, job = running.pop(future)
+                running_per_host[host] -= 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Unexpected error fetching {job['url']}: {e}")
+                    result = {**job, "ok": False, "changed": False, "seconds": 0.0, "waited": 0.0}
+                if not result["ok"]:
+                    status = "FAILED"
+                else:
+                    status = "CHANGED" if result["changed"] else "UNCHANGED"
+                logger.info(f"{status}: {job['filename']} in {result['seconds']:.2f}s (queued {result['waited']:.2f}s)")
+                results.append(result)
+    wall_time = time.perf_counter() - run_started_at
+
+    succeeded = sum(1 for result in results if result["ok"])
+    changed = sum(1 for result in results if result["changed"])
+    slowest = max((result["seconds"] for result in results), default=0.0)
+    total = sum(result["seconds"] for result in results)
+    logger.info(
+        f"Fetched {succeeded}/{len(results)} files ({changed} changed) in {wall_time:.2f}s wall time "
+        f"(slowest job {slowest:.2f}s, sum of all jobs {total:.2f}s)"
+    )
+    return results
+
+#####################################
+# Define main() function
+#####################################
+
+def main():
+    """
+    Main function to fetch every source in the manifest concurrently.
+    """
+    parser = argparse.ArgumentParser(description="Fetch every source in a manifest concurrently.")
+    parser.add_argument("manifest", nargs="?", default=default_manifest_path, help="Path to the JSON fetch manifest.")
+    parser.add_argument("--folder", default=fetched_folder_name, help="Folder to save the fetched files in.")
+    parser.add_argument("--workers", type=int, default=8, help="Maximum concurrent downloads.")
+    parser.add_argument("--per-host", type=int, default=4, help="Maximum concurrent downloads per host.")
+    parser.add_argument("--stream", action="store_true", help="Stream downloads to disk in chunks.")
+    args = parser.parse_args()
+
+    logger.info(f"Starting concurrent fetch from manifest {args.manifest}...")
+    jobs = load_manifest(args.manifest)
+    results = fetch_all(jobs, args.folder, args.workers, args.per_host, args.stream)
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+#####################################
+# Conditional Execution
+#####################################
+
+if __name__ == '__main__':
+    main()
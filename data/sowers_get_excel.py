@@ -21,6 +21,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import write_stream_to_file, conditional_headers, record_fetch, record_not_modified, DEFAULT_CHUNK_SIZE
+from utils_http import http_get
+from utils_metrics import instrument, count_metric
 
 #####################################
 # Declare Global Variables
@@ -32,7 +35,8 @@ fetched_folder_name = "fetched_data"
 # Define Functions
 #####################################
 
-def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
+@instrument
+def fetch_excel_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = True) -> bool:
     """
     Fetch Excel data from the given URL and write it to a file.
 
@@ -40,29 +44,52 @@ def fetch_excel_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the Excel file to fetch.
+        stream (bool): If True, download in chunks straight to disk instead of holding the whole body in memory.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, send a conditional request and keep the existing file when the server replies 304 Not Modified.
 
     Returns:
-        None
+        bool: True if the file was fetched and saved, False otherwise.
 
     Example:
         fetch_excel_file("data", "data.xlsx", "https://example.com/data.xlsx")
     """
     if not url:
         logger.error("The URL provided is empty or was not found. Please provide a valid URL.")
-        return
+        return False
 
+    file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Fetching Excel data from {url} is in progress...")
-        response = requests.get(url)
+        headers = conditional_headers(file_path, url) if use_cache else {}
+        response = http_get(url, stream=stream, headers=headers)
+        if response.status_code == 304:
+            response.close()
+            record_not_modified(file_path)
+            count_metric("not_modified")
+            logger.info(f"{filename} has not changed upstream, keeping the existing copy")
+            return True
         response.raise_for_status()
-        write_excel_file(folder_name, filename, response.content)
+        digest = None
+        if stream:
+            _, digest = write_stream_to_file(response, file_path, chunk_size)
+        elif not write_excel_file(folder_name, filename, response.content):
+            return False
+        record_fetch(file_path, url, response, digest)
+        count_metric("bytes", file_path.stat().st_size)
         logger.info(f"SUCCESS: Excel file fetched and saved as {filename}")
+        return True
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
+        return False
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+        return False
+    except IOError as io_err:
+        logger.error(f"Error writing fetched data to {filename}: {io_err}")
+        return False
 
-def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> None:
+def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> bool:
     """
     Write Excel binary data to a file.
 
@@ -71,7 +98,7 @@ def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> Non
         binary_data (bytes): Binary content of the Excel file.
 
     Returns:
-        None
+        bool: True if the data was written, False otherwise.
     """
     file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
@@ -80,8 +107,10 @@ def write_excel_file(folder_name: str, filename: str, binary_data: bytes) -> Non
         with file_path.open('wb') as file:
             file.write(binary_data)
         logger.info(f"The Excel data was written to {file_path}")
+        return True
     except IOError as io_err:
         logger.error(f"There was an error writing Excel data to {file_path}: {io_err}")
+        return False
 
 #####################################
 # Define main() function
@@ -1,10 +1,13 @@
 """
 This script fetches JSON data from a web URL and saves it as people.json in a folder called fetched_data by: 
 
-Importing needed modules (requests, json, pathlib, etc.).
+Importing needed modules (requests, pathlib, the JSON codec in utils_json.py, etc.).
 Defining a function fetch_json_file() to download the JSON file and save it locally.
 Handling errors (e.g., HTTP request failures).
+Optionally saving the records as JSON Lines (NDJSON), one compact record per line, which is
+smaller than indented JSON and can be split on newlines for parallel processing.
 Logging each step to track progress.
+Compressing the saved file with gzip or zstd when the file name ends in .gz or .zst (utils_compression.py).
 Executing main function when the script runs.
 
 """
@@ -13,7 +16,6 @@ Executing main function when the script runs.
 #####################################
 import sys
 import os
-import json
 import pathlib
 import requests
 
@@ -22,6 +24,11 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import write_stream_to_file, conditional_headers, record_fetch, record_not_modified, DEFAULT_CHUNK_SIZE
+from utils_http import http_get
+from utils_metrics import instrument, count_metric
+import utils_json
+from utils_compression import open_file
 
 #####################################
 # Declare Global Variables
@@ -33,7 +40,9 @@ fetched_folder_name = "fetched_data"
 # Define Functions
 #####################################
 
-def fetch_json_file(folder_name: str, filename: str, url: str) -> None:
+@instrument
+def fetch_json_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = True,
+                    output_format: str = "json", records_key: str = "people") -> bool:
     """
     Fetch JSON data from the given URL and write it to a file.
 
@@ -41,29 +50,69 @@ def fetch_json_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the JSON file to fetch.
+        stream (bool): If True, download in chunks straight to disk instead of holding the whole body in memory.
+            The JSON is saved exactly as served instead of being re-indented.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, send a conditional request and keep the existing file when the server replies 304 Not Modified.
+        output_format (str): "json" to save the document, or "ndjson" to save one record per line (see write_json_lines_file()).
+            Converting to NDJSON needs the parsed document, so it cannot be combined with stream=True.
+        records_key (str): Key of the record list inside the document when saving NDJSON.
 
     Returns:
-        None
+        bool: True if the file was fetched and saved, False otherwise.
 
     Example:
         fetch_json_file("data", "data.json", "https://example.com/data.json")
+        fetch_json_file("data", "people.jsonl", "https://example.com/people.json", output_format="ndjson")
     """
     if not url:
         logger.error("The URL provided is empty or was not found. Please provide a valid URL.")
-        return
+        return False
+    if output_format not in ("json", "ndjson"):
+        logger.error(f"Unknown JSON output format '{output_format}', expected 'json' or 'ndjson'.")
+        return False
+    if output_format == "ndjson" and stream:
+        logger.error("NDJSON output re-serializes the records and cannot be streamed; use stream=False.")
+        return False
 
+    file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Fetching JSON data from {url} in progress...")
-        response = requests.get(url)
+        headers = conditional_headers(file_path, url) if use_cache else {}
+        response = http_get(url, stream=stream, headers=headers)
+        if response.status_code == 304:
+            response.close()
+            record_not_modified(file_path)
+            count_metric("not_modified")
+            logger.info(f"{filename} has not changed upstream, keeping the existing copy")
+            return True
         response.raise_for_status()
-        write_json_file(folder_name, filename, response.json())
+        digest = None
+        if stream:
+            _, digest = write_stream_to_file(response, file_path, chunk_size)
+        elif output_format == "ndjson":
+            if not write_json_lines_file(folder_name, filename, utils_json.loads(response.content), records_key):
+                return False
+        elif not write_json_file(folder_name, filename, utils_json.loads(response.content)):
+            return False
+        record_fetch(file_path, url, response, digest)
+        count_metric("bytes", file_path.stat().st_size)
         logger.info(f"A JSON file was fetched and saved as {filename}")
+        return True
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
+        return False
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+        return False
+    except ValueError as json_err:
+        logger.error(f"The response from {url} is not valid JSON: {json_err}")
+        return False
+    except IOError as io_err:
+        logger.error(f"Error writing fetched data to {filename}: {io_err}")
+        return False
 
-def write_json_file(folder_name: str, filename: str, json_data: dict) -> None:
+def write_json_file(folder_name: str, filename: str, json_data: dict) -> bool:
     """
     Write JSON data to a file.
 
@@ -73,17 +122,58 @@ def write_json_file(folder_name: str, filename: str, json_data: dict) -> None:
         json_data (dict): JSON data to write to the file.
 
     Returns:
-        None
+        bool: True if the data was written, False otherwise.
     """
     file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Writing JSON data to {file_path}...")
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open('w') as file:
-            json.dump(json_data, file, indent=4)
+        # Encode before opening, so a value that cannot be encoded does not truncate the old file.
+        # indent=2 is the indent orjson supports, see utils_json.py
+        text = utils_json.dumps(json_data, indent=2)
+        with open_file(file_path, 'w', encoding='utf-8') as file:
+            file.write(text)
         logger.info(f"JSON data was written to {file_path}")
+        return True
     except IOError as io_err:
         logger.error(f"There was an error writing JSON data to {file_path}: {io_err}")
+        return False
+    except TypeError as type_err:
+        logger.error(f"The JSON data for {file_path} cannot be encoded: {type_err}")
+        return False
+
+def write_json_lines_file(folder_name: str, filename: str, json_data, records_key: str = "people") -> bool:
+    """
+    Write JSON records as JSON Lines (NDJSON): one compact JSON object per line.
+
+    Args:
+        folder_name (str): Name of the folder to save the file.
+        filename (str): Name of the output file, usually ending in .jsonl.
+        json_data (dict or list): Either a list of records, or a document holding the list under records_key.
+        records_key (str): Key of the record list when json_data is a dict.
+
+    Returns:
+        bool: True if the data was written, False otherwise, including when there is no list of
+            records (a document without records_key, or with something else under it).
+    """
+    file_path = pathlib.Path(folder_name).joinpath(filename)
+    records = json_data.get(records_key) if isinstance(json_data, dict) else json_data
+    if not isinstance(records, list):
+        where = f"under the key '{records_key}'" if isinstance(json_data, dict) else "at the top level"
+        logger.error(f"The JSON data for {file_path} has no list of records {where}; nothing was written")
+        return False
+    try:
+        logger.info(f"Writing {len(records)} JSON Lines records to {file_path}...")
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open_file(file_path, 'w', encoding='utf-8') as file:
+            for record in records:
+                file.write(utils_json.dumps(record))
+                file.write("\n")
+        logger.info(f"JSON Lines data was written to {file_path}")
+        return True
+    except IOError as io_err:
+        logger.error(f"There was an error writing JSON Lines data to {file_path}: {io_err}")
+        return False
 
 #####################################
 # Define main() function
@@ -3,10 +3,11 @@ This script fetches a text file containing the ISO 8859-1 character set from a w
 and saves it as `geographical_characters.txt` in the fetched_data folder by:
 
 Defining a URL pointing to the text file containing character descriptions.
-Fetching the text file using requests.get(), ensuring the URL is valid.
+Fetching the text file through the shared pooled HTTP session in utils_http.py, ensuring the URL is valid.
 Handling errors in case of network issues or invalid responses.
 Writing the downloaded text to a local file inside the fetched_data directory.
 Logging progress and errors using utils_logger.py for debugging.
+Compressing the saved file with gzip or zstd when the file name ends in .gz or .zst (utils_compression.py).
 
 """
 
@@ -23,6 +24,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
 from utils_logger import logger
+from utils_fetch import write_stream_to_file, conditional_headers, record_fetch, record_not_modified, DEFAULT_CHUNK_SIZE
+from utils_http import http_get
+from utils_metrics import instrument, count_metric
+from utils_compression import open_file
 
 #####################################
 # Declare Global Variables
@@ -34,7 +39,8 @@ fetched_folder_name = "fetched_data"
 # Define Functions
 #####################################
 
-def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
+@instrument
+def fetch_txt_file(folder_name: str, filename: str, url: str, stream: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, use_cache: bool = True) -> bool:
     """
     Fetch text data from the given URL and write it to a file.
 
@@ -42,49 +48,79 @@ def fetch_txt_file(folder_name: str, filename: str, url: str) -> None:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
         url (str): URL of the text file to fetch.
+        stream (bool): If True, download in chunks straight to disk instead of holding the whole body in memory.
+        chunk_size (int): Number of bytes per chunk when streaming.
+        use_cache (bool): If True, send a conditional request and keep the existing file when the server replies 304 Not Modified.
 
     Returns:
-        None
+        bool: True if the file was fetched and saved, False otherwise.
 
     Example:
         fetch_txt_file("data", "geographical_characters.txt", "https://www.w3.org/TR/2003/REC-PNG-20031110/iso_8859-1.txt")
     """
     if not url:
         logger.error("The URL provided is empty or was not found. Please provide a valid URL.")
-        return
+        return False
 
+    file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Fetching text data from {url}...")
-        response = requests.get(url)
+        headers = conditional_headers(file_path, url) if use_cache else {}
+        response = http_get(url, stream=stream, headers=headers)
+        if response.status_code == 304:
+            response.close()
+            record_not_modified(file_path)
+            count_metric("not_modified")
+            logger.info(f"{filename} has not changed upstream, keeping the existing copy")
+            return True
         response.raise_for_status()
-        write_txt_file(folder_name, filename, response.text)
+        digest = None
+        if stream:
+            _, digest = write_stream_to_file(response, file_path, chunk_size)
+        elif not write_txt_file(folder_name, filename, response.content):
+            return False
+        record_fetch(file_path, url, response, digest)
+        count_metric("bytes", file_path.stat().st_size)
         logger.info(f"The text file was fetched and saved as {filename}")
+        return True
     except requests.exceptions.HTTPError as http_err:
         logger.error(f"HTTP error occurred: {http_err}")
+        return False
     except requests.exceptions.RequestException as req_err:
         logger.error(f"Request error occurred: {req_err}")
+        return False
+    except IOError as io_err:
+        logger.error(f"Error writing fetched data to {filename}: {io_err}")
+        return False
 
-def write_txt_file(folder_name: str, filename: str, string_data: str) -> None:
+def write_txt_file(folder_name: str, filename: str, binary_data: bytes) -> bool:
     """
     Write text data to a file.
 
+    The bytes are written as served, the same as a streamed download, so the file keeps the
+    server's encoding whatever the local one is; readers decode it with an explicit encoding.
+
     Args:
         folder_name (str): Name of the folder to save the file.
         filename (str): Name of the output file.
-        string_data (str): Text content to write to the file.
+        binary_data (bytes): Text content exactly as downloaded (str is written as UTF-8).
 
     Returns:
-        None
+        bool: True if the data was written, False otherwise.
     """
     file_path = pathlib.Path(folder_name).joinpath(filename)
     try:
         logger.info(f"Writing data to {file_path}...")
         file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open('w') as file:
-            file.write(string_data)
+        if isinstance(binary_data, str):
+            binary_data = binary_data.encode('utf-8')
+        with open_file(file_path, 'wb') as file:
+            file.write(binary_data)
         logger.info(f"The data was written to {file_path}")
+        return True
     except IOError as io_err:
         logger.error(f"There was an error writing to file {file_path}: {io_err}")
+        return False
 
 #####################################
 # Define main() function
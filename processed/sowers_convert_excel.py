@@ -0,0 +1,211 @@
+"""
+Convert every sheet of an Excel workbook into its own CSV file, one sheet per worker process.
+
+sowers_process_excel.py only ever reads one sheet through openpyxl, which parses the sheet's
+XML again on every run. This script streams each sheet once, in read-only mode, and writes
+it out so the fast CSV and columnar analytics can run over any sheet:
+- csv (default): fetched_data/<workbook name>/<sheet name>.csv with the sheet's first row
+  as the header, ready for analyze_columns() and analyze_grouped() in sowers_process_csv.py.
+- columnar: the sheets go into the columnar cache (utils_columnar.py) that the cached counts
+  in sowers_process_excel.py read when the cache is turned on (COLUMNAR_CACHE=1), so later
+  counts on any sheet skip openpyxl entirely. Each sheet is streamed into compact column
+  chunks, so a worker never holds the sheet's rows as Python objects.
+
+Sheets are converted in parallel on a process pool, one sheet per task, and each CSV file is
+written under a temporary name and renamed when complete.
+
+Execution Command: py processed/sowers_convert_excel.py [workbook.xlsx] [--sheets Sales Customer] [--format csv|columnar] [--workers 4]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import re
+import csv
+import pathlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import openpyxl
+
+# Making sure Python can find utils_logger.py in the root folder since the process_scripts are in their own folder
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Import from local project modules
+from utils_logger import logger
+from utils_parallel import default_worker_count
+from utils_metrics import instrument, count_metric
+import utils_columnar
+from sowers_process_excel import load_sheet_table, cached_workbook_sheets
+
+#####################################
+# Declare Global Variables
+#####################################
+
+fetched_folder_name = "fetched_data"
+
+default_workbook_file = pathlib.Path(fetched_folder_name, "adventure_works_sales.xlsx")
+
+OUTPUT_FORMATS = ("csv", "columnar")
+
+#####################################
+# Define Functions
+#####################################
+
+def list_sheets(file_path: pathlib.Path) -> list:
+    """Return the sheet names of a workbook in order."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+def sheet_file_name(sheet_name: str) -> str:
+    """Return the CSV file name for a sheet, replacing characters that are not allowed in file names."""
+    return (re.sub(r'[\\/:*?"<>|]', "_", sheet_name).strip() or "sheet") + ".csv"
+
+def sheet_file_names(sheet_names: list) -> dict:
+    """
+    Return a distinct CSV file name for each sheet.
+
+    Different sheet names can give the same file name ("A|B" and "A_B" both give "A_B.csv"),
+    so later sheets with a name already taken get a numeric suffix ("A_B_2.csv"). Names are
+    compared case-insensitively, as on Windows and macOS file systems.
+
+    Returns:
+        dict: Maps each sheet name to its file name.
+    """
+    taken = set()
+    file_names = {}
+    for sheet_name in sheet_names:
+        file_name = sheet_file_name(sheet_name)
+        stem = file_name[:-len(".csv")]
+        suffix = 1
+        while file_name.casefold() in taken:
+            suffix += 1
+            file_name = f"{stem}_{suffix}.csv"
+        taken.add(file_name.casefold())
+        file_names[sheet_name] = file_name
+    return file_names
+
+def convert_sheet_to_csv(file_path: pathlib.Path, sheet_name: str, output_file: pathlib.Path) -> int:
+    """
+    Stream one sheet into a CSV file, row by row.
+
+    Empty cells become empty fields; numbers and dates are written as Python prints them.
+    The file is always UTF-8, which holds any text a cell can have and is the encoding
+    sowers_process_csv.py reads CSV files with by default.
+
+    Returns:
+        int: Number of rows written, including the header row.
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = output_file.with_name(f"{output_file.name}.part{os.getpid()}")
+    rows = 0
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        with temp_file.open('w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            for row in workbook[sheet_name].iter_rows(values_only=True):
+                writer.writerow(row)
+                rows += 1
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    finally:
+        workbook.close()
+    os.replace(temp_file, output_file)
+    return rows
+
+def convert_sheet(file_path: pathlib.Path, sheet_name: str, output_file: pathlib.Path, output_format: str) -> tuple:
+    """
+    Worker task: convert one sheet to output_file, or to the columnar cache (output_file is then unused).
+
+    Returns:
+        tuple: (sheet name, CSV file or cache folder, number of rows).
+    """
+    if output_format == "columnar":
+        table = load_sheet_table(file_path, sheet_name)
+        return sheet_name, table.folder, table.rows
+    return sheet_name, output_file, convert_sheet_to_csv(file_path, sheet_name, output_file)
+
+@instrument
+def convert_workbook(file_path: pathlib.Path = default_workbook_file, output_folder: pathlib.Path = None,
+                     sheets: list = None, output_format: str = "csv", workers: int = None) -> dict:
+    """
+    Convert the sheets of a workbook in parallel, one sheet per worker process.
+
+    Args:
+        file_path (pathlib.Path): The .xlsx workbook.
+        output_folder (pathlib.Path): Folder for the CSV files, defaults to fetched_data/<workbook name>/.
+        sheets (list): Sheet names to convert, defaults to every sheet.
+        output_format (str): "csv" or "columnar", see the module docstring.
+        workers (int): Number of worker processes, defaults to the CPU count (never more than the sheets).
+
+    Returns:
+        dict: Maps each converted sheet name to its CSV file (or cache folder); sheets that failed are left out.
+
+    Example:
+        files = convert_workbook(pathlib.Path("fetched_data/adventure_works_sales.xlsx"))
+        analyze_columns(files["Sales"], ["Unit Price"])
+    """
+    file_path = pathlib.Path(file_path)
+    output_folder = pathlib.Path(output_folder or pathlib.Path(fetched_folder_name, file_path.stem))
+    if output_format not in OUTPUT_FORMATS:
+        logger.error(f"Unknown output format '{output_format}', choose from {OUTPUT_FORMATS}")
+        return {}
+    if output_format == "columnar" and utils_columnar.np is None:
+        logger.error("Converting to the columnar cache needs NumPy, which is not installed")
+        return {}
+    try:
+        if output_format == "columnar":
+            # Also caches the sheet list, so later cached counts do not open the workbook at all
+            available, _ = cached_workbook_sheets(file_path)
+        else:
+            available = list_sheets(file_path)
+    except Exception as e:
+        logger.error(f"There was an error reading the sheets of {file_path}: {e}")
+        return {}
+    missing = [sheet for sheet in sheets or [] if sheet not in available]
+    if missing:
+        logger.warning(f"Sheets {missing} are not in {file_path}, available sheets: {available}")
+    sheets = [sheet for sheet in sheets or available if sheet in available]
+
+    file_names = sheet_file_names(sheets)
+    converted = {}
+    workers = max(1, min(len(sheets), workers or default_worker_count()))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(convert_sheet, file_path, sheet, output_folder.joinpath(file_names[sheet]), output_format): sheet
+            for sheet in sheets
+        }
+        for future in as_completed(futures):
+            try:
+                sheet_name, output, rows = future.result()
+            except Exception as e:
+                logger.error(f"There was an error converting sheet '{futures[future]}' of {file_path}: {e}")
+                continue
+            converted[sheet_name] = output
+            count_metric("rows", rows)
+            logger.info(f"Converted sheet '{sheet_name}' ({rows:,} rows) to {output}")
+    logger.info(f"Converted {len(converted)}/{len(sheets)} sheets of {file_path} to {output_format}")
+    return converted
+
+#####################################
+# Main Execution
+#####################################
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert every sheet of an Excel workbook to CSV or the columnar cache.")
+    parser.add_argument("workbook", nargs="?", default=default_workbook_file, help="The .xlsx workbook.")
+    parser.add_argument("--sheets", nargs="+", help="Sheet names to convert, defaults to every sheet.")
+    parser.add_argument("--format", default="csv", choices=OUTPUT_FORMATS, help="Write CSV files or the columnar cache.")
+    parser.add_argument("--output", help="Folder for the CSV files, defaults to fetched_data/<workbook name>/.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    args = parser.parse_args()
+
+    logger.info("Starting Excel conversion...")
+    convert_workbook(pathlib.Path(args.workbook), args.output, args.sheets, args.format, args.workers)
+    logger.info("Excel conversion complete.")
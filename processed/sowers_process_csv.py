@@ -1,6 +1,35 @@
 """
 Process a CSV file on pokemon_all_generations to analyze the Pokemon `Speed` column and save statistics.
 
+analyze_columns() computes count, null count, min, max, mean and stdev for any set of
+numeric columns in a single streaming pass, so adding HP, Attack, Defense and the other
+stat columns does not mean re-reading the file once per column.
+
+Several backends compute the same statistics:
+- "python": csv.DictReader and pure-Python running statistics; needs nothing beyond the standard library.
+- "numpy": pandas reads only the selected columns, in chunks of rows, each chunk's cells are
+  parsed into a NumPy array with the same rule as Python's float() and the statistics are
+  vectorized reductions merged chunk by chunk. This is much faster on large files, and memory
+  still depends on the chunk size, not on the file size.
+- "parallel": splits the file into byte ranges on line boundaries and hands them to a
+  process pool. Each worker returns mergeable partial statistics (count, mean, M2, min, max)
+  that are combined with the parallel variance formula, so all cores are used.
+- "cached": reads the requested columns once into a columnar cache keyed by the file's content
+  hash (utils_columnar.py) and afterwards only memory-maps them, so repeat runs take milliseconds.
+The default "auto" picks the cache when it is turned on (COLUMNAR_CACHE=1, NumPy installed)
+and python otherwise; numpy and parallel are chosen explicitly with backend=.
+
+analyze_grouped() computes the same statistics per group, for example Speed by `Type 1`
+or by (`Legendary`, `Generation`), for every group in one streaming pass.
+
+Inputs compressed with gzip (.gz) or zstd (.zst) are decompressed as they are read
+(utils_compression.py); the parallel backend needs byte offsets, so it reads them in one process.
+
+process_csv_stream() computes all of these reports from a URL while it is still downloading
+(see utils_stream.py), without writing the CSV to fetched_data/ first.
+
+Execution Command: py processed/sowers_process_csv.py [--url https://example.com/pokemon.csv]
+
 """
 
 #####################################
@@ -10,13 +39,30 @@ import sys
 import os
 import pathlib
 import csv
-import statistics
+import math
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 
 # Making sure Python can find utils_logger.py in the root folder since the process_scripts are in their own folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
-from utils_logger import logger
+from utils_logger import logger, WarningAggregator
+from utils_stats import RunningStats
+from utils_parallel import default_worker_count, split_file_ranges, iter_lines_in_range
+from utils_fetch import DEFAULT_CHUNK_SIZE
+from utils_stream import iter_url_lines, DEFAULT_QUEUE_SIZE
+from utils_metrics import instrument, count_metric, timed
+from utils_compression import open_file, compression_of, find_input
+import utils_columnar
+
+# Optional columnar backend, the pure-Python path is used when these are missing
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
 
 #####################################
 # Declare Global Variables
@@ -25,44 +71,640 @@ from utils_logger import logger
 fetched_folder_name: str = "fetched_data"
 processed_folder_name: str = "data_processed"
 
+# Numeric columns summarised together in one pass by process_csv_file()
+stat_columns: list = ["HP", "Attack", "Defense", "Sp. Atk", "Sp. Def", "Speed"]
+
+# Group-by breakdowns of Speed written by process_csv_file(), mapped to their output files
+group_by_reports: dict = {
+    "pokemon_speed_by_type.txt": ["Type 1"],
+    "pokemon_speed_by_generation.txt": ["Generation"],
+    "pokemon_speed_by_legendary_generation.txt": ["Legendary", "Generation"],
+}
+
+# Default encoding every backend decodes CSV files with; pass encoding= for files in another one.
+# It does not depend on the host's locale, so the same file reads the same everywhere.
+CSV_ENCODING: str = "utf-8"
+
+# Most distinct groups tracked by analyze_grouped() before new groups are lumped together
+max_groups_default: int = 10_000
+
+# Group key used for rows whose group arrived after the max_groups limit was reached
+OTHER_GROUP: tuple = ("(other)",)
+
+# Shows the first few invalid cells of a file and then one total, instead of one warning per cell
+invalid_value_warnings = WarningAggregator("Skipped invalid CSV values")
+
 #####################################
 # Define Functions
 #####################################
 
+def analyze_columns(file_path: pathlib.Path, columns: list, backend: str = "auto", workers: int = None,
+                    encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate count, null count, min, max, mean and stdev for several numeric columns in one pass.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list): Names of the numeric columns to analyze.
+        backend (str): "cached", "python", "numpy", "parallel", or "auto" to use the columnar cache
+            when it is on, else python.
+        workers (int): Number of worker processes for the parallel backend, defaults to the CPU count.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        dict: Maps each column name to its statistics (see RunningStats.as_dict()).
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header or the backend is unknown.
+
+    Example:
+        analyze_columns(pathlib.Path("fetched_data", "pokemon_all_generations.csv"), ["HP", "Speed"])
+    """
+    if backend == "auto":
+        backend = default_backend()
+    if backend == "cached":
+        results = analyze_columns_cached(file_path, columns, encoding)
+    elif backend == "numpy":
+        if pd is None:
+            raise ValueError("The numpy backend needs numpy and pandas installed")
+        results = analyze_columns_numpy(file_path, columns, encoding)
+    elif backend == "python":
+        results = analyze_columns_python(file_path, columns, encoding)
+    elif backend == "parallel":
+        results = analyze_columns_parallel(file_path, columns, workers, encoding)
+    else:
+        raise ValueError(f"Unknown CSV backend '{backend}', expected 'auto', 'cached', 'python', 'numpy' or 'parallel'")
+    if results:
+        first = next(iter(results.values()))
+        count_metric("rows", first["count"] + first["null_count"])
+    return results
+
+def default_backend() -> str:
+    """Pick the backend "auto" stands for: the columnar cache when it is on, else pure Python."""
+    return "cached" if utils_columnar.CACHE_ENABLED else "python"
+
+def add_cell_value(stats: RunningStats, column: str, cell: str, row) -> None:
+    """Parse one CSV cell and add it to its column's statistics, counting blanks and bad values as nulls."""
+    if cell is None or cell.strip() == "":
+        stats.add_null()
+        return
+    try:
+        value = float(cell)  # Extract and convert to float
+    except ValueError as e:
+        invalid_value_warnings.warn("Skipping invalid {} value in row: {} ({})", column, row, e)
+        stats.add_null()
+        return
+    if math.isnan(value):
+        stats.add_null()
+    else:
+        stats.add(value)
+
+def analyze_columns_python(file_path: pathlib.Path, columns: list, encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate column statistics in one pass with csv.DictReader and running statistics.
+
+    Each row is read once and every requested column is updated as it goes, so memory
+    use depends only on the number of columns, not the number of rows.
+    Empty cells are counted as nulls. Cells that are not numbers are also counted as nulls
+    and logged as a warning (the first few, then a total).
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list): Names of the numeric columns to analyze.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        dict: Maps each column name to its statistics (see RunningStats.as_dict()).
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+    """
+    column_stats = {column: RunningStats() for column in columns}
+    with open_file(file_path, 'r', encoding=encoding) as file:
+        # csv.DictReader() methods to read into a DictReader so we can access named columns in the csv file
+        dict_reader = csv.DictReader(file)
+        missing = [column for column in columns if column not in (dict_reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {file_path}")
+        with invalid_value_warnings:
+            for row in dict_reader:
+                for column, stats in column_stats.items():
+                    add_cell_value(stats, column, row[column], row)
+    return {column: stats.as_dict() for column, stats in column_stats.items()}
+
+def analyze_columns_numpy(file_path: pathlib.Path, columns: list, encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate column statistics by parsing the selected columns into NumPy arrays, chunk by chunk.
+
+    Only the requested columns are read, utils_columnar.CHUNK_ROWS rows at a time, and each
+    chunk's statistics are merged into running totals, so memory does not grow with the file.
+    Cells are parsed with the python backend's rule: blanks and cells float() rejects count as
+    nulls (the latter logged as warnings), so both backends give the same counts.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list): Names of the numeric columns to analyze.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        dict: Maps each column name to its statistics, in the same shape as analyze_columns_python().
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+    """
+    column_stats = {column: RunningStats() for column in columns}
+    with invalid_value_warnings, pd.read_csv(file_path, usecols=columns, dtype=str, keep_default_na=False,
+                                             encoding=encoding, chunksize=utils_columnar.CHUNK_ROWS) as chunks:
+        for chunk in chunks:
+            for column, stats in column_stats.items():
+                stats.merge(array_running_stats(parse_cells(chunk[column].fillna("").to_numpy(dtype=str), column)))
+    return {column: stats.as_dict() for column, stats in column_stats.items()}
+
+def parse_cells(cells, column: str):
+    """
+    Parse an array of CSV cells into float64 like add_cell_value() does, with NaN for nulls.
+
+    NumPy's conversion of text to float follows float(), so the whole array is converted at
+    once and cells are only parsed one by one when some cell is not a number.
+    """
+    try:
+        return np.where(cells == "", "nan", cells).astype(np.float64)
+    except ValueError:
+        pass
+    values = np.empty(len(cells), dtype=np.float64)
+    for index, cell in enumerate(cells.tolist()):
+        if cell.strip() == "":
+            values[index] = np.nan
+            continue
+        try:
+            values[index] = float(cell)
+        except ValueError as e:
+            invalid_value_warnings.warn("Skipping invalid {} value {!r} ({})", column, cell, e)
+            values[index] = np.nan
+    return values
+
+def array_running_stats(values) -> RunningStats:
+    """Return a float array's statistics, with NaN as null, as a RunningStats that can be merged."""
+    stats = RunningStats()
+    valid = values[~np.isnan(values)]
+    stats.null_count = int(values.size - valid.size)
+    if valid.size:
+        stats.count = int(valid.size)
+        stats.mean = float(valid.mean())
+        stats.m2 = float(np.square(valid - stats.mean).sum())
+        stats.min = float(valid.min())
+        stats.max = float(valid.max())
+    return stats
+
+def array_stats(values) -> dict:
+    """Calculate count, null count, min, max, mean and stdev of a float array, with NaN as null."""
+    valid = values[~np.isnan(values)]
+    count = int(valid.size)
+    return {
+        "count": count,
+        "null_count": int(values.size - count),
+        "min": float(valid.min()) if count else None,
+        "max": float(valid.max()) if count else None,
+        "mean": float(valid.mean()) if count else None,
+        "stdev": float(valid.std(ddof=1)) if count > 1 else 0.0,
+    }
+
+def read_csv_columns(file_path: pathlib.Path, columns: list = None, as_text: bool = False,
+                     encoding: str = CSV_ENCODING) -> tuple:
+    """
+    Stream the given columns of a CSV file as text into column builders, for the columnar cache.
+
+    The file is read once, in chunks, and only the given columns are kept, so memory grows with
+    those columns' data and not with the whole file.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list): Names of the columns to read, or None for every column.
+        as_text (bool): Keep the cells' text as it is, even in columns of numbers (for group keys).
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        tuple: (the header's column names, dict of column name -> ColumnBuilder, number of rows).
+            Requested names that are not in the header are left out.
+    """
+    with open_file(file_path, 'r', encoding=encoding, newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        wanted = list(dict.fromkeys(header if columns is None else [column for column in columns if column in header]))
+        builders = {column: utils_columnar.ColumnBuilder(keep_text=as_text) for column in wanted}
+        if pd is None or not wanted:
+            positions = {column: header.index(column) for column in wanted}
+            rows = 0
+            for row in reader:
+                rows += 1
+                for column, index in positions.items():
+                    builders[column].append(row[index] if index < len(row) else "")
+            return header, builders, rows
+    rows = 0
+    for chunk in pd.read_csv(file_path, usecols=wanted, dtype=str, keep_default_na=False, encoding=encoding,
+                             chunksize=utils_columnar.CHUNK_ROWS):
+        rows += len(chunk)
+        for column in wanted:
+            builders[column].extend(chunk[column].fillna("").tolist())
+    return header, builders, rows
+
+def load_csv_table(file_path: pathlib.Path, columns: list, as_text: bool = False, encoding: str = CSV_ENCODING):
+    """
+    Open the cached columnar copy of a CSV file, reading and caching the given columns first if needed.
+
+    With as_text the columns are cached as the cells' text, in a table of their own, so "01",
+    "1" and "1.0" stay three different values as they are in the python backend. A file read
+    with an encoding other than CSV_ENCODING is cached as a table of its own too.
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+    """
+    table_name = "csv:text" if as_text else "csv"
+    if encoding != CSV_ENCODING:
+        table_name = f"{table_name}@{encoding}"
+    table = utils_columnar.load_table(
+        file_path, table_name, lambda path, wanted: read_csv_columns(path, wanted, as_text, encoding), columns)
+    missing = [column for column in columns if column not in table.names]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {file_path}")
+    return table
+
+def analyze_columns_cached(file_path: pathlib.Path, columns: list, encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate column statistics from the columnar cache (see utils_columnar.py).
+
+    The first run on a file reads it once and caches the requested columns; later runs on the
+    same file content only memory-map them. Values that are not numbers count as
+    nulls, as in the numpy backend.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list): Names of the numeric columns to analyze.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        dict: Maps each column name to its statistics, in the same shape as analyze_columns_python().
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+    """
+    table = load_csv_table(file_path, columns, encoding=encoding)
+    return {column: array_stats(utils_columnar.as_float_array(table.column(column))) for column in columns}
+
+def analyze_grouped(file_path: pathlib.Path, value_columns: list, group_by: list,
+                    max_groups: int = max_groups_default, backend: str = "auto", encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate column statistics for every group of rows in one streaming pass (a hash group-by).
+
+    Each group keeps one RunningStats per value column, so memory per group is fixed no matter
+    how many rows it has. If more than max_groups distinct groups appear, rows of any further
+    new group are added to a single OTHER_GROUP bucket instead, which bounds total memory while
+    keeping the groups already seen exact.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        value_columns (list): Names of the numeric columns to analyze.
+        group_by (list): Names of the columns whose values form the group key.
+        max_groups (int): Most distinct groups to track exactly.
+        backend (str): "python", "cached" (columnar cache) or "auto" to use the cache when it is on.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        dict: Maps each group key (a tuple of the group_by values) to a dict of column statistics.
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+
+    Example:
+        analyze_grouped(pathlib.Path("fetched_data", "pokemon_all_generations.csv"), ["Speed"], ["Legendary", "Generation"])
+    """
+    return analyze_grouped_many(file_path, value_columns, [group_by], max_groups, backend, encoding)[0]
+
+def analyze_grouped_many(file_path: pathlib.Path, value_columns: list, group_bys: list,
+                         max_groups: int = max_groups_default, backend: str = "auto",
+                         encoding: str = CSV_ENCODING) -> list:
+    """
+    Calculate several group-by breakdowns of the same columns with one read of the file.
+
+    Every row updates each breakdown's groups in the same pass, so asking for three
+    breakdowns costs one read of the file instead of three. The cached backend reads the
+    cached columns once and groups them per breakdown in memory.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        value_columns (list): Names of the numeric columns to analyze.
+        group_bys (list): One list of group-by column names per breakdown.
+        max_groups (int): Most distinct groups to track exactly per breakdown.
+        backend (str): "python", "cached" (columnar cache) or "auto" to use the cache when it is on.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        list: One dict per entry of group_bys, in the same shape as analyze_grouped().
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+
+    Example:
+        by_type, by_generation = analyze_grouped_many(input_file, ["Speed"], [["Type 1"], ["Generation"]])
+    """
+    if backend == "auto":
+        backend = "cached" if utils_columnar.CACHE_ENABLED else "python"
+    if backend == "cached":
+        # Cache every needed column before grouping by each breakdown: the values as numbers, the keys as text
+        load_csv_table(file_path, value_columns, encoding=encoding)
+        load_csv_table(file_path, [column for group_by in group_bys for column in group_by], True, encoding)
+        return [analyze_grouped_cached(file_path, value_columns, group_by, max_groups, encoding) for group_by in group_bys]
+    if backend != "python":
+        raise ValueError(f"Unknown group-by backend '{backend}', expected 'auto', 'cached' or 'python'")
+    all_groups = [{} for _ in group_bys]
+    overflow_rows = [0] * len(group_bys)
+    with open_file(file_path, 'r', encoding=encoding) as file:
+        dict_reader = csv.DictReader(file)
+        wanted = value_columns + [column for group_by in group_bys for column in group_by]
+        missing = sorted({column for column in wanted if column not in (dict_reader.fieldnames or [])})
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {file_path}")
+        with invalid_value_warnings:
+            for row in dict_reader:
+                for index, group_by in enumerate(group_bys):
+                    overflow_rows[index] += add_grouped_row(all_groups[index], row, value_columns, group_by, max_groups)
+    for group_by, overflowed in zip(group_bys, overflow_rows):
+        if overflowed:
+            logger.warning(f"More than {max_groups} groups by {group_by}; {overflowed} rows were added to {OTHER_GROUP}")
+    return [grouped_stats_as_dict(groups) for groups in all_groups]
+
+def analyze_grouped_cached(file_path: pathlib.Path, value_columns: list, group_by: list,
+                           max_groups: int = max_groups_default, encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate per-group column statistics from the columnar cache, vectorized with NumPy.
+
+    Groups are numbered in order of first appearance, so the first max_groups groups are kept
+    exact and the rest go to OTHER_GROUP, as in the python backend. Group values are compared
+    as the cells' text (see load_csv_table()), so the groups are the python backend's groups.
+
+    Returns:
+        dict: Same shape as analyze_grouped().
+    """
+    table = load_csv_table(file_path, value_columns, encoding=encoding)
+    key_table = load_csv_table(file_path, group_by, True, encoding)
+    if table.rows == 0:
+        return {}
+    keys = np.stack([key_table.column(column) for column in group_by], axis=1)
+    unique_keys, first_rows, row_groups = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    # Renumber the groups by first appearance; groups past max_groups share one extra number
+    appearance = np.empty(len(first_rows), dtype=np.int64)
+    appearance[np.argsort(first_rows, kind="stable")] = np.arange(len(first_rows))
+    row_groups = np.minimum(appearance[row_groups.reshape(-1)], max_groups)
+    overflow_rows = int(np.count_nonzero(row_groups == max_groups))
+    if overflow_rows:
+        logger.warning(f"More than {max_groups} groups by {group_by}; {overflow_rows} rows were added to {OTHER_GROUP}")
+
+    group_keys = {appearance[index]: tuple(key.tolist()) for index, key in enumerate(unique_keys)
+                  if appearance[index] < max_groups}
+    group_keys[max_groups] = OTHER_GROUP
+    row_order = np.argsort(row_groups, kind="stable")
+    group_numbers, starts = np.unique(row_groups[row_order], return_index=True)
+    ends = np.append(starts[1:], len(row_order))
+    values = {column: utils_columnar.as_float_array(table.column(column))[row_order] for column in value_columns}
+    return {
+        group_keys[number]: {column: array_stats(values[column][start:end]) for column in value_columns}
+        for number, start, end in zip(group_numbers.tolist(), starts, ends)
+    }
+
+def add_grouped_row(groups: dict, row: dict, value_columns: list, group_by: list, max_groups: int) -> bool:
+    """
+    Add one CSV row to the running statistics of its group.
+
+    Returns:
+        bool: True if the row went to OTHER_GROUP because max_groups was reached.
+    """
+    key = tuple(row[column] for column in group_by)
+    column_stats = groups.get(key)
+    overflowed = False
+    if column_stats is None:
+        if len(groups) >= max_groups and key != OTHER_GROUP:
+            key = OTHER_GROUP
+            overflowed = True
+            column_stats = groups.get(key)
+        if column_stats is None:
+            column_stats = {column: RunningStats() for column in value_columns}
+            groups[key] = column_stats
+    for column, stats in column_stats.items():
+        add_cell_value(stats, column, row[column], row)
+    return overflowed
+
+def grouped_stats_as_dict(groups: dict) -> dict:
+    """Turn each group's RunningStats into plain statistics dicts."""
+    return {
+        key: {column: stats.as_dict() for column, stats in column_stats.items()}
+        for key, column_stats in groups.items()
+    }
+
+def analyze_csv_lines(lines, columns: list, group_value_columns: list, group_bys: list,
+                      max_groups: int = max_groups_default, source: str = "CSV stream") -> tuple:
+    """
+    Calculate column statistics and several group-by breakdowns in a single pass over CSV lines.
+
+    Unlike analyze_columns() and analyze_grouped(), which each read a file on disk, this only
+    needs an iterable of lines, so it can consume rows while they are still downloading
+    (see utils_stream.iter_url_lines()). Every statistic is updated in the same pass
+    because a stream cannot be read twice.
+
+    Args:
+        lines: Iterable of CSV text lines, starting with the header.
+        columns (list): Names of the numeric columns to analyze over all rows.
+        group_value_columns (list): Names of the numeric columns to analyze per group.
+        group_bys (list): One list of group-by column names per breakdown.
+        max_groups (int): Most distinct groups to track exactly per breakdown.
+        source (str): Name of the data for error messages.
+
+    Returns:
+        tuple: (column statistics like analyze_columns(), list of grouped statistics like
+            analyze_grouped(), one per entry of group_bys).
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+    """
+    dict_reader = csv.DictReader(lines)
+    fieldnames = dict_reader.fieldnames or []
+    wanted = columns + group_value_columns + [column for group_by in group_bys for column in group_by]
+    missing = sorted({column for column in wanted if column not in fieldnames})
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {source}")
+
+    column_stats = {column: RunningStats() for column in columns}
+    all_groups = [{} for _ in group_bys]
+    overflow_rows = [0] * len(group_bys)
+    with invalid_value_warnings:
+        for row in dict_reader:
+            for column, stats in column_stats.items():
+                add_cell_value(stats, column, row[column], row)
+            for index, group_by in enumerate(group_bys):
+                overflow_rows[index] += add_grouped_row(all_groups[index], row, group_value_columns, group_by, max_groups)
+    for group_by, overflowed in zip(group_bys, overflow_rows):
+        if overflowed:
+            logger.warning(f"More than {max_groups} groups by {group_by}; {overflowed} rows were added to {OTHER_GROUP}")
+    count_metric("rows", dict_reader.line_num - 1)
+    return (
+        {column: stats.as_dict() for column, stats in column_stats.items()},
+        [grouped_stats_as_dict(groups) for groups in all_groups],
+    )
+
+def analyze_csv_range(file_path: pathlib.Path, start: int, end: int, column_indexes: dict, encoding: str) -> dict:
+    """
+    Worker for the parallel backend: calculate partial statistics for one byte range of a CSV file.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        start (int): Byte offset of the first row in this range.
+        end (int): Byte offset just past the last row in this range.
+        column_indexes (dict): Maps each column name to its position in a row.
+        encoding (str): Text encoding of the file.
+
+    Returns:
+        tuple: (dict mapping each column name to a RunningStats that can be merged with the other
+            ranges, the invalid value warnings of this range for invalid_value_warnings.merge()).
+    """
+    column_stats = {column: RunningStats() for column in column_indexes}
+    lines = (line.decode(encoding, errors="replace") for line in iter_lines_in_range(file_path, start, end))
+    # The parent logs the warnings, so the total covers every range instead of one per worker
+    invalid_value_warnings.defer()
+    try:
+        for row in csv.reader(lines):
+            if not row:
+                continue
+            for column, index in column_indexes.items():
+                cell = row[index] if index < len(row) else None
+                add_cell_value(column_stats[column], column, cell, row)
+    finally:
+        warnings = invalid_value_warnings.take()
+    return column_stats, warnings
+
+def analyze_columns_parallel(file_path: pathlib.Path, columns: list, workers: int = None,
+                             encoding: str = CSV_ENCODING) -> dict:
+    """
+    Calculate column statistics with a process pool, one byte range of the file per task.
+
+    The file is split on line boundaries, so this assumes no quoted field contains a newline.
+
+    Args:
+        file_path (pathlib.Path): Path to the CSV file.
+        columns (list): Names of the numeric columns to analyze.
+        workers (int): Number of worker processes, defaults to the CPU count.
+        encoding (str): Text encoding of the CSV file.
+
+    Returns:
+        dict: Maps each column name to its statistics, in the same shape as analyze_columns_python().
+
+    Raises:
+        ValueError: If a requested column is not in the CSV header.
+    """
+    if compression_of(file_path):
+        logger.info(f"{file_path} is compressed and cannot be split into byte ranges, analyzing it in one process")
+        return analyze_columns_python(file_path, columns, encoding)
+    workers = workers or default_worker_count()
+    with file_path.open('rb') as file:
+        header_line = file.readline()
+        data_start = file.tell()
+    header = next(csv.reader([header_line.decode(encoding, errors="replace")]), [])
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"Columns {missing} not found in {file_path}")
+    column_indexes = {column: header.index(column) for column in columns}
+
+    # A few ranges per worker keeps every core busy even if some ranges are slower
+    ranges = split_file_ranges(file_path, workers * 4, start_offset=data_start)
+    column_stats = {column: RunningStats() for column in columns}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(analyze_csv_range, file_path, start, end, column_indexes, encoding)
+            for start, end in ranges
+        ]
+        with invalid_value_warnings:
+            for future in futures:
+                partials, warnings = future.result()
+                invalid_value_warnings.merge(*warnings)
+                for column, partial in partials.items():
+                    column_stats[column].merge(partial)
+    logger.info(f"Analyzed {file_path} in {len(ranges)} ranges on {workers} worker processes")
+    return {column: stats.as_dict() for column, stats in column_stats.items()}
+
 def analyze_Speed_speed(file_path: pathlib.Path) -> dict:
     """Analyze the 'speed' column to calculate min, max, mean, and stdev."""
     try:
-        # initialize an empty list to store the speeds
-        speed_list = []
-        with file_path.open('r') as file:
-            # csv.DictReader() methods to read into a DictReader so we can access named columns in the csv file
-            dict_reader = csv.DictReader(file)  
-            for row in dict_reader:
-                try:
-                    speed = float(row["Speed"])  # Extract and convert to float
-                    # append the speed to the list
-                    speed_list.append(speed)
-                except ValueError as e:
-                    logger.warning(f"Skipping invalid row: {row} ({e})")
-        
-        # Calculate statistics
-        stats = {
-            "min": min(speed_list),
-            "max": max(speed_list),
-            "mean": statistics.mean(speed_list),
-            "stdev": statistics.stdev(speed_list) if len(speed_list) > 1 else 0,
-        }
+        stats = analyze_columns(file_path, ["Speed"])["Speed"]
+        if stats["count"] == 0:
+            raise ValueError("no valid Speed values found")
         return stats
     except Exception as e:
         logger.error(f"There was an error processing CSV file: {e}")
         return {}
 
-def process_csv_file():
-    """Read a CSV file, analyze Speed, and save the results."""
-    input_file = pathlib.Path(fetched_folder_name, "pokemon_all_generations.csv")
+def write_column_stats(output_file: pathlib.Path, all_stats: dict) -> None:
+    """Write the statistics of every analyzed column to a text file, one column per line."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file:
+        file.write("Pokémon Column Statistics:\n")
+        for column, stats in all_stats.items():
+            if stats["count"] == 0:
+                file.write(f"{column}: no valid values ({stats['null_count']} nulls)\n")
+                continue
+            file.write(
+                f"{column}: count={stats['count']} nulls={stats['null_count']} "
+                f"min={stats['min']:.2f} max={stats['max']:.2f} "
+                f"mean={stats['mean']:.2f} stdev={stats['stdev']:.2f}\n"
+            )
+
+def write_grouped_stats(output_file: pathlib.Path, column: str, group_by: list, grouped: dict) -> None:
+    """Write one column's statistics for every group to a text file, one group per line."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file:
+        file.write(f"Pokémon {column} Statistics by {', '.join(group_by)}:\n")
+        for key in sorted(grouped):
+            stats = grouped[key][column]
+            label = ", ".join(key)
+            if stats["count"] == 0:
+                file.write(f"{label}: no valid values ({stats['null_count']} nulls)\n")
+                continue
+            file.write(
+                f"{label}: count={stats['count']} min={stats['min']:.2f} max={stats['max']:.2f} "
+                f"mean={stats['mean']:.2f} stdev={stats['stdev']:.2f}\n"
+            )
+
+@instrument
+def process_csv_file() -> bool:
+    """
+    Read a CSV file, analyze Speed and the other stat columns in one pass, and save the results.
+
+    Returns:
+        bool: True if every report was written, False otherwise.
+    """
+    input_file = find_input(pathlib.Path(fetched_folder_name, "pokemon_all_generations.csv"))
     output_file = pathlib.Path(processed_folder_name, "pokemon_speed_stats.txt")
-    
-    stats = analyze_Speed_speed(input_file)
+    columns_output_file = pathlib.Path(processed_folder_name, "pokemon_column_stats.txt")
+
+    try:
+        all_stats = analyze_columns(input_file, stat_columns)
+        if all_stats["Speed"]["count"] == 0:
+            raise ValueError("no valid Speed values found")
+    except Exception as e:
+        logger.error(f"There was an error processing CSV file: {e}")
+        return False
+    write_column_stats(columns_output_file, all_stats)
+    with timed("group_by"):
+        try:
+            all_grouped = analyze_grouped_many(input_file, ["Speed"], list(group_by_reports.values()))
+        except Exception as e:
+            logger.error(f"There was an error grouping CSV file: {e}")
+            return False
+    for (report_name, group_by), grouped in zip(group_by_reports.items(), all_grouped):
+        write_grouped_stats(pathlib.Path(processed_folder_name, report_name), "Speed", group_by, grouped)
+    write_speed_stats(output_file, all_stats["Speed"])
+    logger.info(f"Processed CSV file: {input_file}, Statistics saved to: {output_file} and {columns_output_file}")
+    return True
+
+def write_speed_stats(output_file: pathlib.Path, stats: dict) -> None:
+    """Write the Speed summary (min, max, mean, stdev) to a text file."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     with output_file.open('w') as file:
@@ -71,14 +713,55 @@ def process_csv_file():
         file.write(f"Maximum: {stats['max']:.2f}\n")
         file.write(f"Mean: {stats['mean']:.2f}\n")
         file.write(f"Standard Deviation: {stats['stdev']:.2f}\n")
-    
-    logger.info(f"Processed CSV file: {input_file}, Statistics saved to: {output_file}")
+
+@instrument
+def process_csv_stream(url: str, encoding: str = "utf-8", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       queue_size: int = DEFAULT_QUEUE_SIZE) -> bool:
+    """
+    Compute the same reports as process_csv_file() straight from a URL while it downloads.
+
+    Rows are aggregated as the bytes arrive, so parsing overlaps with network time and the
+    CSV never goes through fetched_data/ on disk. Memory stays around queue_size chunks.
+
+    Args:
+        url (str): URL of the CSV file.
+        encoding (str): Text encoding of the CSV file.
+        chunk_size (int): Bytes per downloaded chunk.
+        queue_size (int): Most chunks downloaded ahead of the parser.
+
+    Returns:
+        bool: True if the reports were written, False otherwise.
+    """
+    output_file = pathlib.Path(processed_folder_name, "pokemon_speed_stats.txt")
+    columns_output_file = pathlib.Path(processed_folder_name, "pokemon_column_stats.txt")
+    group_bys = list(group_by_reports.values())
+    try:
+        lines = iter_url_lines(url, encoding, chunk_size, queue_size)
+        all_stats, all_grouped = analyze_csv_lines(lines, stat_columns, ["Speed"], group_bys, source=url)
+        if all_stats["Speed"]["count"] == 0:
+            raise ValueError("no valid Speed values found")
+    except Exception as e:
+        logger.error(f"There was an error processing CSV stream from {url}: {e}")
+        return False
+    write_column_stats(columns_output_file, all_stats)
+    for (report_name, group_by), grouped in zip(group_by_reports.items(), all_grouped):
+        write_grouped_stats(pathlib.Path(processed_folder_name, report_name), "Speed", group_by, grouped)
+    write_speed_stats(output_file, all_stats["Speed"])
+    logger.info(f"Processed CSV stream: {url}, Statistics saved to: {output_file} and {columns_output_file}")
+    return True
 
 #####################################
 # Main Execution
 #####################################
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze the Pokémon CSV file.")
+    parser.add_argument("--url", help="Analyze this CSV URL while it downloads instead of the fetched file.")
+    args = parser.parse_args()
+
     logger.info("Starting CSV processing...")
-    process_csv_file()
+    if args.url:
+        process_csv_stream(args.url)
+    else:
+        process_csv_file()
     logger.info("CSV processing complete.")
\ No newline at end of file
@@ -1,6 +1,19 @@
 """
 Process an Excel file to count occurrences of a specific word in a column.
 
+By default the workbook is opened in openpyxl's read-only streaming mode and only the
+target column's values are read, which uses a small, constant amount of memory instead
+of building every cell of every sheet. Pass read_only=False for the original full load.
+
+count_terms_in_workbook() counts many terms across many columns and sheets in a single
+pass over the workbook, using the Aho-Corasick matcher in utils_search.py so the cost
+of each cell does not grow with the number of terms.
+
+When the columnar cache is turned on (COLUMNAR_CACHE=1, see utils_columnar.py), both functions
+read the columns they need once into cached per-column arrays keyed by the workbook's content
+hash; later runs on the same workbook
+skip openpyxl's XML parsing and count in memory-mapped columns instead.
+
 """
 #####################################
 # Import Modules
@@ -9,12 +22,22 @@ import sys
 import os
 import pathlib
 import openpyxl
+from openpyxl.utils import column_index_from_string, get_column_letter
 
 # Making sure Python can find utils_logger.py in the root folder since the process_scripts are in their own folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
 from utils_logger import logger
+from utils_search import TermMatcher
+from utils_metrics import instrument, count_metric
+import utils_columnar
+
+# Optional, only used when the columnar cache is on (utils_columnar turns it off without NumPy)
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 #####################################
 # Declare Global Variables
@@ -23,36 +46,272 @@ from utils_logger import logger
 fetched_folder_name = "fetched_data"
 processed_folder_name = "data_processed"
 
+# Countries counted together in one pass by process_excel_file()
+countries_to_count = ["United States", "Canada", "United Kingdom", "Germany", "France", "Australia"]
+
 #####################################
 # Define Functions
 #####################################
 
-def count_word_in_column(file_path: pathlib.Path, column_letter: str, word: str) -> int:
-    """Count the occurrences of a specific word in a given column of an Excel file."""
+def count_word_in_column(file_path: pathlib.Path, column_letter: str, word: str, read_only: bool = True) -> int:
+    """Count the occurrences of a specific word in a given column of an Excel file, or 0 if it cannot be read."""
     try:
-        workbook = openpyxl.load_workbook(file_path)
-        sheet = workbook.active
-        count = 0
-        for cell in sheet[column_letter]:
-            if cell.value and isinstance(cell.value, str):
-                count += cell.value.lower().count(word.lower())
-        return count
+        return count_word_in_sheet_column(file_path, column_letter, word, read_only)
     except Exception as e:
         logger.error(f"There was an error reading Excel file: {e}")
         return 0
 
-def process_excel_file():
-    """Read an Excel file, count occurrences of a specific word in a specific column, and save the result."""
+def count_word_in_sheet_column(file_path: pathlib.Path, column_letter: str, word: str, read_only: bool = True) -> int:
+    """Count a word in a column of the active sheet, raising if the workbook cannot be read."""
+    if read_only and utils_columnar.CACHE_ENABLED:
+        return count_word_in_column_cached(file_path, column_letter, word)
+    if read_only:
+        return count_word_in_column_streaming(file_path, column_letter, word)
+    workbook = openpyxl.load_workbook(file_path)
+    sheet = workbook.active
+    count = 0
+    cells = sheet[column_letter]
+    for cell in cells:
+        if cell.value and isinstance(cell.value, str):
+            count += cell.value.lower().count(word.lower())
+    count_metric("cells", len(cells))
+    return count
+
+def count_word_in_column_streaming(file_path: pathlib.Path, column_letter: str, word: str) -> int:
+    """Count a word in one column of the active sheet, streaming only that column's values in read-only mode."""
+    column_index = column_index_from_string(column_letter)
+    word_lower = word.lower()
+    count = 0
+    cells = 0
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook.active
+        for (value,) in sheet.iter_rows(min_col=column_index, max_col=column_index, values_only=True):
+            cells += 1
+            if value and isinstance(value, str):
+                count += value.lower().count(word_lower)
+    finally:
+        # Read-only workbooks keep the file open until closed
+        workbook.close()
+    count_metric("cells", cells)
+    return count
+
+def read_workbook_sheets(file_path: pathlib.Path, columns: list = None) -> tuple:
+    """Read a workbook's sheet names in order, with a 1 marking the active sheet, for the columnar cache."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        names = workbook.sheetnames
+        active = [int(name == workbook.active.title) for name in names]
+    finally:
+        workbook.close()
+    builders = {"sheet": utils_columnar.ColumnBuilder(parse_text_numbers=False),
+                "active": utils_columnar.ColumnBuilder(parse_text_numbers=False)}
+    builders["sheet"].extend(names)
+    builders["active"].extend(active)
+    return list(builders), builders, len(names)
+
+def cached_workbook_sheets(file_path: pathlib.Path) -> tuple:
+    """
+    Return a workbook's sheet names and its active sheet name from the columnar cache.
+
+    Opening a workbook, even read-only, parses every sheet to find its size, so the sheet
+    list is cached like the cells are.
+    """
+    table = utils_columnar.load_table(file_path, "sheets", read_workbook_sheets)
+    names = table.column("sheet").tolist()
+    active = names[int(np.argmax(table.column("active")))]
+    return names, active
+
+def read_sheet_columns(file_path: pathlib.Path, sheet_name: str, columns: list = None) -> tuple:
+    """
+    Stream the cell values of one sheet into column builders, for the columnar cache.
+
+    Only the given columns are read (openpyxl skips the cells outside their range) and kept,
+    so memory grows with those columns' data and not with the whole sheet.
+
+    Args:
+        file_path (pathlib.Path): Path to the Excel file.
+        sheet_name (str): Name of the sheet.
+        columns (list): Column letters to read, or None for every column.
+
+    Returns:
+        tuple: (every column letter when columns is None, otherwise None; dict of column
+            letter -> ColumnBuilder, empty cells being None; number of rows).
+    """
+    builders = {}
+    rows = 0
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook[sheet_name]
+        if columns is None:
+            for row in sheet.iter_rows(values_only=True):
+                # A row wider than the ones before adds columns that were empty so far
+                for index in range(len(builders), len(row)):
+                    builder = builders[get_column_letter(index + 1)] = utils_columnar.ColumnBuilder(parse_text_numbers=False)
+                    builder.extend([None] * rows)
+                for index, builder in enumerate(builders.values()):
+                    builder.append(row[index] if index < len(row) else None)
+                rows += 1
+            return list(builders), builders, rows
+        indexes = {letter: column_index_from_string(letter) for letter in columns}
+        first_column = min(indexes.values(), default=1)
+        last_column = max(indexes.values(), default=1)
+        builders = {letter: utils_columnar.ColumnBuilder(parse_text_numbers=False) for letter in columns}
+        for row in sheet.iter_rows(min_col=first_column, max_col=last_column, values_only=True):
+            rows += 1
+            for letter, builder in builders.items():
+                position = indexes[letter] - first_column
+                builder.append(row[position] if position < len(row) else None)
+    finally:
+        # Read-only workbooks keep the file open until closed
+        workbook.close()
+    return None, builders, rows
+
+def load_sheet_table(file_path: pathlib.Path, sheet_name: str, columns: list = None):
+    """Open the cached columnar copy of one sheet, reading and caching the given columns (default all) first if needed."""
+    return utils_columnar.load_table(
+        file_path, f"sheet:{sheet_name}", lambda path, wanted: read_sheet_columns(path, sheet_name, wanted), columns
+    )
+
+def count_word_in_column_cached(file_path: pathlib.Path, column_letter: str, word: str) -> int:
+    """Count a word in one column of the active sheet using the columnar cache."""
+    _, active_sheet = cached_workbook_sheets(file_path)
+    column_letter = get_column_letter(column_index_from_string(column_letter))
+    table = load_sheet_table(file_path, active_sheet, [column_letter])
+    count_metric("cells", table.rows)
+    if column_letter not in table.names:
+        return 0
+    values = table.column(column_letter)
+    if values.dtype.kind != "U":
+        # A column of numbers has no text to match, like the non-str cells skipped above
+        return 0
+    return int(np.char.count(np.char.lower(values), word.lower()).sum())
+
+def count_terms_in_workbook(file_path: pathlib.Path, terms: list, columns: list = None, sheets: list = None) -> dict:
+    """
+    Count several terms in several columns and sheets with one read-only pass over the workbook.
+
+    Matching is case-insensitive and counts the same way count_word_in_column() does.
+
+    Args:
+        file_path (pathlib.Path): Path to the Excel file.
+        terms (list): Words or phrases to count.
+        columns (list): Column letters to search, or None for every column.
+        sheets (list): Sheet names to search, or None for every sheet.
+
+    Returns:
+        dict: Maps (sheet name, column letter) to a dict of term -> count. Every requested
+            sheet and column is included, even when nothing matched.
+
+    Raises:
+        KeyError: If a requested sheet does not exist.
+
+    Example:
+        count_terms_in_workbook(input_file, ["United States", "Canada"], columns=["C"], sheets=["Sales"])
+    """
+    if utils_columnar.CACHE_ENABLED:
+        return count_terms_in_workbook_cached(file_path, terms, columns, sheets)
+    matcher = TermMatcher(terms)
+    column_indexes = sorted({column_index_from_string(letter) for letter in columns}) if columns else None
+    counts = {}
+    workbook = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        for sheet_name in (sheets or workbook.sheetnames):
+            sheet = workbook[sheet_name]
+            if column_indexes:
+                first_column, last_column = column_indexes[0], column_indexes[-1]
+                for index in column_indexes:
+                    counts[(sheet_name, get_column_letter(index))] = [0] * len(matcher.patterns)
+            else:
+                first_column, last_column = 1, None
+            for row in sheet.iter_rows(min_col=first_column, max_col=last_column, values_only=True):
+                for offset, value in enumerate(row):
+                    if not value or not isinstance(value, str):
+                        continue
+                    key = (sheet_name, get_column_letter(first_column + offset))
+                    column_counts = counts.get(key)
+                    if column_counts is None:
+                        if column_indexes:
+                            # A column between two requested ones, not requested itself
+                            continue
+                        column_counts = counts[key] = [0] * len(matcher.patterns)
+                    for pattern_id, found in enumerate(matcher.count_patterns(value.lower())):
+                        column_counts[pattern_id] += found
+    finally:
+        workbook.close()
+    return {key: matcher.counts_by_term(pattern_counts) for key, pattern_counts in counts.items()}
+
+def count_terms_in_workbook_cached(file_path: pathlib.Path, terms: list, columns: list = None, sheets: list = None) -> dict:
+    """
+    Count several terms in several columns and sheets using the columnar cache.
+
+    Each distinct cell text is matched once and its counts are multiplied by how often it
+    occurs, which is far less work than matching every cell of a repetitive column.
+
+    Returns:
+        dict: Same shape as count_terms_in_workbook().
+    """
+    matcher = TermMatcher(terms)
+    if sheets is None:
+        sheets, _ = cached_workbook_sheets(file_path)
+    counts = {}
+    for sheet_name in sheets:
+        letters = [get_column_letter(column_index_from_string(letter)) for letter in columns] if columns else None
+        table = load_sheet_table(file_path, sheet_name, letters)
+        letters = letters or table.names
+        for letter in letters:
+            column_counts = [0] * len(matcher.patterns)
+            has_text = False
+            values = table.column(letter) if letter in table.names else None
+            if values is not None and values.dtype.kind == "U":
+                texts, occurrences = np.unique(values, return_counts=True)
+                for text, occurrence in zip(texts.tolist(), occurrences.tolist()):
+                    if not text:
+                        continue
+                    has_text = True
+                    for pattern_id, found in enumerate(matcher.count_patterns(text.lower())):
+                        column_counts[pattern_id] += found * occurrence
+            # Like the streaming scan, only requested columns or columns with text are reported
+            if columns or has_text:
+                counts[(sheet_name, letter)] = column_counts
+    return {key: matcher.counts_by_term(pattern_counts) for key, pattern_counts in counts.items()}
+
+@instrument
+def process_excel_file() -> bool:
+    """
+    Read an Excel file, count occurrences of a specific word in a specific column, and save the result.
+
+    Returns:
+        bool: True if both count files were written, False otherwise.
+    """
     input_file = pathlib.Path(fetched_folder_name, "adventure_works_sales.xlsx")
     output_file = pathlib.Path(processed_folder_name, "adventure_works_usa_count.txt")
     column_to_check = "C"
     word_to_count = "United States"
-    word_count = count_word_in_column(input_file, column_to_check, word_to_count)
+    try:
+        word_count = count_word_in_sheet_column(input_file, column_to_check, word_to_count)
+    except Exception as e:
+        logger.error(f"There was an error reading Excel file: {e}")
+        return False
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with output_file.open('w') as file:
         file.write(f"Occurrences of '{word_to_count}' in column {column_to_check}: {word_count}\n")
     logger.info(f"Processed Excel file: {input_file}, Word count saved to: {output_file}")
 
+    countries_output_file = pathlib.Path(processed_folder_name, "adventure_works_country_counts.txt")
+    try:
+        country_counts = count_terms_in_workbook(input_file, countries_to_count, columns=[column_to_check])
+    except Exception as e:
+        logger.error(f"There was an error reading Excel file: {e}")
+        return False
+    with countries_output_file.open('w') as file:
+        for (sheet_name, column_letter), term_counts in country_counts.items():
+            file.write(f"Sheet '{sheet_name}', column {column_letter}:\n")
+            for term, count in term_counts.items():
+                file.write(f"  {term}: {count}\n")
+    logger.info(f"Country counts saved to: {countries_output_file}")
+    return True
+
 #####################################
 # Main Execution
 #####################################
@@ -30,6 +30,24 @@ JSON file is in the format where it is a list of people with keys:"firstName", "
     ]
 }
 
+count_people_by_gender(file_path, streaming=True) reads the "people" array one record at a
+time instead of loading the whole document, so memory stays flat as the file grows.
+It uses ijson when that package is installed and a pure-Python incremental parser otherwise.
+
+Files ending in .jsonl or .ndjson are read as JSON Lines (one person per line). Because
+those can be split on newlines, count_people_by_gender(file_path, workers=N) splits them
+into byte ranges and counts them on a process pool.
+
+Files compressed with gzip (.gz) or zstd (.zst), such as people.json.gz or people.jsonl.zst,
+are decompressed as they are read (utils_compression.py). Compressed JSON Lines cannot be
+split into byte ranges, so they are counted in one process.
+
+JSON is decoded through utils_json.py, which uses orjson or ujson when installed.
+
+aggregate_people() evaluates a list of aggregation specs (field, op, optional group_by)
+in a single pass over the records, for example an age histogram, age statistics per
+gender and an approximate distinct count of last names, all from one read of the file.
+
 """
 
 #####################################
@@ -39,12 +57,27 @@ import sys
 import os
 import pathlib
 import json
+import math
+from decimal import Decimal
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # Making sure Python can find utils_logger.py in the root folder since the process_scripts are in their own folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
 from utils_logger import logger
+from utils_parallel import default_worker_count, split_file_ranges, iter_lines_in_range
+from utils_stats import RunningStats, HyperLogLog
+import utils_json
+from utils_metrics import instrument, count_metric
+from utils_compression import open_file, compression_of, without_compression_suffix, find_input
+
+# Optional fast event-driven parser, the pure-Python incremental parser is used when it is missing
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 #####################################
 # Declare Global Variables
@@ -53,35 +86,424 @@ from utils_logger import logger
 fetched_folder_name = "fetched_data"
 processed_folder_name = "data_processed"
 
+# Characters (or bytes, for ijson) read at a time when streaming a JSON file
+stream_chunk_size: int = 64 * 1024
+
+JSON_WHITESPACE = " \t\n\r"
+
+# Characters that can continue a JSON number
+JSON_NUMBER_CHARACTERS = "0123456789.eE+-"
+
+# File suffixes read as JSON Lines, one record per line
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+# Metrics written by process_json_aggregates(), see aggregate_people() for the spec format.
+# lastName only gets the fixed-memory approx_distinct; an exact "distinct" keeps every name in
+# memory, so pass it in specs explicitly when the file is known to be small.
+people_aggregations: list = [
+    {"name": "people", "op": "count"},
+    {"name": "gender_counts", "field": "gender", "op": "value_counts"},
+    {"name": "age_histogram", "field": "age", "op": "histogram", "bin_width": 10},
+    {"name": "age_by_gender", "field": "age", "op": "stats", "group_by": "gender"},
+    {"name": "approx_distinct_last_names", "field": "lastName", "op": "approx_distinct"},
+]
+
+#####################################
+# Define Classes
+#####################################
+
+def numeric_value(value):
+    """Return a JSON number as a float, or None for anything else (ijson yields Decimal for non-integers)."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, Decimal)):
+        return None
+    number = float(value)
+    return None if math.isnan(number) else number
+
+def key_value(value):
+    """Return a field value usable as a JSON object key: ijson's Decimal becomes a float, the rest is kept."""
+    return float(value) if isinstance(value, Decimal) else value
+
+class CountAggregator:
+    """Counts records; with a field, counts only records where the field is present."""
+
+    def __init__(self, spec: dict) -> None:
+        self.count = 0
+
+    def add(self, value) -> None:
+        self.count += 1
+
+    def result(self) -> int:
+        return self.count
+
+class ValueCountsAggregator:
+    """Counts how often each value of a field appears."""
+
+    def __init__(self, spec: dict) -> None:
+        self.counts = Counter()
+
+    def add(self, value) -> None:
+        self.counts[key_value(value)] += 1
+
+    def result(self) -> dict:
+        return dict(self.counts)
+
+class StatsAggregator:
+    """Count, min, max, mean and stdev of a numeric field; other values are counted as nulls."""
+
+    def __init__(self, spec: dict) -> None:
+        self.stats = RunningStats()
+
+    def add(self, value) -> None:
+        number = numeric_value(value)
+        if number is None:
+            self.stats.add_null()
+        else:
+            self.stats.add(number)
+
+    def result(self) -> dict:
+        return self.stats.as_dict()
+
+class HistogramAggregator:
+    """Counts numeric values in fixed-width bins, keyed by each bin's lower edge."""
+
+    def __init__(self, spec: dict) -> None:
+        self.bin_width = spec.get("bin_width", 10)
+        if self.bin_width <= 0:
+            raise ValueError("Histogram bin_width must be positive")
+        self.bins = Counter()
+
+    def add(self, value) -> None:
+        number = numeric_value(value)
+        if number is not None:
+            self.bins[math.floor(number / self.bin_width) * self.bin_width] += 1
+
+    def result(self) -> dict:
+        return dict(sorted(self.bins.items()))
+
+class DistinctAggregator:
+    """Exact number of distinct values; keeps every value, so only for low-cardinality fields."""
+
+    def __init__(self, spec: dict) -> None:
+        self.values = set()
+
+    def add(self, value) -> None:
+        self.values.add(value)
+
+    def result(self) -> int:
+        return len(self.values)
+
+class ApproxDistinctAggregator:
+    """Approximate number of distinct values in fixed memory, using HyperLogLog."""
+
+    def __init__(self, spec: dict) -> None:
+        self.sketch = HyperLogLog(spec.get("precision", 14))
+
+    def add(self, value) -> None:
+        self.sketch.add(value)
+
+    def result(self) -> int:
+        return self.sketch.estimate()
+
+# Aggregation ops accepted in a spec's "op", mapped to the class that computes them
+AGGREGATORS = {
+    "count": CountAggregator,
+    "value_counts": ValueCountsAggregator,
+    "stats": StatsAggregator,
+    "histogram": HistogramAggregator,
+    "distinct": DistinctAggregator,
+    "approx_distinct": ApproxDistinctAggregator,
+}
+
 #####################################
 # Define Functions
 #####################################
 
-def count_people_by_gender(file_path: pathlib.Path) -> dict:
-    """Count the number of male versus female people from a JSON file."""
+def iter_json_array_items(file, key: str, chunk_size: int = stream_chunk_size):
+    """
+    Yield the items of one top-level array, e.g. {"people": [...]}, without loading the whole document.
+
+    A small buffer of text is read at a time. Each array item is decoded on its own with
+    json.JSONDecoder.raw_decode(), and text that has been consumed is dropped from the buffer,
+    so memory depends on the size of one item, not the size of the file.
+    Values of other top-level keys are decoded and thrown away.
+
+    Args:
+        file: Text file object opened for reading.
+        key (str): Top-level key whose array should be streamed.
+        chunk_size (int): Number of characters to read at a time.
+
+    Yields:
+        The decoded array items, one at a time.
+
+    Raises:
+        ValueError: If the document is not a JSON object or is malformed.
+    """
+    decoder = json.JSONDecoder()
+    state = {"buffer": "", "position": 0, "eof": False}
+
+    def read_more() -> None:
+        # Drop consumed text before growing the buffer
+        state["buffer"] = state["buffer"][state["position"]:]
+        state["position"] = 0
+        chunk = file.read(chunk_size)
+        if chunk:
+            state["buffer"] += chunk
+        else:
+            state["eof"] = True
+
+    def next_character() -> str:
+        # Skip whitespace and return the next significant character without consuming it
+        while True:
+            buffer, position = state["buffer"], state["position"]
+            while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+                position += 1
+            state["position"] = position
+            if position < len(buffer):
+                return buffer[position]
+            if state["eof"]:
+                return ""
+            read_more()
+
+    def expect(characters: str) -> str:
+        character = next_character()
+        if not character or character not in characters:
+            raise ValueError(f"Malformed JSON: expected one of {characters!r}, found {character!r}")
+        state["position"] += 1
+        return character
+
+    def decode_value():
+        next_character()
+        while True:
+            try:
+                value, end = decoder.raw_decode(state["buffer"], state["position"])
+                # A number cut by the end of the buffer may continue in the next chunk ("12" of "125",
+                # "1" of "1.5e3"), so it only counts once a character that cannot continue it follows
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                complete = end < len(state["buffer"]) and (
+                    not is_number or state["buffer"][end] not in JSON_NUMBER_CHARACTERS
+                )
+                if complete or state["eof"]:
+                    state["position"] = end
+                    return value
+            except json.JSONDecodeError:
+                if state["eof"]:
+                    raise
+            read_more()
+
+    expect("{")
+    if next_character() == "}":
+        return
+    while True:
+        current_key = decode_value()
+        expect(":")
+        if current_key == key and next_character() == "[":
+            expect("[")
+            if next_character() == "]":
+                return
+            while True:
+                yield decode_value()
+                if expect(",]") == "]":
+                    return
+        decode_value()
+        if expect(",}") == "}":
+            return
+
+def is_json_lines(file_path: pathlib.Path) -> bool:
+    """Return True if the file should be read as JSON Lines, based on its suffix."""
+    return without_compression_suffix(file_path).suffix.lower() in JSON_LINES_SUFFIXES
+
+def iter_json_lines(lines):
+    """Decode JSON Lines, skipping blank lines."""
+    for line in lines:
+        if line.strip():
+            yield utils_json.loads(line)
+
+def iter_people(file_path: pathlib.Path):
+    """Yield the people records one at a time, from JSON Lines or from the "people" array (with ijson if installed)."""
+    if is_json_lines(file_path):
+        with open_file(file_path, 'rb') as file:
+            yield from iter_json_lines(file)
+    elif ijson is not None:
+        with open_file(file_path, 'rb') as file:
+            yield from ijson.items(file, "people.item", buf_size=stream_chunk_size)
+    else:
+        with open_file(file_path, 'r', encoding='utf-8') as file:
+            yield from iter_json_array_items(file, "people")
+
+def count_genders(people) -> dict:
+    """Count people records by their "gender" value."""
+    gender_counts_dictionary = {}
+    for person in people:
+        gender = person.get("gender", "Unknown")
+        gender_counts_dictionary[gender] = gender_counts_dictionary.get(gender, 0) + 1
+    return gender_counts_dictionary
+
+def count_genders_in_range(file_path: pathlib.Path, start: int, end: int) -> dict:
+    """Worker for the parallel mode: count genders in one byte range of a JSON Lines file."""
+    return count_genders(iter_json_lines(iter_lines_in_range(file_path, start, end)))
+
+def count_people_by_gender_parallel(file_path: pathlib.Path, workers: int = None) -> dict:
+    """
+    Count people by gender in a JSON Lines file using a process pool.
+
+    The file is split into byte ranges on line boundaries, each range is counted by a worker,
+    and the partial counts are added together.
+
+    Args:
+        file_path (pathlib.Path): Path to a .jsonl or .ndjson file.
+        workers (int): Number of worker processes, defaults to the CPU count.
+
+    Returns:
+        dict: Maps each gender to its count.
+    """
+    if compression_of(file_path):
+        logger.info(f"{file_path} is compressed and cannot be split into byte ranges, counting it in one process")
+        return count_genders(iter_people(file_path))
+    workers = workers or default_worker_count()
+    ranges = split_file_ranges(file_path, workers * 4)
+    totals = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(count_genders_in_range, file_path, start, end) for start, end in ranges]
+        for future in futures:
+            totals.update(future.result())
+    logger.info(f"Counted {file_path} in {len(ranges)} ranges on {workers} worker processes")
+    return dict(totals)
+
+def count_people_by_gender(file_path: pathlib.Path, streaming: bool = False, workers: int = None) -> dict:
+    """Count the number of male versus female people from a JSON file, or return {} if it cannot be read."""
     try:
-        with file_path.open('r', encoding='utf-8') as file:
-            # Use the json module load() function 
-            # to read data file into a Python dictionary
-            people_dictionary = json.load(file)  
-            # initialize an empty dictionary to store the gender counts
-            gender_counts_dictionary = {}
-            # people_list is a list of dictionaries in the JSON file
-            people_list: list = people_dictionary.get("people", [])
-            for people_dictionary in people_list:  
-                gender = people_dictionary.get("gender", "Unknown")
-                gender_counts_dictionary[gender] = gender_counts_dictionary.get(gender, 0) + 1
-            return gender_counts_dictionary
+        return count_genders_in_file(file_path, streaming, workers)
     except Exception as e:
         logger.error(f"There was an error reading or processing JSON file: {e}")
         return {}
 
-def process_json_file():
-    """Read a JSON file, count people by gender and save the result."""
-    input_file: pathlib.Path = pathlib.Path(fetched_folder_name, "people.json")
+def count_genders_in_file(file_path: pathlib.Path, streaming: bool = False, workers: int = None) -> dict:
+    """Count the people by gender in a JSON or JSON Lines file, raising if it cannot be read or parsed."""
+    if is_json_lines(file_path) and workers and workers > 1:
+        gender_counts = count_people_by_gender_parallel(file_path, workers)
+    elif streaming or is_json_lines(file_path):
+        gender_counts = count_genders(iter_people(file_path))
+    else:
+        gender_counts = count_people_by_gender_in_memory(file_path)
+    count_metric("records", sum(gender_counts.values()))
+    return gender_counts
+
+def count_people_by_gender_in_memory(file_path: pathlib.Path) -> dict:
+    """Count the people by gender after loading the whole JSON document."""
+    with open_file(file_path, 'rb') as file:
+        # Use the JSON codec (orjson/ujson/json) loads() function
+        # to read data file into a Python dictionary
+        people_dictionary = utils_json.loads(file.read())
+        # initialize an empty dictionary to store the gender counts
+        gender_counts_dictionary = {}
+        # people_list is a list of dictionaries in the JSON file
+        people_list: list = people_dictionary.get("people", [])
+        for people_dictionary in people_list:  
+            gender = people_dictionary.get("gender", "Unknown")
+            gender_counts_dictionary[gender] = gender_counts_dictionary.get(gender, 0) + 1
+        return gender_counts_dictionary
+
+def aggregate_people(file_path: pathlib.Path, specs: list) -> dict:
+    """
+    Compute several metrics over the people records in one pass.
+
+    Each spec is a dict with:
+        "name": key of the metric in the result.
+        "op": one of "count", "value_counts", "stats", "histogram", "distinct" or "approx_distinct".
+        "field": record field to aggregate (optional for "count", which then counts every record).
+        "group_by": optional field; the metric is then computed separately for each of its values.
+        "bin_width": histogram bin width (default 10). "precision": HyperLogLog precision (default 14).
+    Records missing the field are skipped, except that "stats" counts them as nulls.
+
+    Args:
+        file_path (pathlib.Path): Path to a JSON or JSON Lines people file.
+        specs (list): Aggregation specs as described above.
+
+    Returns:
+        dict: Maps each spec's name to its result, or to a dict of group value -> result when grouped.
+
+    Raises:
+        ValueError: If a spec uses an unknown op or is missing its field.
+
+    Example:
+        aggregate_people(input_file, [{"name": "age_by_gender", "field": "age", "op": "stats", "group_by": "gender"}])
+    """
+    for spec in specs:
+        if spec.get("op") not in AGGREGATORS:
+            raise ValueError(f"Unknown aggregation op {spec.get('op')!r} in {spec}, expected one of {sorted(AGGREGATORS)}")
+        if spec["op"] != "count" and not spec.get("field"):
+            raise ValueError(f"Aggregation {spec.get('name')!r} needs a field")
+
+    # One aggregator per spec, or per spec and group when grouped
+    aggregators = {spec["name"]: ({} if spec.get("group_by") else AGGREGATORS[spec["op"]](spec)) for spec in specs}
+    for person in iter_people(file_path):
+        for spec in specs:
+            field = spec.get("field")
+            if field and field not in person:
+                if spec["op"] == "stats":
+                    value = None
+                else:
+                    continue
+            else:
+                value = person.get(field) if field else person
+            aggregator = aggregators[spec["name"]]
+            group_by = spec.get("group_by")
+            if group_by:
+                group = key_value(person.get(group_by, "Unknown"))
+                if group not in aggregator:
+                    aggregator[group] = AGGREGATORS[spec["op"]](spec)
+                aggregator = aggregator[group]
+            aggregator.add(value)
+
+    return {
+        name: ({group: grouped.result() for group, grouped in aggregator.items()}
+               if isinstance(aggregator, dict) else aggregator.result())
+        for name, aggregator in aggregators.items()
+    }
+
+@instrument
+def process_json_aggregates(input_file_name: str = "people.json", specs: list = None) -> bool:
+    """
+    Read a JSON or JSON Lines people file, compute all configured metrics in one pass and save them.
+
+    Returns:
+        bool: True if the metrics were written, False otherwise.
+    """
+    input_file: pathlib.Path = find_input(pathlib.Path(fetched_folder_name, input_file_name))
+    output_file: pathlib.Path = pathlib.Path(processed_folder_name, "people_aggregates.json")
+    temp_file: pathlib.Path = output_file.with_name(f"{output_file.name}.tmp{os.getpid()}")
+    try:
+        aggregates = aggregate_people(input_file, specs or people_aggregations)
+        # Encode the whole report first and rename it into place, so a failure never leaves a
+        # truncated file. default=str covers values json cannot write, such as Decimal from ijson
+        text = json.dumps(aggregates, indent=4, default=str)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with temp_file.open('w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(temp_file, output_file)
+    except Exception as e:
+        logger.error(f"There was an error aggregating JSON file: {e}")
+        temp_file.unlink(missing_ok=True)
+        return False
+    logger.info(f"Aggregated JSON file: {input_file}, Metrics saved to: {output_file}")
+    return True
+
+@instrument
+def process_json_file(input_file_name: str = "people.json", workers: int = None) -> bool:
+    """
+    Read a JSON or JSON Lines file, count people by gender and save the result.
+
+    Returns:
+        bool: True if the counts were written, False otherwise.
+    """
+    input_file: pathlib.Path = find_input(pathlib.Path(fetched_folder_name, input_file_name))
     output_file: pathlib.Path = pathlib.Path(processed_folder_name, "people_by_gender.txt")
     
-    gender_counts = count_people_by_gender(input_file)
+    try:
+        gender_counts = count_genders_in_file(input_file, streaming=True, workers=workers)
+    except Exception as e:
+        logger.error(f"There was an error reading or processing JSON file: {e}")
+        return False
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     with output_file.open('w') as file:
@@ -90,6 +512,7 @@ def process_json_file():
             file.write(f"{gender}: {count}\n")
     
     logger.info(f"Processed JSON file: {input_file}, Results saved to: {output_file}")
+    return True
 
 #####################################
 # Main Execution
@@ -98,4 +521,5 @@ def process_json_file():
 if __name__ == "__main__":
     logger.info("Starting JSON processing...")
     process_json_file()
+    process_json_aggregates()
     logger.info("JSON processing complete.")
\ No newline at end of file
@@ -1,6 +1,25 @@
 """
 Process a text file to count occurrences of the word "CAPITAL LETTER" and save the result.
 
+The file is read in fixed-size chunks with an explicit encoding, so memory use is capped
+at about one chunk no matter how large the file is, and the result does not depend on
+the platform's default encoding. Matches that cross a chunk boundary are still counted.
+
+process_text_terms() counts a whole vocabulary of terms from a term list file in one pass,
+using the Aho-Corasick matcher in utils_search.py, and writes a per-term count table.
+
+process_text_corpus() runs the same term counting over a whole directory or glob of text
+files on a process pool, writing each file's counts as soon as its worker finishes and a
+total at the end.
+
+Text files compressed with gzip (.gz) or zstd (.zst) are decompressed chunk by chunk as
+they are read (utils_compression.py), including .txt.gz and .txt.zst files in a corpus.
+
+process_text_stream() writes the word count and term table straight from a URL while it
+is still downloading (see utils_stream.py).
+
+Execution Command: py processed/sowers_process_text.py [--corpus "corpus/**/*.txt" | --url https://...] [--terms terms.txt] [--workers 8]
+
 """
 
 #####################################
@@ -8,13 +27,22 @@ Process a text file to count occurrences of the word "CAPITAL LETTER" and save t
 #####################################
 import sys
 import os
+import glob
 import pathlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Making sure Python can find utils_logger.py in the root folder since the process_scripts are in their own folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Import from local project modules
 from utils_logger import logger
+from utils_search import TermMatcher
+from utils_parallel import default_worker_count
+from utils_fetch import DEFAULT_CHUNK_SIZE
+from utils_stream import iter_url_text, DEFAULT_QUEUE_SIZE
+from utils_metrics import instrument, count_metric
+from utils_compression import open_file, find_input, COMPRESSION_SUFFIXES
 
 #####################################
 # Declare Global Variables
@@ -23,36 +51,292 @@ from utils_logger import logger
 fetched_folder_name: str = "fetched_data"
 processed_folder_name: str = "data_processed"
 
+# Characters read per chunk when counting; memory use stays around this size
+default_chunk_size: int = 1024 * 1024
+
+# Term list used by process_text_terms(), one term per line
+default_term_file = pathlib.Path(os.path.dirname(__file__), "text_terms.txt")
+
+# Word counted by process_text_file()
+word_to_count: str = "CAPITAL LETTER"
+
+# Files handed to a corpus worker per task; batching keeps inter-process overhead low on huge corpora
+corpus_batch_size: int = 64
+
+# Matcher built once in each corpus worker process by init_corpus_worker()
+corpus_matcher = None
+
 #####################################
 # Define Functions
 #####################################
 
-def count_word_occurrences(file_path: pathlib.Path, word: str) -> int:
-    """Count the occurrences of a specific word in a text file (case-insensitive)."""
+def count_word_occurrences(file_path: pathlib.Path, word: str, encoding: str = "utf-8",
+                           chunk_size: int = default_chunk_size) -> int:
+    """
+    Count the occurrences of a specific word in a text file (case-insensitive).
+
+    Args:
+        file_path (pathlib.Path): Path to the text file.
+        word (str): Word or phrase to count.
+        encoding (str): Text encoding of the file.
+        chunk_size (int): Number of characters to read at a time.
+
+    Returns:
+        int: Number of non-overlapping occurrences, or 0 if the file could not be read.
+    """
     try:
-        with file_path.open('r') as file:
-            content: str = file.read()
-            return content.lower().count(word.lower())
+        return count_word_in_file(file_path, word, encoding, chunk_size)
     except Exception as e:
         logger.error(f"There was an error reading the text file: {e}")
         return 0
 
-def process_text_file():
-    """Read a text file, count occurrences of 'CAPITAL LETTER', and save the result."""
-    input_file = pathlib.Path(fetched_folder_name, "geographical_characters.txt")
+def count_word_in_file(file_path: pathlib.Path, word: str, encoding: str = "utf-8",
+                       chunk_size: int = default_chunk_size) -> int:
+    """
+    Count the occurrences of a word in a text file, raising if the file cannot be read.
+
+    The file is streamed in chunks. The tail of each chunk that could still be the start
+    of a match is carried into the next chunk, so matches across chunk boundaries are
+    counted exactly once, giving the same result as content.lower().count(word.lower()).
+
+    Raises:
+        ValueError: If the word is empty.
+        OSError: If the file cannot be read (UnicodeDecodeError if it is not in the given encoding).
+    """
+    if not word:
+        raise ValueError("the word to count must not be empty")
+    target = word.lower()
+    count = 0
+    characters = 0
+    carry = ""
+    with open_file(file_path, 'r', encoding=encoding) as file:
+        for chunk in iter(lambda: file.read(chunk_size), ""):
+            characters += len(chunk)
+            buffer = carry + chunk.lower()
+            position = buffer.find(target)
+            last_end = 0
+            while position != -1:
+                count += 1
+                last_end = position + len(target)
+                position = buffer.find(target, last_end)
+            # Keep only the tail that could still begin a match completed by the next chunk
+            carry = buffer[max(last_end, len(buffer) - len(target) + 1):]
+    count_metric("characters", characters)
+    return count
+
+def load_terms(term_file: pathlib.Path, encoding: str = "utf-8") -> list:
+    """Read search terms from a file, one per line, skipping blank lines and # comments."""
+    with pathlib.Path(term_file).open('r', encoding=encoding) as file:
+        terms = [line.strip() for line in file]
+    return [term for term in terms if term and not term.startswith("#")]
+
+def count_terms_in_file(file_path: pathlib.Path, terms: list, encoding: str = "utf-8",
+                        chunk_size: int = default_chunk_size) -> dict:
+    """
+    Count many terms in a text file in one streaming pass (case-insensitive).
+
+    The Aho-Corasick automaton is built once and fed the file chunk by chunk, so the cost
+    is proportional to the file size plus the number of matches, not the number of terms.
+    Each term is counted the same way count_word_occurrences() counts a single word.
+
+    Args:
+        file_path (pathlib.Path): Path to the text file.
+        terms (list): Words or phrases to count, or an already built TermMatcher.
+        encoding (str): Text encoding of the file.
+        chunk_size (int): Number of characters to read at a time.
+
+    Returns:
+        dict: Maps each term to its count, or an empty dict if the file could not be read.
+    """
+    try:
+        matcher = terms if isinstance(terms, TermMatcher) else TermMatcher(terms)
+        with open_file(file_path, 'r', encoding=encoding) as file:
+            chunks = iter(lambda: file.read(chunk_size), "")
+            return matcher.counts_by_term(matcher.count_patterns_in_chunks(chunks))
+    except Exception as e:
+        logger.error(f"There was an error counting terms in the text file: {e}")
+        return {}
+
+@instrument
+def process_text_terms(term_file: pathlib.Path = default_term_file) -> bool:
+    """
+    Read a text file, count every term from the term list file, and save a count table.
+
+    Returns:
+        bool: True if the count table was written, False otherwise.
+    """
+    input_file = find_input(pathlib.Path(fetched_folder_name, "geographical_characters.txt"))
+    output_file = pathlib.Path(processed_folder_name, "term_counts.txt")
+    try:
+        terms = load_terms(term_file)
+    except OSError as e:
+        logger.error(f"There was an error reading the term list {term_file}: {e}")
+        return False
+    term_counts = count_terms_in_file(input_file, terms)
+    if terms and not term_counts:
+        # count_terms_in_file() has logged why the file could not be read
+        return False
+    write_term_counts(output_file, term_counts)
+    logger.info(f"Counted {len(terms)} terms in {input_file}, Count table saved to: {output_file}")
+    return True
+
+def write_term_counts(output_file: pathlib.Path, term_counts: dict) -> None:
+    """Write a tab-separated term count table, most frequent terms first."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file:
+        file.write("Term\tCount\n")
+        for term, count in sorted(term_counts.items(), key=lambda item: (-item[1], item[0])):
+            file.write(f"{term}\t{count}\n")
+
+def find_corpus_files(source: str) -> list:
+    """
+    List the text files of a corpus.
+
+    Args:
+        source (str): A directory (every *.txt, *.txt.gz and *.txt.zst file below it is used) or a glob
+            pattern such as "corpus/**/*.txt".
+
+    Returns:
+        list: Sorted file paths.
+    """
+    if pathlib.Path(source).is_dir():
+        patterns = ["*.txt"] + [f"*.txt{suffix}" for suffix in COMPRESSION_SUFFIXES]
+        return sorted(path for pattern in patterns for path in pathlib.Path(source).rglob(pattern) if path.is_file())
+    return sorted(pathlib.Path(path) for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+
+def init_corpus_worker(terms: list) -> None:
+    """Build the term matcher once per worker process instead of once per file."""
+    global corpus_matcher
+    corpus_matcher = TermMatcher(terms)
+
+def count_corpus_batch(file_paths: list, encoding: str) -> list:
+    """Worker task: count the terms in a batch of corpus files, returning (path, counts) pairs."""
+    return [(file_path, count_terms_in_file(file_path, corpus_matcher, encoding)) for file_path in file_paths]
+
+@instrument
+def process_text_corpus(source: str, terms: list, output_file: pathlib.Path = None,
+                        workers: int = None, encoding: str = "utf-8") -> dict:
+    """
+    Count terms across every file of a corpus on a process pool and save per-file and total counts.
+
+    Files are sent to the workers in batches. Each batch's rows are written to the output
+    table as soon as it finishes, so partial results are visible while the run continues.
+
+    Args:
+        source (str): Directory or glob pattern of text files, see find_corpus_files().
+        terms (list): Words or phrases to count.
+        output_file (pathlib.Path): Tab-separated count table, defaults to data_processed/corpus_term_counts.txt.
+        workers (int): Number of worker processes, defaults to the CPU count.
+        encoding (str): Text encoding of the files.
+
+    Returns:
+        dict: Maps each term to its total count over the corpus.
+
+    Example:
+        process_text_corpus("corpus/**/*.txt", ["CAPITAL LETTER", "SMALL LETTER"], workers=16)
+    """
+    output_file = output_file or pathlib.Path(processed_folder_name, "corpus_term_counts.txt")
+    files = find_corpus_files(source)
+    terms = list(dict.fromkeys(terms))
+    totals = dict.fromkeys(terms, 0)
+    if not files:
+        logger.warning(f"No text files found for corpus {source}")
+        return totals
+
+    batches = [files[start:start + corpus_batch_size] for start in range(0, len(files), corpus_batch_size)]
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file, ProcessPoolExecutor(
+        max_workers=workers or default_worker_count(), initializer=init_corpus_worker, initargs=(terms,)
+    ) as executor:
+        file.write("\t".join(["File"] + terms) + "\n")
+        futures = [executor.submit(count_corpus_batch, batch, encoding) for batch in batches]
+        for done, future in enumerate(as_completed(futures), start=1):
+            for file_path, counts in future.result():
+                file.write("\t".join([str(file_path)] + [str(counts.get(term, 0)) for term in terms]) + "\n")
+                for term in terms:
+                    totals[term] += counts.get(term, 0)
+            file.flush()
+            logger.info(f"Corpus progress: {done}/{len(batches)} batches done")
+        file.write("\t".join(["TOTAL"] + [str(totals[term]) for term in terms]) + "\n")
+    logger.info(f"Processed {len(files)} corpus files from {source}, Counts saved to: {output_file}")
+    return totals
+
+@instrument
+def process_text_file() -> bool:
+    """
+    Read a text file, count occurrences of 'CAPITAL LETTER', and save the result.
+
+    Returns:
+        bool: True if the count was written, False otherwise.
+    """
+    input_file = find_input(pathlib.Path(fetched_folder_name, "geographical_characters.txt"))
     output_file = pathlib.Path(processed_folder_name, "capital_letters_word_count.txt")
-    word_to_count: str = "CAPITAL LETTER"
-    word_count: int = count_word_occurrences(input_file, word_to_count)
+    try:
+        word_count: int = count_word_in_file(input_file, word_to_count)
+    except Exception as e:
+        logger.error(f"There was an error reading the text file: {e}")
+        return False
     output_file.parent.mkdir(parents=True, exist_ok=True)
     with output_file.open('w') as file:
         file.write(f"Occurrences of '{word_to_count}': {word_count}\n")
     logger.info(f"Processed text file: {input_file}, Word count saved to: {output_file}")
+    return True
+
+@instrument
+def process_text_stream(url: str, term_file: pathlib.Path = default_term_file, encoding: str = "utf-8",
+                        chunk_size: int = DEFAULT_CHUNK_SIZE, queue_size: int = DEFAULT_QUEUE_SIZE) -> bool:
+    """
+    Write the same word count and term table as process_text_file() and process_text_terms(),
+    counting straight from a URL while it downloads.
+
+    The word and every term share one matcher, fed each chunk as it arrives, so counting
+    overlaps with network time and the text never goes through fetched_data/ on disk.
+
+    Args:
+        url (str): URL of the text file.
+        term_file (pathlib.Path): Term list file, one term per line.
+        encoding (str): Text encoding of the file.
+        chunk_size (int): Bytes per downloaded chunk.
+        queue_size (int): Most chunks downloaded ahead of the matcher.
+
+    Returns:
+        bool: True if both outputs were written, False otherwise.
+    """
+    output_file = pathlib.Path(processed_folder_name, "capital_letters_word_count.txt")
+    terms_output_file = pathlib.Path(processed_folder_name, "term_counts.txt")
+    try:
+        terms = load_terms(term_file)
+        matcher = TermMatcher([word_to_count] + terms)
+        chunks = iter_url_text(url, encoding, chunk_size, queue_size)
+        counts = matcher.counts_by_term(matcher.count_patterns_in_chunks(chunks))
+    except Exception as e:
+        logger.error(f"There was an error counting terms in the text stream from {url}: {e}")
+        return False
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with output_file.open('w') as file:
+        file.write(f"Occurrences of '{word_to_count}': {counts[word_to_count]}\n")
+    write_term_counts(terms_output_file, {term: counts[term] for term in terms})
+    logger.info(f"Processed text stream: {url}, Counts saved to: {output_file} and {terms_output_file}")
+    return True
 
 #####################################
 # Main Execution
 #####################################
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count words and terms in text files.")
+    parser.add_argument("--corpus", help="Directory or glob of text files to process in parallel.")
+    parser.add_argument("--terms", default=default_term_file, help="Term list file, one term per line.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes for --corpus.")
+    parser.add_argument("--url", help="Count in this text URL while it downloads instead of the fetched file.")
+    args = parser.parse_args()
+
     logger.info("Starting text processing...")
-    process_text_file()
+    if args.corpus:
+        process_text_corpus(args.corpus, load_terms(args.terms), workers=args.workers)
+    elif args.url:
+        process_text_stream(args.url, args.terms)
+    else:
+        process_text_file()
+        process_text_terms(args.terms)
     logger.info("Text processing complete.")
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+Run the whole fetch -> process workflow as one dependency-aware pipeline.
+
+Each processor depends on exactly one fetched file, so the workflow is a small graph:
+
+    fetch_csv   -> process_csv
+    fetch_excel -> process_excel
+                -> convert_excel   (every sheet to fetched_data/<workbook name>/<sheet>.csv)
+    fetch_json  -> process_json
+    fetch_text  -> process_text
+
+This script:
+Runs all fetch stages at once on a thread pool (they spend their time waiting on the network).
+Starts each processor on a process pool as soon as its own input has landed, without waiting
+for the other fetches, so the total time is the slowest fetch -> process chain, not the sum of all steps.
+Skips a processor when its input file is byte-for-byte the same as at its last successful run
+and its outputs still exist (state is kept in data_processed/.pipeline_state.json). A processor
+only counts as successful when it returns True; processors log their errors and return False.
+Skips the stages downstream of a failed stage and logs a summary at the end.
+With --stream, processes the csv and text inputs while they download (utils_stream.py)
+instead of fetching them to fetched_data/ first.
+
+Execution Command: py run_pipeline.py [--force] [--no-fetch | --stream] [--stages process_csv process_text] [--workers 4]
+
+"""
+#####################################
+# Import Modules
+#####################################
+import sys
+import os
+import json
+import time
+import pathlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# Making sure Python can find the fetchers and processors in their own folders
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'data')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'processed')))
+
+# Import from local project modules
+from utils_logger import logger
+from utils_fetch import content_digest
+from sowers_fetch_all import FETCHERS, load_manifest, default_manifest_path
+import sowers_process_csv
+import sowers_process_excel
+import sowers_process_json
+import sowers_process_text
+import sowers_convert_excel
+
+#####################################
+# Declare Global Variables
+#####################################
+
+fetched_folder_name = "fetched_data"
+processed_folder_name = "data_processed"
+state_file = pathlib.Path(processed_folder_name, ".pipeline_state.json")
+
+# Processors that can read their input from the URL while it downloads, used by --stream
+STREAM_PROCESSORS = {
+    "csv": sowers_process_csv.process_csv_stream,
+    "text": sowers_process_text.process_text_stream,
+}
+
+#####################################
+# Define Functions
+#####################################
+
+def run_fetch(kind: str, filename: str, url: str) -> bool:
+    """Fetch stage: download one file, raising if the fetcher reports a failure."""
+    if not FETCHERS[kind](fetched_folder_name, filename, url):
+        raise RuntimeError(f"Fetching {filename} from {url} failed")
+    return True
+
+def run_json_processing() -> bool:
+    """Process stage for the JSON file: gender counts and the aggregate metrics. True only if both succeeded."""
+    counted = sowers_process_json.process_json_file()
+    aggregated = sowers_process_json.process_json_aggregates()
+    return counted is True and aggregated is True
+
+def run_text_processing() -> bool:
+    """Process stage for the text file: the single word count and the term table. True only if both succeeded."""
+    counted = sowers_process_text.process_text_file()
+    tabulated = sowers_process_text.process_text_terms()
+    return counted is True and tabulated is True
+
+def run_excel_conversion(file_path: pathlib.Path) -> bool:
+    """Process stage that converts every sheet of the workbook to CSV, raising if no sheet was converted."""
+    if not sowers_convert_excel.convert_workbook(file_path):
+        raise RuntimeError(f"Converting the sheets of {file_path} failed")
+    return True
+
+def run_stream_processing(kind: str, url: str) -> bool:
+    """Process stage that reads its input straight from the URL while it downloads."""
+    if not STREAM_PROCESSORS[kind](url):
+        raise RuntimeError(f"Processing the {kind} stream from {url} failed")
+    return True
+
+def build_stages(manifest_path: pathlib.Path = default_manifest_path, streaming: bool = False) -> dict:
+    """
+    Describe every pipeline stage and its dependencies.
+
+    Args:
+        manifest_path (pathlib.Path): Fetch manifest with the source URLs.
+        streaming (bool): For inputs with a stream processor (csv, text), replace the fetch and
+            process stages with one stage that processes the download as it arrives.
+
+    Returns:
+        dict: Maps a stage name to a dict with:
+            "kind": "fetch" or "process",
+            "run": the function to call, "args": its arguments; it must return True on success,
+            "deps": names of stages that must finish first,
+            "inputs": files whose content decides whether a process stage can be skipped,
+            "outputs": files the stage must produce.
+    """
+    jobs = {job["kind"]: job for job in load_manifest(manifest_path)}
+    fetched = {kind: pathlib.Path(fetched_folder_name, job["filename"]) for kind, job in jobs.items()}
+    processors = {
+        "csv": (sowers_process_csv.process_csv_file,
+                ["pokemon_speed_stats.txt", "pokemon_column_stats.txt", *sowers_process_csv.group_by_reports]),
+        "excel": (sowers_process_excel.process_excel_file, ["adventure_works_usa_count.txt"]),
+        "json": (run_json_processing, ["people_by_gender.txt", "people_aggregates.json"]),
+        "text": (run_text_processing, ["capital_letters_word_count.txt", "term_counts.txt"]),
+    }
+    stages = {}
+    for kind, job in jobs.items():
+        if streaming and kind in STREAM_PROCESSORS:
+            stages[f"process_{kind}"] = {
+                "kind": "process",
+                "run": run_stream_processing,
+                "args": (kind, job["url"]),
+                "deps": [],
+                "inputs": [],
+                "outputs": [pathlib.Path(processed_folder_name, name) for name in processors[kind][1]],
+            }
+            continue
+        stages[f"fetch_{kind}"] = {
+            "kind": "fetch",
+            "run": run_fetch,
+            "args": (kind, job["filename"], job["url"]),
+            "deps": [],
+            "inputs": [],
+            "outputs": [fetched[kind]],
+        }
+        if kind in processors:
+            run, outputs = processors[kind]
+            stages[f"process_{kind}"] = {
+                "kind": "process",
+                "run": run,
+                "args": (),
+                "deps": [f"fetch_{kind}"],
+                "inputs": [fetched[kind]],
+                "outputs": [pathlib.Path(processed_folder_name, name) for name in outputs],
+            }
+        if kind == "excel":
+            stages["convert_excel"] = {
+                "kind": "process",
+                "run": run_excel_conversion,
+                "args": (fetched[kind],),
+                "deps": [f"fetch_{kind}"],
+                "inputs": [fetched[kind]],
+                "outputs": [pathlib.Path(fetched_folder_name, fetched[kind].stem)],
+            }
+    return stages
+
+def load_state() -> dict:
+    """Read the input digests recorded at each stage's last successful run."""
+    try:
+        with state_file.open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def save_state(state: dict) -> None:
+    """Save the input digests of successful stages."""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    with state_file.open('w', encoding='utf-8') as file:
+        json.dump(state, file, indent=4)
+
+def is_up_to_date(stage: dict, digests: dict, previous: dict) -> bool:
+    """A process stage is up to date if its inputs match the last successful run and its outputs exist."""
+    return bool(previous) and previous == digests and all(path.exists() for path in stage["outputs"])
+
+def run_pipeline(stages: dict, selected: list = None, force: bool = False, workers: int = None,
+                 fetch: bool = True) -> dict:
+    """
+    Run the stages in dependency order, each as soon as its dependencies have finished.
+
+    Args:
+        stages (dict): Stage descriptions from build_stages().
+        selected (list): Stage names to run; their dependencies are added automatically. None runs everything.
+        force (bool): Run process stages even when their inputs have not changed.
+        workers (int): Size of the process pool for process stages, defaults to the CPU count.
+        fetch (bool): Download the inputs; if False, fetch stages reuse the files already on disk.
+
+    Returns:
+        dict: Maps each stage name to "done", "skipped (unchanged)", "skipped (not fetching)",
+            "skipped (dependency failed)" or "failed".
+    """
+    # Pull in everything the selected stages depend on
+    wanted = set(selected or stages)
+    pending_deps = list(wanted)
+    while pending_deps:
+        for dep in stages[pending_deps.pop()]["deps"]:
+            if dep not in wanted:
+                wanted.add(dep)
+                pending_deps.append(dep)
+
+    state = load_state()
+    status = {}
+    started = {}
+    running = {}
+    run_started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, len(wanted))) as thread_pool, \
+            ProcessPoolExecutor(max_workers=workers) as process_pool:
+        while len(status) < len(wanted):
+            # Start every stage whose dependencies are all finished
+            for name in sorted(wanted - status.keys() - running.keys()):
+                stage = stages[name]
+                dep_status = [status.get(dep) for dep in stage["deps"]]
+                if any(result is None for result in dep_status):
+                    continue
+                if any(result in ("failed", "skipped (dependency failed)") for result in dep_status):
+                    status[name] = "skipped (dependency failed)"
+                    logger.warning(f"Skipping {name} because a dependency failed")
+                    continue
+                if stage["kind"] == "fetch" and not fetch:
+                    if all(path.exists() for path in stage["outputs"]):
+                        status[name] = "skipped (not fetching)"
+                    else:
+                        status[name] = "failed"
+                        logger.error(f"{name} cannot be skipped, {stage['outputs']} has not been fetched yet")
+                    continue
+                if stage["kind"] == "process":
+                    digests = {str(path): content_digest(path) for path in stage["inputs"]}
+                    if not force and is_up_to_date(stage, digests, state.get(name, {})):
+                        status[name] = "skipped (unchanged)"
+                        logger.info(f"Skipping {name}: its input has not changed since the last run")
+                        continue
+                    stage["digests"] = digests
+                pool = thread_pool if stage["kind"] == "fetch" else process_pool
+                logger.info(f"Starting {name}...")
+                started[name] = time.perf_counter()
+                running[name] = pool.submit(stage["run"], *stage["args"])
+
+            if not running:
+                continue
+            done, _ = wait(running.values(), return_when=FIRST_COMPLETED)
+            for name, future in list(running.items()):
+                if future not in done:
+                    continue
+                del running[name]
+                stage = stages[name]
+                elapsed = time.perf_counter() - started[name]
+                try:
+                    # Processors log their own errors and return False, so anything but True is a failure
+                    if future.result() is not True:
+                        raise RuntimeError("the stage reported a failure, see the errors above")
+                    missing = [str(path) for path in stage["outputs"] if not path.exists()]
+                    if missing:
+                        raise RuntimeError(f"expected outputs were not written: {missing}")
+                except Exception as e:
+                    status[name] = "failed"
+                    logger.error(f"{name} failed after {elapsed:.2f}s: {e}")
+                    # Its outputs may be partly rewritten, so the next run must not skip it
+                    if state.pop(name, None) is not None:
+                        save_state(state)
+                    continue
+                status[name] = "done"
+                logger.info(f"Finished {name} in {elapsed:.2f}s")
+                if stage["kind"] == "process":
+                    state[name] = stage["digests"]
+                    save_state(state)
+
+    logger.info(f"Pipeline finished in {time.perf_counter() - run_started_at:.2f}s")
+    for name in sorted(status):
+        logger.info(f"  {name}: {status[name]}")
+    return status
+
+#####################################
+# Main Execution
+#####################################
+
+def main():
+    """Build the stage graph and run it."""
+    parser = argparse.ArgumentParser(description="Run the fetch -> process pipeline.")
+    parser.add_argument("--stages", nargs="+", help="Only run these stages (plus what they depend on).")
+    parser.add_argument("--force", action="store_true", help="Run process stages even if their input is unchanged.")
+    fetch_mode = parser.add_mutually_exclusive_group()
+    fetch_mode.add_argument("--no-fetch", action="store_true", help="Process the files already fetched without downloading.")
+    fetch_mode.add_argument("--stream", action="store_true", help="Process csv and text while they download, without saving them.")
+    parser.add_argument("--workers", type=int, help="Process pool size for process stages.")
+    parser.add_argument("--manifest", default=default_manifest_path, help="Fetch manifest with the source URLs.")
+    args = parser.parse_args()
+
+    stages = build_stages(args.manifest, streaming=args.stream)
+    unknown = set(args.stages or []) - stages.keys()
+    if unknown:
+        parser.error(f"unknown stages {sorted(unknown)}, choose from {sorted(stages)}")
+    status = run_pipeline(stages, args.stages, args.force, args.workers, fetch=not args.no_fetch)
+    if any(result == "failed" for result in status.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Make the root utils_*.py modules and the processed/ scripts importable from the tests."""
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'processed')))
@@ -0,0 +1,77 @@
+"""Parity tests: every backend of processed/sowers_process_csv.py against the python backend."""
+import pytest
+
+import utils_columnar
+from sowers_process_csv import analyze_columns, analyze_grouped_many
+
+pytest.importorskip("numpy")
+
+GROUPED_CSV = """Name,Generation,Legendary,Speed
+a,1,False,45
+b,01,False,60
+c,1.0,True,90
+d,2,False,
+e,1,False,30
+f,,True,100
+g,1.0,True,x
+"""
+
+# Cells float() accepts or rejects in ways a stricter parser might not: "1_000", padding, "nan"
+TRICKY_CELLS = ["45", "1_000", " 7 ", "", "  ", "nan", "x", "-2.5e1", "+3.", ".5", "0x10", "12"]
+
+
+@pytest.fixture
+def column_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils_columnar, "CACHE_FOLDER", tmp_path / "columnar")
+    return tmp_path / "columnar"
+
+
+@pytest.fixture
+def stats_csv(tmp_path):
+    csv_file = tmp_path / "stats.csv"
+    rows = [f"{index},{TRICKY_CELLS[index % len(TRICKY_CELLS)]},{index * 0.25}" for index in range(500)]
+    csv_file.write_text("Id,Speed,HP\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    return csv_file
+
+
+def assert_same_stats(actual, expected):
+    assert actual.keys() == expected.keys()
+    for column, stats in expected.items():
+        assert actual[column]["count"] == stats["count"]
+        assert actual[column]["null_count"] == stats["null_count"]
+        for name in ("min", "max", "mean", "stdev"):
+            assert actual[column][name] == pytest.approx(stats[name], rel=1e-9)
+
+
+@pytest.mark.parametrize("backend", ["cached", "numpy", "parallel"])
+def test_column_stats_match_python(stats_csv, column_cache, backend):
+    if backend == "numpy":
+        pytest.importorskip("pandas")
+
+    expected = analyze_columns(stats_csv, ["Speed", "HP"], backend="python")
+    actual = analyze_columns(stats_csv, ["Speed", "HP"], backend=backend, workers=2)
+
+    assert_same_stats(actual, expected)
+    assert expected["Speed"]["null_count"] > 0
+
+
+def test_numpy_backend_reads_in_chunks(stats_csv, monkeypatch):
+    pytest.importorskip("pandas")
+    monkeypatch.setattr(utils_columnar, "CHUNK_ROWS", 7)
+
+    expected = analyze_columns(stats_csv, ["Speed", "HP"], backend="python")
+    actual = analyze_columns(stats_csv, ["Speed", "HP"], backend="numpy")
+
+    assert_same_stats(actual, expected)
+
+
+def test_cached_groups_match_python_on_numeric_looking_keys(tmp_path, column_cache):
+    csv_file = tmp_path / "pokemon.csv"
+    csv_file.write_text(GROUPED_CSV, encoding="utf-8")
+    group_bys = [["Generation"], ["Legendary", "Generation"]]
+
+    expected = analyze_grouped_many(csv_file, ["Speed"], group_bys, backend="python")
+    cached = analyze_grouped_many(csv_file, ["Speed"], group_bys, backend="cached")
+
+    assert cached == expected
+    assert set(expected[0]) == {("1",), ("01",), ("1.0",), ("2",), ("",)}
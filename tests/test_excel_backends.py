@@ -0,0 +1,59 @@
+"""Parity tests: the streaming and cached Excel counts of processed/sowers_process_excel.py against a full load."""
+import pytest
+
+import utils_columnar
+from sowers_process_excel import (
+    count_word_in_sheet_column,
+    count_word_in_column_streaming,
+    count_word_in_column_cached,
+    count_terms_in_workbook,
+    count_terms_in_workbook_cached,
+)
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("numpy")
+
+TERMS = ["united states", "Canada", "states"]
+
+
+@pytest.fixture
+def workbook_file(tmp_path):
+    workbook = openpyxl.Workbook()
+    notes = workbook.active
+    notes.title = "Notes"
+    notes.append(["ignored", "United States"])
+    sales = workbook.create_sheet("Sales")
+    sales.append(["Order", "Country", "Amount", "Comment"])
+    countries = ["United States", "canada", None, "UNITED STATES of America", 42, "", "Canada, Canada", "Mexico"]
+    for index in range(300):
+        sales.append([index, countries[index % len(countries)], index * 1.5, "states" if index % 7 == 0 else None])
+    # A column mixing numbers and text, and a row wider than the header
+    sales.append([None, 7, "Canada", None, "united states"])
+    workbook.active = workbook.sheetnames.index("Sales")
+    file_path = tmp_path / "sales.xlsx"
+    workbook.save(file_path)
+    return file_path
+
+
+@pytest.fixture
+def column_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils_columnar, "CACHE_FOLDER", tmp_path / "columnar")
+    return tmp_path / "columnar"
+
+
+@pytest.mark.parametrize("column_letter", ["B", "C", "D", "E", "F", "b"])
+@pytest.mark.parametrize("word", ["united states", "CANADA", "a"])
+def test_column_counts_match_full_load(workbook_file, column_cache, column_letter, word):
+    expected = count_word_in_sheet_column(workbook_file, column_letter, word, read_only=False)
+
+    assert count_word_in_column_streaming(workbook_file, column_letter, word) == expected
+    assert count_word_in_column_cached(workbook_file, column_letter, word) == expected
+
+
+@pytest.mark.parametrize("columns", [None, ["B", "D"], ["C"]])
+@pytest.mark.parametrize("sheets", [None, ["Sales"]])
+def test_cached_term_counts_match_streaming(workbook_file, column_cache, columns, sheets):
+    expected = count_terms_in_workbook(workbook_file, TERMS, columns, sheets)
+
+    assert count_terms_in_workbook_cached(workbook_file, TERMS, columns, sheets) == expected
+    assert any(any(counts.values()) for counts in expected.values())
@@ -0,0 +1,105 @@
+"""
+Tests for utils_http.py against a local http.server running on a thread.
+
+They check the retry policy (503 with Retry-After is retried, 404 is not) and that a server
+that never answers cannot hang http_get() past its read timeout.
+"""
+import time
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import utils_http
+from utils_http import configure_http, http_get
+
+# How long /hang keeps the client waiting, far longer than the read timeout under test
+HANG_SECONDS = 5.0
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves /flaky (503 with Retry-After once, then 200), /hang (no answer) and 404 for anything else."""
+
+    def do_GET(self):
+        hits = self.server.hits
+        hits[self.path] += 1
+        if self.path == "/flaky" and hits[self.path] == 1:
+            self.reply(503, b"busy", {"Retry-After": "1"})
+        elif self.path == "/flaky":
+            self.reply(200, b"ok")
+        elif self.path == "/hang":
+            self.server.release.wait(HANG_SECONDS)
+            self.reply(200, b"late")
+        else:
+            self.reply(404, b"not found")
+
+    def reply(self, status: int, body: bytes, headers: dict = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run the test server on a free port and yield it; the request counts are in server.hits."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    httpd.hits = Counter()
+    httpd.release = threading.Event()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.release.set()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def http_settings():
+    """Use short backoffs in the tests and restore the shared settings afterwards."""
+    saved = dict(utils_http.HTTP_SETTINGS)
+    configure_http(total_retries=2, backoff_factor=0.01, backoff_jitter=0.0, read_timeout=10.0)
+    yield
+    configure_http(**saved)
+
+
+def url_of(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_503_with_retry_after_is_retried_then_succeeds(server):
+    started_at = time.perf_counter()
+    response = http_get(url_of(server, "/flaky"))
+    elapsed = time.perf_counter() - started_at
+
+    assert response.status_code == 200
+    assert response.content == b"ok"
+    assert server.hits["/flaky"] == 2
+    # The Retry-After of 1 second wins over the 0.01 second backoff
+    assert elapsed >= 0.9
+
+
+def test_hanging_endpoint_times_out(server):
+    configure_http(total_retries=0, read_timeout=0.5)
+    started_at = time.perf_counter()
+    with pytest.raises((requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        http_get(url_of(server, "/hang"))
+    elapsed = time.perf_counter() - started_at
+
+    assert elapsed < HANG_SECONDS / 2
+    assert server.hits["/hang"] == 1
+
+
+def test_404_is_not_retried(server):
+    response = http_get(url_of(server, "/missing"))
+
+    assert response.status_code == 404
+    assert server.hits["/missing"] == 1
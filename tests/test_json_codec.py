@@ -0,0 +1,39 @@
+"""Tests for utils_json.py: every backend decodes the same values as the standard library."""
+import json
+import math
+
+import pytest
+
+import utils_json
+
+BACKENDS = [name for name, installed in utils_json.AVAILABLE_BACKENDS.items() if installed]
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    previous = utils_json.BACKEND
+    utils_json.set_backend(request.param)
+    yield request.param
+    utils_json.set_backend(previous)
+
+
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_integers_wider_than_64_bits_stay_exact(backend, as_bytes):
+    text = '{"ids": [18446744073709551616, -99999999999999999999, 9223372036854775807, 7], "ratio": 0.5}'
+
+    decoded = utils_json.loads(text.encode("utf-8") if as_bytes else text)
+
+    assert decoded == json.loads(text)
+    assert all(isinstance(value, int) for value in decoded["ids"])
+
+
+def test_nan_and_infinity_are_accepted(backend):
+    decoded = utils_json.loads(b'{"values": [NaN, Infinity, -Infinity, 1.5]}')
+
+    assert math.isnan(decoded["values"][0])
+    assert decoded["values"][1:] == [math.inf, -math.inf, 1.5]
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        utils_json.loads('{"values": [1, 2')
@@ -0,0 +1,45 @@
+"""Parity tests: JSON Lines input against the same records as a JSON array in processed/sowers_process_json.py."""
+import json
+
+import pytest
+
+from sowers_process_json import count_genders_in_file, aggregate_people, people_aggregations
+
+PEOPLE = [
+    {"firstName": f"Name{index}", "lastName": f"Last{index % 37}",
+     "gender": ["female", "male", "nonbinary"][index % 3], "age": 18 + index % 60}
+    for index in range(400)
+]
+PEOPLE[5].pop("gender")
+PEOPLE[9]["age"] = None
+PEOPLE[11]["age"] = 33.5
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    file_path = tmp_path / "people.json"
+    file_path.write_text(json.dumps({"people": PEOPLE}, indent=2), encoding="utf-8")
+    return file_path
+
+
+@pytest.fixture
+def json_lines_file(tmp_path):
+    file_path = tmp_path / "people.jsonl"
+    file_path.write_text("".join(json.dumps(person) + "\n" for person in PEOPLE), encoding="utf-8")
+    return file_path
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_gender_counts_match_json_array(json_file, json_lines_file, workers):
+    expected = count_genders_in_file(json_file)
+
+    assert count_genders_in_file(json_lines_file, streaming=True, workers=workers) == expected
+    assert count_genders_in_file(json_file, streaming=True) == expected
+    assert expected["Unknown"] == 1
+
+
+def test_aggregates_match_json_array(json_file, json_lines_file):
+    expected = aggregate_people(json_file, people_aggregations)
+
+    assert aggregate_people(json_lines_file, people_aggregations) == expected
+    assert expected["people"] == len(PEOPLE)
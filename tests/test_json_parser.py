@@ -0,0 +1,37 @@
+"""Tests for the pure-Python streaming array parser in processed/sowers_process_json.py."""
+import io
+import json
+
+import pytest
+
+from sowers_process_json import iter_json_array_items
+
+NUMBERS = [0, -1, 7, 125, 12.5, -0.75, 3e10, -4.25e-3, 6.02e+23, 1.0, 1234567890123, 100]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_numbers_cut_at_any_chunk_boundary(chunk_size):
+    text = json.dumps({"before": [1.5, 2], "values": NUMBERS, "after": 3})
+
+    items = list(iter_json_array_items(io.StringIO(text), "values", chunk_size=chunk_size))
+
+    assert items == NUMBERS
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_exponents_and_compact_separators(chunk_size):
+    text = '{"values":[1E5,2.50e-2,-3E+2,10,0.1,99]}'
+
+    items = list(iter_json_array_items(io.StringIO(text), "values", chunk_size=chunk_size))
+
+    assert items == json.loads(text)["values"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8])
+def test_objects_and_literals(chunk_size):
+    people = [{"gender": "female", "age": 31}, {"gender": "male", "age": None}, True, False, None, "x"]
+    text = json.dumps({"people": people})
+
+    items = list(iter_json_array_items(io.StringIO(text), "people", chunk_size=chunk_size))
+
+    assert items == people
@@ -0,0 +1,36 @@
+"""Tests that the chunked counts of processed/sowers_process_text.py match counting the whole text."""
+import pytest
+
+from sowers_process_text import count_word_in_file, count_terms_in_file
+
+TEXT = (
+    "The Aardvark ate an aardvark. AAAAAAA aaa\n"
+    "Über über ÜBER; the theme of the thesis: The End.\n"
+    "banana bananas ananas nana\n"
+)
+
+WORDS = ["aardvark", "aaa", "über", "the", "the ", "nana", "ana", "s: t", "\n", "End.\n"]
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    file_path = tmp_path / "text.txt"
+    file_path.write_text(TEXT, encoding="utf-8")
+    return file_path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13, 1024])
+@pytest.mark.parametrize("word", WORDS)
+def test_word_count_across_chunk_boundaries(text_file, word, chunk_size):
+    expected = TEXT.lower().count(word.lower())
+
+    assert count_word_in_file(text_file, word, chunk_size=chunk_size) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8, 1024])
+def test_term_counts_match_word_counts(text_file, chunk_size):
+    terms = ["aardvark", "the", "über", "banana", "aaa"]
+
+    counts = count_terms_in_file(text_file, terms, chunk_size=chunk_size)
+
+    assert counts == {term: TEXT.lower().count(term) for term in terms}
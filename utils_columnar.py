@@ -0,0 +1,348 @@
+"""
+Columnar Cache of Parsed Inputs
+File: utils_columnar.py
+
+This script keeps parsed copies of input files as one NumPy .npy file per column, so
+processors only parse a CSV or XLSX file once and later runs load just the columns they need.
+The cache is opt-in: it is only used when COLUMNAR_CACHE=1 is set or set_cache_enabled(True) is called.
+
+Features:
+- Cache entries are keyed by the SHA-256 of the input file (reusing the digest saved by the
+  fetchers when it is current), so a re-fetched file with new content is parsed again and an
+  unchanged one never is.
+- Columns are loaded memory-mapped (np.load(mmap_mode="r")), so opening a table costs
+  milliseconds and only the pages that are actually read come from disk.
+- Only the columns a processor asks for are cached. They are read in one streaming pass into
+  ColumnBuilder objects, which keep each column as compact NumPy chunks instead of Python
+  objects; columns asked for later are added to the same table by another pass.
+- Columns whose values are all numbers (or blank) are stored as float64 with NaN for blanks;
+  other columns are stored as fixed-width text. Cells that are neither text nor numbers
+  (dates, booleans in XLSX files) are stored as blank text.
+- Column files and the table manifest are written under temporary names and renamed into place,
+  and a column only counts as cached once the manifest lists it, so an interrupted run never
+  leaves a half-written column. Older entries for the same source file are removed.
+
+Settings come from environment variables:
+- COLUMNAR_CACHE: "1" turns the cache on (default 0). It stays off when NumPy is not installed.
+- COLUMNAR_CACHE_DIR: cache folder (default .cache/columnar, relative to the working directory).
+"""
+#####################################
+# Import Modules
+#####################################
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import pathlib
+
+# Import from local project modules
+from utils_logger import logger
+from utils_fetch import content_digest
+
+# Optional dependency, the cache is turned off without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#####################################
+# Declare Global Variables
+#####################################
+
+CACHE_FOLDER: pathlib.Path = pathlib.Path(os.environ.get("COLUMNAR_CACHE_DIR", pathlib.Path(".cache", "columnar")))
+
+# Whether processors use the cache, changed through set_cache_enabled()
+CACHE_ENABLED: bool = np is not None and os.environ.get("COLUMNAR_CACHE", "0").strip().lower() in ("1", "true", "yes")
+
+MANIFEST_NAME = "manifest.json"
+
+# Values a ColumnBuilder collects before turning them into a NumPy chunk
+CHUNK_ROWS = 65536
+
+#####################################
+# Define Classes
+#####################################
+
+class ColumnarTable:
+    """
+    One cached table: its column names, row count and memory-mapped columns.
+
+    names lists every column of the source table when the loader knows them (the CSV header),
+    otherwise only the cached columns (sheet columns that were asked for by letter).
+    """
+
+    def __init__(self, folder: pathlib.Path, manifest: dict) -> None:
+        self.folder = folder
+        self.manifest = manifest
+        self.names: list = list(manifest["names"] if manifest.get("names") is not None else manifest["columns"])
+        self.rows: int = manifest["rows"]
+
+    def column(self, name: str):
+        """
+        Load one column, memory-mapped.
+
+        Returns:
+            numpy.ndarray: float64 for numeric columns, a fixed-width str array otherwise.
+
+        Raises:
+            KeyError: If the table has no such column.
+        """
+        return np.load(self.folder.joinpath(self.manifest["columns"][name]["file"]), mmap_mode="r")
+
+class ColumnBuilder:
+    """
+    Collect one column's values while a file is streamed, as compact NumPy chunks.
+
+    Every CHUNK_ROWS values are turned into an array, so memory holds the column's data and
+    not one Python object per cell. finish() returns the same array to_column_array() would
+    return for all the values at once, or the cells' text unchanged when keep_text is set.
+    """
+
+    def __init__(self, parse_text_numbers: bool = True, keep_text: bool = False) -> None:
+        self.parse_text_numbers = parse_text_numbers
+        self.keep_text = keep_text
+        self.pending: list = []
+        self.chunks: list = []
+
+    def append(self, value) -> None:
+        """Add one cell value; None and "" are blanks."""
+        self.pending.append(value)
+        if len(self.pending) >= CHUNK_ROWS:
+            self.flush()
+
+    def extend(self, values) -> None:
+        """Add several cell values."""
+        for value in values:
+            self.append(value)
+
+    def flush(self) -> None:
+        """Turn the pending values into a chunk."""
+        if not self.pending:
+            return
+        if self.parse_text_numbers or self.keep_text:
+            # CSV cells: keep the text, it is only known to be a number column once every chunk is in
+            chunk = np.array(["" if value is None else str(value) for value in self.pending], dtype=str)
+        else:
+            chunk = to_column_array(self.pending, parse_text_numbers=False)
+        self.chunks.append(chunk)
+        self.pending = []
+
+    def finish(self):
+        """
+        Return the whole column and release the chunks.
+
+        Returns:
+            numpy.ndarray: float64 with NaN for blanks if every non-blank value is a number, otherwise str.
+                Always str when keep_text is set.
+        """
+        self.flush()
+        chunks, self.chunks = self.chunks, []
+        if not chunks:
+            return np.array([], dtype=str if self.keep_text else np.float64)
+        if self.keep_text:
+            return np.concatenate(chunks)
+        if self.parse_text_numbers:
+            try:
+                # Chunk by chunk, so only the float copy of the column is ever whole
+                return np.concatenate([np.where(chunk == "", "nan", chunk).astype(np.float64) for chunk in chunks])
+            except ValueError:
+                return np.concatenate(chunks)
+        if all(chunk.dtype.kind == "f" for chunk in chunks):
+            return np.concatenate(chunks)
+        # A text column: numbers in it are not text, so they are blank like in to_column_array()
+        return np.concatenate([chunk if chunk.dtype.kind == "U" else np.full(len(chunk), "", dtype="<U1")
+                               for chunk in chunks])
+
+#####################################
+# Define Functions
+#####################################
+
+def set_cache_enabled(enabled: bool) -> bool:
+    """
+    Turn the columnar cache on or off for this process.
+
+    Returns:
+        bool: Whether the cache is now on; it stays off when NumPy is not installed.
+    """
+    global CACHE_ENABLED
+    CACHE_ENABLED = bool(enabled) and np is not None
+    return CACHE_ENABLED
+
+def table_folder(digest: str, table: str) -> pathlib.Path:
+    """Return the cache folder of one table of the input file with the given digest."""
+    # Table names such as "sheet:Sales 2024" are made file-name safe, with a short hash so they stay unique
+    safe_name = re.sub(r"[^\w.-]", "_", table)[:60]
+    table_hash = hashlib.sha256(table.encode("utf-8")).hexdigest()[:8]
+    return CACHE_FOLDER.joinpath(digest, f"{safe_name}-{table_hash}")
+
+def to_column_array(values: list, parse_text_numbers: bool = True):
+    """
+    Convert one column of parsed values to the array it is cached as.
+
+    Args:
+        values (list): Cell values; None and "" are blanks.
+        parse_text_numbers (bool): Treat text that parses as a number as a number, as for CSV cells.
+            XLSX cells are already typed, so text there stays text.
+
+    Returns:
+        numpy.ndarray: float64 with NaN for blanks if every non-blank value is a number, otherwise str.
+    """
+    numbers = []
+    for value in values:
+        if value is None or value == "":
+            numbers.append(float("nan"))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            numbers.append(float(value))
+        elif parse_text_numbers and isinstance(value, str):
+            try:
+                numbers.append(float(value))
+            except ValueError:
+                break
+        else:
+            break
+    else:
+        return np.array(numbers, dtype=np.float64)
+    if parse_text_numbers:
+        texts = ["" if value is None else str(value) for value in values]
+    else:
+        texts = [value if isinstance(value, str) else "" for value in values]
+    return np.array(texts, dtype=str) if texts else np.array([], dtype="<U1")
+
+def load_table_manifest(folder: pathlib.Path):
+    """Return a cached table's manifest, or None if it is not cached (or unreadable)."""
+    try:
+        with folder.joinpath(MANIFEST_NAME).open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+def column_file_name(name: str) -> str:
+    """Return the .npy file name of a column, unique per column name."""
+    return f"column_{hashlib.sha256(name.encode('utf-8')).hexdigest()[:16]}.npy"
+
+def write_json_atomically(file_path: pathlib.Path, data: dict) -> None:
+    """Write a JSON file under a temporary name and rename it into place."""
+    temp_file = file_path.with_name(f"{file_path.name}.tmp{os.getpid()}")
+    with temp_file.open('w', encoding='utf-8') as file:
+        json.dump(data, file, indent=4)
+    os.replace(temp_file, file_path)
+
+def store_columns(file_path: pathlib.Path, digest: str, table: str, names: list, builders: dict,
+                  rows: int) -> dict:
+    """
+    Add columns of one table to the cache, one column in memory at a time.
+
+    Args:
+        file_path (pathlib.Path): The source file the columns were read from.
+        digest (str): SHA-256 of the source file.
+        table (str): Name of the table within the source file, such as "csv" or "sheet:Sales".
+        names (list): Every column name of the table, or None if not known.
+        builders (dict): Maps each column name to the ColumnBuilder holding its values.
+        rows (int): Number of rows of the table.
+
+    Returns:
+        dict: The table's manifest, including columns cached earlier.
+    """
+    folder = table_folder(digest, table)
+    new_table = not folder.exists()
+    folder.mkdir(parents=True, exist_ok=True)
+    stored = {}
+    for name in list(builders):
+        array = builders.pop(name).finish()
+        file_name = column_file_name(name)
+        temp_file = folder.joinpath(f"{file_name}.tmp{os.getpid()}")
+        # Through a file object, as np.save() would add ".npy" to the temporary name
+        with temp_file.open('wb') as file:
+            np.save(file, array)
+        os.replace(temp_file, folder.joinpath(file_name))
+        stored[name] = {"file": file_name, "dtype": array.dtype.str}
+        del array
+    # Another process may have added columns meanwhile, so merge with the manifest on disk
+    manifest = load_table_manifest(folder) or {
+        "source": str(pathlib.Path(file_path).resolve()),
+        "sha256": digest,
+        "table": table,
+        "names": None,
+        "columns": {},
+    }
+    manifest["rows"] = rows
+    if names is not None:
+        manifest["names"] = list(names)
+    manifest["columns"].update(stored)
+    write_json_atomically(folder.joinpath(MANIFEST_NAME), manifest)
+    if new_table:
+        prune_other_versions(manifest["source"], digest)
+    return manifest
+
+def prune_other_versions(source: str, keep_digest: str) -> None:
+    """Remove cached tables of older contents of the same source file."""
+    for manifest_file in CACHE_FOLDER.glob(f"*/*/{MANIFEST_NAME}"):
+        digest_folder = manifest_file.parent.parent
+        if digest_folder.name == keep_digest:
+            continue
+        manifest = load_table_manifest(manifest_file.parent)
+        if manifest and manifest.get("source") == source:
+            shutil.rmtree(manifest_file.parent, ignore_errors=True)
+            try:
+                # Another process caching a sheet of the same file may have removed it already
+                if not any(digest_folder.iterdir()):
+                    digest_folder.rmdir()
+            except OSError:
+                pass
+
+def load_table(file_path: pathlib.Path, table: str, loader, columns: list = None) -> ColumnarTable:
+    """
+    Return a cached table of a file, reading the requested columns that are not cached yet first.
+
+    Args:
+        file_path (pathlib.Path): The source file.
+        table (str): Name of the table within the file, such as "csv" or "sheet:Sales".
+        loader: Function of (file_path, columns) that streams the file once and returns a tuple
+            (every column name or None if unknown, dict of column name -> ColumnBuilder, row count).
+            columns is a list of the names to read, or None for every column; names that are not
+            in the file are left out of the dict.
+        columns (list): Columns the caller needs, or None for every column.
+
+    Returns:
+        ColumnarTable: The cached table; its columns are loaded memory-mapped on request.
+
+    Example:
+        table = load_table(input_file, "csv", read_csv_columns, ["Speed"])
+        speed = as_float_array(table.column("Speed"))
+    """
+    digest = content_digest(file_path)
+    folder = table_folder(digest, table)
+    manifest = load_table_manifest(folder)
+    cached = manifest["columns"] if manifest else {}
+    names = manifest.get("names") if manifest else None
+    if columns is None:
+        wanted = None if names is None else [name for name in names if name not in cached]
+    else:
+        wanted = [name for name in dict.fromkeys(columns) if name not in cached and (names is None or name in names)]
+    if manifest is None or wanted is None or wanted:
+        started_at = time.perf_counter()
+        loaded_names, builders, rows = loader(file_path, wanted)
+        column_count = len(builders)
+        manifest = store_columns(file_path, digest, table, loaded_names, builders, rows)
+        logger.info(f"Cached {column_count} columns of {file_path} ({table}) in {folder} "
+                    f"in {time.perf_counter() - started_at:.2f}s")
+    return ColumnarTable(folder, manifest)
+
+def as_float_array(array):
+    """Return a cached column as float64, turning text that is not a number into NaN."""
+    if array.dtype.kind == "f":
+        return array
+    try:
+        # Fast path: every cell is a number after all
+        return array.astype(np.float64)
+    except ValueError:
+        pass
+    values = np.empty(len(array), dtype=np.float64)
+    for index, text in enumerate(array.tolist()):
+        try:
+            values[index] = float(text) if text.strip() else np.nan
+        except ValueError:
+            values[index] = np.nan
+    return values
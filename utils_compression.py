@@ -0,0 +1,169 @@
+"""
+Compressed Files
+File: utils_compression.py
+
+This script lets the fetchers write, and the processors read, gzip or zstd compressed files
+as easily as plain ones. The compression is chosen by the file name: "people.json.gz" is gzip,
+"people.json.zst" is zstd, anything else is a plain file.
+
+Features:
+- open_file() works like open() for plain, .gz and .zst files, in text or binary mode.
+  Compressed files are compressed and decompressed as a stream, so memory stays small.
+- gzip output has no timestamp or file name in its header, so the same content always gives
+  the same bytes and the same SHA-256 (the fetch metadata and the columnar cache rely on that).
+- find_input() lets a processor that expects "people.json" pick up "people.json.gz" or
+  "people.json.zst" instead, whichever was written last.
+- zstd needs the optional zstandard package; gzip only needs the standard library.
+
+Text data such as the CSV, JSON and text inputs usually shrinks 5-10x. XLSX workbooks are
+already zip archives and should be stored as they are.
+
+Settings come from environment variables:
+- COMPRESSION_LEVEL: compression level for both codecs (defaults: gzip 6, zstd 3).
+"""
+#####################################
+# Import Modules
+#####################################
+import io
+import os
+import gzip
+import pathlib
+
+# Optional dependency, zstd files cannot be read or written without it
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Compression of a file, by its last suffix
+COMPRESSION_SUFFIXES: dict = {".gz": "gzip", ".zst": "zstd"}
+
+DEFAULT_LEVELS: dict = {"gzip": 6, "zstd": 3}
+
+COMPRESSION_LEVEL = int(os.environ["COMPRESSION_LEVEL"]) if os.environ.get("COMPRESSION_LEVEL") else None
+
+#####################################
+# Define Classes
+#####################################
+
+class GzipStream(gzip.GzipFile):
+    """GzipFile over an open file that closes the file with it; written files have no timestamp or name in their header."""
+
+    def __init__(self, raw, mode: str, level: int) -> None:
+        super().__init__(filename="", mode=mode, fileobj=raw, compresslevel=level, mtime=0)
+        self.raw = raw
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self.raw.close()
+
+#####################################
+# Define Functions
+#####################################
+
+def compression_of(file_path) -> str:
+    """Return "gzip", "zstd" or None (a plain file), from the file name's suffix."""
+    return COMPRESSION_SUFFIXES.get(pathlib.PurePath(file_path).suffix.lower())
+
+def without_compression_suffix(file_path) -> pathlib.Path:
+    """Return the file name without its .gz or .zst suffix, e.g. to see that "people.jsonl.gz" holds JSON Lines."""
+    file_path = pathlib.Path(file_path)
+    return file_path.with_suffix("") if compression_of(file_path) else file_path
+
+def wrap_binary(raw, compression: str, mode: str = "rb", level: int = None):
+    """
+    Wrap an open binary file so that reads decompress and writes compress.
+
+    Args:
+        raw: File object opened in binary mode ("rb" or "wb"); it is closed with the returned stream.
+        compression (str): "gzip", "zstd" or None to return raw unchanged.
+        mode (str): "rb" or "wb", the mode raw was opened with.
+        level (int): Compression level, defaults to COMPRESSION_LEVEL or the codec's default.
+
+    Returns:
+        A binary file object.
+
+    Raises:
+        ImportError: For zstd when the zstandard package is not installed.
+    """
+    if compression is None:
+        return raw
+    if compression == "zstd" and zstandard is None:
+        raw.close()
+        raise ImportError("Reading or writing .zst files needs the zstandard package (pip install zstandard)")
+    level = level or COMPRESSION_LEVEL or DEFAULT_LEVELS[compression]
+    writing = "w" in mode
+    if compression == "gzip":
+        return GzipStream(raw, "wb" if writing else "rb", level)
+    if writing:
+        return zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=True)
+    # Buffered so readline() and iteration work as they do for plain files
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True, read_across_frames=True))
+
+def open_file(file_path, mode: str = "r", encoding: str = None, errors: str = None, newline: str = None,
+              level: int = None, compression: str = "auto"):
+    """
+    Open a plain, gzip or zstd file like open(), compressing or decompressing as a stream.
+
+    Args:
+        file_path: Path of the file.
+        mode (str): "r", "w", "rb" or "wb".
+        encoding (str): Text encoding in text mode, defaults to the same encoding open() would use.
+        errors (str): How undecodable bytes are handled in text mode, as for open().
+        newline (str): Newline handling in text mode, as for open().
+        level (int): Compression level when writing.
+        compression (str): "gzip", "zstd", None for a plain file, or "auto" to go by the file name.
+
+    Returns:
+        A file object, usable in a with-statement.
+
+    Example:
+        with open_file(pathlib.Path("fetched_data", "people.json.gz"), "r", encoding="utf-8") as file:
+            people = json.load(file)
+    """
+    if compression == "auto":
+        compression = compression_of(file_path)
+    if compression is None:
+        return open(file_path, mode, encoding=encoding, errors=errors, newline=newline)
+    binary_mode = mode.replace("t", "").replace("b", "") + "b"
+    stream = wrap_binary(open(file_path, binary_mode), compression, binary_mode, level)
+    if "b" in mode:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, errors=errors, newline=newline)
+
+def find_input(file_path) -> pathlib.Path:
+    """
+    Return the file to read for file_path: itself, or its .gz or .zst version.
+
+    When more than one exists, the one written last is used. When none exists, file_path is
+    returned unchanged so the caller's error names the file it expected.
+    """
+    file_path = pathlib.Path(file_path)
+    candidates = [file_path] + [file_path.with_name(file_path.name + suffix) for suffix in COMPRESSION_SUFFIXES]
+    existing = [path for path in candidates if path.exists()]
+    if not existing:
+        return file_path
+    return max(existing, key=lambda path: path.stat().st_mtime)
+
+def compress_file(source, target, level: int = None, chunk_size: int = 1024 * 1024) -> int:
+    """
+    Copy a file, compressing or decompressing it as the two file names say.
+
+    Returns:
+        int: Number of bytes written to the target file.
+
+    Example:
+        compress_file("fetched_data/people.json", "fetched_data/people.json.zst")
+    """
+    target = pathlib.Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open_file(source, "rb") as reader, open_file(target, "wb", level=level) as writer:
+        for chunk in iter(lambda: reader.read(chunk_size), b""):
+            writer.write(chunk)
+    return target.stat().st_size
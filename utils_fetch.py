@@ -0,0 +1,245 @@
+"""
+Fetch Utilities
+File: utils_fetch.py
+
+This script provides shared download helpers for the fetchers in the data folder.
+
+Features:
+- Streams an HTTP response to disk in fixed-size chunks so memory use stays flat
+  no matter how large the download is.
+- Writes through a temporary file in the destination folder and renames it into
+  place, so a failed or interrupted download never leaves a half-written file behind.
+- Keeps a small metadata file next to each fetched file (ETag, Last-Modified and a
+  SHA-256 digest of the content) so the next fetch can send a conditional request,
+  skip the download entirely on 304 Not Modified, and tell later steps whether the
+  file actually changed.
+- Compresses the download on the fly when the file name ends in .gz or .zst
+  (utils_compression.py), unless the server already sent it compressed that way.
+"""
+#####################################
+# Import Modules at the Top
+#####################################
+import os
+import json
+import hashlib
+import stat
+import pathlib
+import tempfile
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+# Import from local project modules
+from utils_logger import logger
+from utils_compression import compression_of, wrap_binary
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# 1 MiB per chunk keeps peak memory small while still making few system calls
+DEFAULT_CHUNK_SIZE: int = 1024 * 1024
+
+# Suffix of the metadata file kept next to each fetched file
+METADATA_SUFFIX: str = ".meta.json"
+
+# The process umask, read once at import: os.umask() can only be read by setting it, which is
+# not safe while fetch threads are creating files
+_UMASK: int = os.umask(0)
+os.umask(_UMASK)
+
+#####################################
+# Define Functions
+#####################################
+
+def new_file_mode(file_path: pathlib.Path) -> int:
+    """
+    Return the permission bits a downloaded file should get.
+
+    An existing file keeps its mode; a new one gets what open() would give it (0o666 minus
+    the umask), rather than the 0o600 that tempfile.mkstemp() creates the temporary file with.
+    """
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+def write_stream_to_file(response, file_path: pathlib.Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple:
+    """
+    Stream the body of an HTTP response to a file, chunk by chunk.
+
+    The response must have been requested with stream=True. The bytes are written
+    to a temporary file next to file_path, which is then atomically renamed over
+    file_path once the download completes. If file_path ends in .gz or .zst the bytes
+    are compressed as they are written, unless the URL already ends in that suffix.
+
+    Args:
+        response (requests.Response): Streaming response to read from.
+        file_path (pathlib.Path): Final location of the downloaded file.
+        chunk_size (int): Number of bytes to read per chunk.
+
+    Returns:
+        tuple: Number of bytes downloaded and the SHA-256 hex digest of the file as stored.
+
+    Example:
+        response = requests.get(url, stream=True)
+        write_stream_to_file(response, pathlib.Path("fetched_data", "data.csv"))
+    """
+    file_path = pathlib.Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    # The temp file must live in the same folder so os.replace() is an atomic rename
+    file_descriptor, temp_name = tempfile.mkstemp(
+        prefix=f".{file_path.name}.", suffix=".part", dir=file_path.parent
+    )
+    compression = compression_of(file_path)
+    if compression and compression_of(urlparse(response.url or "").path) == compression:
+        # Already compressed by the server, store it as served
+        compression = None
+    bytes_written = 0
+    digest = hashlib.sha256()
+    try:
+        with wrap_binary(os.fdopen(file_descriptor, 'wb'), compression, 'wb') as file:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    file.write(chunk)
+                    digest.update(chunk)
+                    bytes_written += len(chunk)
+        os.chmod(temp_name, new_file_mode(file_path))
+        os.replace(temp_name, file_path)
+    except BaseException:
+        # Clean up the partial download before passing the error on
+        pathlib.Path(temp_name).unlink(missing_ok=True)
+        raise
+    finally:
+        response.close()
+    if compression:
+        # The digest describes the file on disk, which holds the compressed bytes
+        logger.info(f"Streamed {bytes_written:,} bytes to {file_path} ({file_path.stat().st_size:,} bytes {compression})")
+        return bytes_written, file_digest(file_path, chunk_size)
+    logger.info(f"Streamed {bytes_written:,} bytes to {file_path}")
+    return bytes_written, digest.hexdigest()
+
+def file_digest(file_path: pathlib.Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Return the SHA-256 hex digest of a file, reading it in chunks."""
+    digest = hashlib.sha256()
+    with pathlib.Path(file_path).open('rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def content_digest(file_path: pathlib.Path) -> str:
+    """
+    Return the SHA-256 of a file, reusing the digest saved by the last fetch when it is current.
+
+    The saved digest is only trusted if the metadata was written after the file and the size
+    still matches, so a file edited by hand is hashed again.
+    """
+    file_path = pathlib.Path(file_path)
+    metadata = load_fetch_metadata(file_path)
+    file_stat = file_path.stat()
+    if (metadata.get("sha256") and metadata.get("size") == file_stat.st_size
+            and metadata_path(file_path).stat().st_mtime >= file_stat.st_mtime):
+        return metadata["sha256"]
+    return file_digest(file_path)
+
+def metadata_path(file_path: pathlib.Path) -> pathlib.Path:
+    """Return the path of the metadata file kept next to a fetched file."""
+    file_path = pathlib.Path(file_path)
+    return file_path.with_name(file_path.name + METADATA_SUFFIX)
+
+def load_fetch_metadata(file_path: pathlib.Path) -> dict:
+    """
+    Read the fetch metadata stored next to a fetched file.
+
+    Args:
+        file_path (pathlib.Path): Path of the fetched file (not the metadata file).
+
+    Returns:
+        dict: The stored metadata, or an empty dict if there is none or it cannot be read.
+    """
+    try:
+        with metadata_path(file_path).open('r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable fetch metadata for {file_path}: {e}")
+        return {}
+
+def save_fetch_metadata(file_path: pathlib.Path, metadata: dict) -> None:
+    """Write the fetch metadata for a fetched file, replacing it atomically."""
+    target = metadata_path(file_path)
+    temp_path = target.with_name(target.name + ".part")
+    with temp_path.open('w', encoding='utf-8') as file:
+        json.dump(metadata, file, indent=4)
+    os.replace(temp_path, target)
+
+def conditional_headers(file_path: pathlib.Path, url: str) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers from the last fetch of a file.
+
+    Headers are only sent when the file is still on disk and was last fetched
+    from the same URL, otherwise a 304 reply would leave us with no data.
+
+    Args:
+        file_path (pathlib.Path): Path of the fetched file.
+        url (str): URL about to be fetched.
+
+    Returns:
+        dict: Request headers, empty when there is nothing to validate against.
+    """
+    metadata = load_fetch_metadata(file_path)
+    if not metadata or metadata.get("url") != url or not pathlib.Path(file_path).exists():
+        return {}
+    headers = {}
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+    return headers
+
+def record_fetch(file_path: pathlib.Path, url: str, response, digest: str = None) -> bool:
+    """
+    Store the validators and digest of a freshly downloaded file.
+
+    Args:
+        file_path (pathlib.Path): Path of the fetched file.
+        url (str): URL the file was fetched from.
+        response (requests.Response): The 200 response the file came from.
+        digest (str): SHA-256 of the file if already known, otherwise it is computed from disk.
+
+    Returns:
+        bool: True if the content differs from the previous fetch (or there was none).
+    """
+    previous = load_fetch_metadata(file_path)
+    digest = digest or file_digest(file_path)
+    changed = previous.get("sha256") != digest
+    now = datetime.now(timezone.utc).isoformat()
+    save_fetch_metadata(file_path, {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "sha256": digest,
+        "size": pathlib.Path(file_path).stat().st_size,
+        "fetched_at": now,
+        "checked_at": now,
+        "changed": changed,
+    })
+    if not changed:
+        logger.info(f"Downloaded {file_path} but its content is unchanged")
+    return changed
+
+def record_not_modified(file_path: pathlib.Path) -> None:
+    """Mark a fetched file as checked and unchanged after a 304 Not Modified reply."""
+    metadata = load_fetch_metadata(file_path)
+    metadata["checked_at"] = datetime.now(timezone.utc).isoformat()
+    metadata["changed"] = False
+    save_fetch_metadata(file_path, metadata)
+
+def file_changed(file_path: pathlib.Path) -> bool:
+    """
+    Report whether the last fetch of a file changed its content.
+
+    Downstream steps can call this to skip work when their input is the same as last time.
+    Files with no fetch metadata are treated as changed.
+    """
+    return load_fetch_metadata(file_path).get("changed", True)
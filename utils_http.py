@@ -0,0 +1,136 @@
+"""
+HTTP Session Setup
+File: utils_http.py
+
+This script provides the shared HTTP session used by every fetcher in the data folder.
+
+Features:
+- One pooled requests.Session, so repeated downloads from the same host reuse
+  keep-alive connections instead of paying a new TCP and TLS handshake each time.
+- Connect and read timeouts on every request, so a stalled server cannot hang a job forever.
+- Automatic retries with exponential backoff and jitter on 429 and 5xx responses
+  and on connection errors, honouring the server's Retry-After header.
+
+Call configure_http() before fetching to change any of the settings.
+"""
+#####################################
+# Import Modules at the Top
+#####################################
+import threading
+
+# Imports from external packages
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Import from local project modules
+from utils_logger import logger
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Current settings, changed through configure_http()
+HTTP_SETTINGS: dict = {
+    "connect_timeout": 10.0,      # seconds to wait for a connection
+    "read_timeout": 60.0,         # seconds to wait between bytes of the response
+    "total_retries": 5,           # attempts after the first one
+    "backoff_factor": 0.5,        # sleeps 0.5s, 1s, 2s, 4s, ... between attempts
+    "backoff_jitter": 0.5,        # up to this many random seconds added to each sleep
+    "backoff_max": 60.0,          # longest single sleep between attempts
+    "pool_connections": 10,       # number of hosts to keep connection pools for
+    "pool_maxsize": 10,           # connections kept open per host
+}
+
+# Status codes worth retrying: rate limiting and server-side failures
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+
+#####################################
+# Define Functions
+#####################################
+
+def build_session(settings: dict) -> requests.Session:
+    """
+    Create a requests.Session with connection pooling and a retry policy.
+
+    Args:
+        settings (dict): Settings in the same shape as HTTP_SETTINGS.
+
+    Returns:
+        requests.Session: A new session with the retrying adapter mounted for http and https.
+    """
+    retry = Retry(
+        total=settings["total_retries"],
+        connect=settings["total_retries"],
+        read=settings["total_retries"],
+        status=settings["total_retries"],
+        backoff_factor=settings["backoff_factor"],
+        backoff_jitter=settings["backoff_jitter"],
+        backoff_max=settings["backoff_max"],
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        # Hand the last response back instead of raising, so callers still see
+        # the real status code through response.raise_for_status()
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings["pool_connections"],
+        pool_maxsize=settings["pool_maxsize"],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = build_session(HTTP_SETTINGS)
+        return _session
+
+def configure_http(**overrides) -> None:
+    """
+    Change the HTTP settings used by all fetchers.
+
+    The shared session is closed and rebuilt with the new settings on the next request.
+
+    Args:
+        **overrides: Any keys from HTTP_SETTINGS, for example read_timeout=120 or pool_maxsize=32.
+
+    Raises:
+        KeyError: If an override is not a known setting.
+
+    Example:
+        configure_http(total_retries=3, read_timeout=300)
+    """
+    global _session
+    unknown = set(overrides) - set(HTTP_SETTINGS)
+    if unknown:
+        raise KeyError(f"Unknown HTTP settings: {sorted(unknown)}")
+    with _session_lock:
+        HTTP_SETTINGS.update(overrides)
+        if _session is not None:
+            _session.close()
+            _session = None
+    logger.info(f"HTTP settings updated: {overrides}")
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """
+    Send a GET request through the shared session with the configured timeouts.
+
+    Args:
+        url (str): URL to fetch.
+        **kwargs: Passed on to requests.Session.get(), for example stream=True or headers={...}.
+
+    Returns:
+        requests.Response: The response from the server.
+    """
+    kwargs.setdefault("timeout", (HTTP_SETTINGS["connect_timeout"], HTTP_SETTINGS["read_timeout"]))
+    return get_session().get(url, **kwargs)
@@ -0,0 +1,153 @@
+"""
+JSON Codec Setup
+File: utils_json.py
+
+This script provides the JSON encode/decode functions used by the JSON fetcher and processor.
+
+Features:
+- Uses the fastest JSON library that is installed: orjson, then ujson, then the
+  standard library json module.
+- The backend can be forced with set_backend() or the JSON_BACKEND environment
+  variable ("orjson", "ujson", "json" or "auto").
+- loads() accepts str or bytes, and dumps() always returns str, whichever backend is active.
+
+Notes:
+- orjson can only indent by 2 spaces, so dumps() with any other indent uses the standard
+  library. The fetchers write indent=2 so they stay on the fast path.
+- orjson only handles integers in the signed/unsigned 64-bit range, and it rejects NaN and
+  Infinity, which the standard library reads and writes. dumps() falls back to the standard
+  library for wide integers; loads() falls back to it when the text has an integer of 19 or
+  more digits (orjson would decode it as a float and lose digits) or when the fast backend
+  raises. Results are therefore the same whichever backend is active.
+"""
+#####################################
+# Import Modules
+#####################################
+import os
+import re
+import json
+
+# Import from local project modules
+from utils_logger import logger
+
+# Optional faster backends
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Backends in order of preference, mapped to whether they are installed
+AVAILABLE_BACKENDS: dict = {
+    "orjson": orjson is not None,
+    "ujson": ujson is not None,
+    "json": True,
+}
+
+# Name of the backend in use, set by set_backend()
+BACKEND: str = "json"
+
+# Integer literals of 19+ digits may not fit in 64 bits; loads() hands such text to the standard library
+WIDE_INTEGER_PATTERN = re.compile(r"(?<![\d.])\d{19,}(?![\d.eE])")
+WIDE_INTEGER_BYTES_PATTERN = re.compile(WIDE_INTEGER_PATTERN.pattern.encode("ascii"))
+
+#####################################
+# Define Functions
+#####################################
+
+def set_backend(name: str = "auto") -> str:
+    """
+    Choose the JSON library used by loads() and dumps().
+
+    Args:
+        name (str): "orjson", "ujson", "json", or "auto" for the fastest one installed.
+
+    Returns:
+        str: Name of the backend now in use.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+    """
+    global BACKEND
+    if name == "auto":
+        name = next(backend for backend, installed in AVAILABLE_BACKENDS.items() if installed)
+    if name not in AVAILABLE_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}', expected one of {sorted(AVAILABLE_BACKENDS)} or 'auto'")
+    if not AVAILABLE_BACKENDS[name]:
+        raise ValueError(f"JSON backend '{name}' is not installed")
+    BACKEND = name
+    return BACKEND
+
+def loads(data):
+    """
+    Decode a JSON document.
+
+    Args:
+        data (str or bytes): The JSON text.
+
+    Returns:
+        The decoded Python object, the same as json.loads() returns: integers wider than 64 bits
+        stay exact and NaN/Infinity are accepted (see the module notes).
+
+    Raises:
+        ValueError: If the text is not valid JSON (every backend's decode error is a ValueError).
+    """
+    if BACKEND in ("orjson", "ujson") and not has_wide_integer(data):
+        try:
+            return orjson.loads(data) if BACKEND == "orjson" else ujson.loads(data)
+        except ValueError:
+            # orjson.JSONDecodeError is a ValueError, raised for NaN and Infinity among others;
+            # the standard library decodes those, or raises the error for text that is not JSON
+            pass
+    return json.loads(data)
+
+def has_wide_integer(data) -> bool:
+    """Return True if the JSON text has an integer literal that may not fit in 64 bits."""
+    pattern = WIDE_INTEGER_BYTES_PATTERN if isinstance(data, (bytes, bytearray, memoryview)) else WIDE_INTEGER_PATTERN
+    return pattern.search(data) is not None
+
+def dumps(obj, indent: int = None) -> str:
+    """
+    Encode a Python object as JSON text.
+
+    Args:
+        obj: The object to encode.
+        indent (int): Spaces per indent level, or None for compact single-line output.
+
+    Returns:
+        str: The JSON text. Non-ASCII characters are written as-is, not escaped.
+
+    Raises:
+        TypeError: If obj holds a value that JSON cannot represent.
+    """
+    try:
+        if BACKEND == "orjson" and indent in (None, 2):
+            option = orjson.OPT_INDENT_2 if indent == 2 else 0
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        if BACKEND == "ujson":
+            return ujson.dumps(obj, indent=indent or 0, ensure_ascii=False, escape_forward_slashes=False)
+    except (TypeError, OverflowError):
+        # orjson.JSONEncodeError is a TypeError, raised for integers wider than 64 bits among
+        # others; ujson raises OverflowError for those. The standard library encodes them.
+        pass
+    if indent is None:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+#####################################
+# Select the backend at import time
+#####################################
+
+try:
+    set_backend(os.environ.get("JSON_BACKEND", "auto"))
+except ValueError as e:
+    logger.warning(f"{e}; using the fastest installed JSON backend instead")
+    set_backend("auto")
@@ -8,12 +8,31 @@ Logging is an essential way to track events and issues during execution.
 Features:
 - Logs information, warnings, and errors to a designated log file.
 - Ensures the log directory exists.
+- Writes through a background queue by default, so logging calls on hot paths do not block on file I/O.
+- Rotates the log file by size and keeps a limited number of old files.
+- Only the main process adds the file sink. Worker processes started with "spawn" (the default
+  on Windows and macOS) import this module again and log to the console only, so several
+  processes never write and rotate the same file; forked workers inherit the main process's
+  sinks, and their messages go through its queue.
+- WarningAggregator shows only the first few of a repeated warning and logs a total at the end.
+
+Settings come from environment variables:
+- LOG_LEVEL: lowest level written to the log file (default INFO).
+- LOG_CONSOLE_LEVEL: lowest level written to the console (default DEBUG).
+- LOG_ENQUEUE: "1" to write through a background queue, "0" to write synchronously (default 1).
+- LOG_ROTATION: when to start a new log file, for example "10 MB" or "1 day" (default 10 MB).
+- LOG_RETENTION: how many old log files to keep, or an age such as "7 days" (default 5).
+- LOG_WARNING_LIMIT: how many repeats of an aggregated warning are shown (default 10).
 
 THIS LOGGER SHOULD WORK WITHOUT NEEDING MODIFICATION.
 Just put a copy in your root project folder and import in your scripts as shown in the examples.
 """
 # Imports from Python Standard Library
+import os
+import sys
 import pathlib
+import threading
+import multiprocessing
 
 # Imports from external packages
 from loguru import logger
@@ -27,21 +46,133 @@ LOG_FOLDER: pathlib.Path = pathlib.Path("logs")
 # Set the name of the log file
 LOG_FILE: pathlib.Path = LOG_FOLDER.joinpath("project_log.log")
 
-# Ensure the log folder exists or create it
-try:
-    LOG_FOLDER.mkdir(exist_ok=True)
-    logger.info(f"Log folder created at: {LOG_FOLDER}")
-except Exception as e:
-    logger.error(f"Error creating log folder: {e}")
+# Logging settings, see the module docstring for the environment variables
+LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO")
+LOG_CONSOLE_LEVEL: str = os.environ.get("LOG_CONSOLE_LEVEL", "DEBUG")
+LOG_ENQUEUE: bool = os.environ.get("LOG_ENQUEUE", "1").strip().lower() not in ("0", "false", "no")
+LOG_ROTATION: str = os.environ.get("LOG_ROTATION", "10 MB")
+LOG_RETENTION = os.environ.get("LOG_RETENTION", "5")
+LOG_WARNING_LIMIT: int = int(os.environ.get("LOG_WARNING_LIMIT", "10"))
+
+# A plain number of files is passed to loguru as an int, anything else (like "7 days") as text
+if LOG_RETENTION.isdigit():
+    LOG_RETENTION = int(LOG_RETENTION)
+
+# True in the main process, False in worker processes (see the module docstring).
+# A spawned worker imports the main script, and with it this module, before parent_process()
+# is set, but after it has been given its own process name
+IS_MAIN_PROCESS: bool = (
+    multiprocessing.parent_process() is None and multiprocessing.current_process().name == "MainProcess"
+)
+
+# Ensure the log folder exists or create it; the outcome is logged once the sinks are set up
+folder_error = None
+if IS_MAIN_PROCESS:
+    try:
+        LOG_FOLDER.mkdir(exist_ok=True)
+    except Exception as e:
+        folder_error = e
 
-# Configure Loguru to write to the log file
+# Configure Loguru to write to the console and the log file.
+# With enqueue=True, logging calls only put the message on a queue and a background
+# thread does the writing; loguru drains the queue when the program exits.
 try:
-    logger.add(LOG_FILE, level="INFO")
-    logger.info(f"Logging to file: {LOG_FILE}")
+    logger.remove()
+    logger.add(sys.stderr, level=LOG_CONSOLE_LEVEL, enqueue=LOG_ENQUEUE)
+    if IS_MAIN_PROCESS:
+        if folder_error is not None:
+            logger.error(f"Error creating log folder: {folder_error}")
+        logger.add(LOG_FILE, level=LOG_LEVEL, enqueue=LOG_ENQUEUE, rotation=LOG_ROTATION, retention=LOG_RETENTION)
+        logger.info(f"Log folder created at: {LOG_FOLDER}")
+        logger.info(f"Logging to file: {LOG_FILE}")
 except Exception as e:
     logger.error(f"Error configuring logger to write to file: {e}")
 
 
+class WarningAggregator:
+    """
+    Log only the first few occurrences of a repeated warning, then a single total.
+
+    Use it for warnings that can fire once per row, so a dirty input does not produce
+    millions of log lines. The message arguments are only formatted for the warnings
+    that are actually shown.
+
+    Worker processes have their own copy of an aggregator. A worker calls defer() before its
+    work and returns take() with its result; the parent passes that to merge(), so the log
+    shows the first few warnings of all workers together and one total for the whole input.
+
+    Example:
+        with WarningAggregator("Skipped invalid rows") as invalid_rows:
+            for row in rows:
+                invalid_rows.warn("Skipping invalid row: {}", row)
+        # logs the first 10 rows, then "Skipped invalid rows: 12,345 in total, first 10 shown"
+    """
+
+    def __init__(self, summary: str, limit: int = LOG_WARNING_LIMIT) -> None:
+        """
+        Args:
+            summary (str): Text of the closing total line, for example "Skipped invalid rows".
+            limit (int): Number of individual warnings to show before suppressing the rest.
+        """
+        self.summary = summary
+        self.limit = limit
+        self.count = 0
+        # Warnings kept to be logged by another process, or None to log them here (see defer())
+        self.deferred = None
+        self._lock = threading.Lock()
+
+    def warn(self, message: str, *args) -> None:
+        """Count one warning and log it if fewer than limit have been shown; args fill {} in message."""
+        with self._lock:
+            self.count += 1
+            shown = self.count <= self.limit
+            if shown and self.deferred is not None:
+                self.deferred.append(message.format(*args))
+                return
+        if shown:
+            logger.opt(depth=1).warning(message, *args)
+
+    def defer(self) -> None:
+        """Keep the warnings that would be shown instead of logging them, until take()."""
+        with self._lock:
+            self.deferred = []
+
+    def take(self) -> tuple:
+        """
+        Reset the count without logging anything and stop deferring.
+
+        Returns:
+            tuple: (number of warnings, list of the deferred warning texts), for merge() in another process.
+        """
+        with self._lock:
+            taken = (self.count, self.deferred or [])
+            self.count, self.deferred = 0, None
+        return taken
+
+    def merge(self, count: int, messages: list) -> None:
+        """Add the warnings another process counted with take(), logging its texts while fewer than limit have been shown."""
+        with self._lock:
+            shown = min(self.count, self.limit)
+            self.count += count
+            messages = messages[:max(0, self.limit - shown)]
+        for message in messages:
+            logger.warning(message)
+
+    def flush(self) -> int:
+        """Log the total if any warnings were suppressed, reset the count and return the old count."""
+        with self._lock:
+            count, self.count = self.count, 0
+        if count > self.limit:
+            logger.warning(f"{self.summary}: {count:,} in total, first {self.limit} shown")
+        return count
+
+    def __enter__(self) -> "WarningAggregator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
 def get_log_file_path() -> pathlib.Path:
     """Return the path to the log file."""
     return LOG_FILE
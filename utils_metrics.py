@@ -0,0 +1,251 @@
+"""
+Run Metrics
+File: utils_metrics.py
+
+This script provides lightweight instrumentation for the fetchers and processors.
+
+Features:
+- @instrument wraps a fetch_*_file or process_*_file function as a "stage": it times the call,
+  collects counters and memory figures, and appends one JSON line per run to logs/metrics.jsonl.
+- count_metric() adds to a counter (bytes, rows, cells, ...) of the stage that is currently
+  running, from anywhere below it; it does nothing when no stage is running.
+- timed() adds the time spent in a block to a "<name>_seconds" counter of the running stage.
+- Every counter also gets a per-second rate in the record, such as bytes_per_second or rows_per_second.
+- peak_rss_bytes is the process's memory high-water mark after the stage and peak_rss_increase_bytes
+  is how much the stage raised it. Both need the resource module (Linux, macOS) or psutil (Windows).
+
+Settings come from environment variables:
+- METRICS_ENABLED: "0" turns recording off (default 1).
+- METRICS_FILE: where the JSON lines are appended (default logs/metrics.jsonl).
+
+Execution Command: py utils_metrics.py [logs/metrics.jsonl]   (prints a per-stage summary)
+"""
+#####################################
+# Import Modules
+#####################################
+import os
+import sys
+import json
+import time
+import pathlib
+import argparse
+import functools
+import threading
+import contextvars
+import statistics
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Import from local project modules
+from utils_logger import logger, LOG_FOLDER
+
+# Peak memory comes from the resource module where it exists, otherwise from psutil if installed
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+#####################################
+# Declare Global Variables
+#####################################
+
+METRICS_ENABLED: bool = os.environ.get("METRICS_ENABLED", "1").strip().lower() not in ("0", "false", "no")
+METRICS_FILE: pathlib.Path = pathlib.Path(os.environ.get("METRICS_FILE", LOG_FOLDER.joinpath("metrics.jsonl")))
+
+# The stage currently running in this thread, set by @instrument
+_current_stage = contextvars.ContextVar("current_stage", default=None)
+
+_write_lock = threading.Lock()
+
+#####################################
+# Define Classes
+#####################################
+
+class StageMetrics:
+    """Timer and counters of one run of an instrumented stage."""
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self.counters: dict = {}
+        self.started_at = time.perf_counter()
+        self.peak_rss_at_start = peak_rss_bytes()
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount=1) -> None:
+        """Add to a counter of this stage."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_record(self, status: str) -> dict:
+        """Build the metrics record written for this run."""
+        seconds = time.perf_counter() - self.started_at
+        peak = peak_rss_bytes()
+        rates = {
+            f"{name}_per_second": round(value / seconds, 3)
+            for name, value in self.counters.items()
+            if not name.endswith("_seconds") and seconds > 0
+        }
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "stage": self.stage,
+            "status": status,
+            "seconds": round(seconds, 6),
+            "counters": self.counters,
+            "rates": rates,
+            "peak_rss_bytes": peak,
+            "peak_rss_increase_bytes": peak - self.peak_rss_at_start if peak is not None else None,
+            "pid": os.getpid(),
+        }
+
+#####################################
+# Define Functions
+#####################################
+
+def peak_rss_bytes():
+    """Return the peak resident memory of this process in bytes, or None if it cannot be measured."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    if psutil is not None:
+        memory = psutil.Process().memory_info()
+        return getattr(memory, "peak_wset", memory.rss)
+    return None
+
+def count_metric(name: str, amount=1) -> None:
+    """
+    Add to a counter of the running stage, for example count_metric("rows", 1000).
+
+    Does nothing when called outside an instrumented stage, so core functions can count
+    unconditionally and still be used on their own.
+    """
+    stage = _current_stage.get()
+    if stage is not None:
+        stage.count(name, amount)
+
+@contextmanager
+def timed(name: str):
+    """Add the time spent in the with-block to the running stage's "<name>_seconds" counter."""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        count_metric(f"{name}_seconds", time.perf_counter() - started_at)
+
+@contextmanager
+def collect_metrics(stage: str):
+    """
+    Make a new StageMetrics the running stage for the with-block and yield it.
+
+    Nothing is written; @instrument uses this and writes the record afterwards, and the
+    benchmarks use it to read the counters of a call.
+
+    Example:
+        with collect_metrics("bench") as stage:
+            analyze_Speed_speed(file_path)
+        rows = stage.counters.get("rows")
+    """
+    stage_metrics = StageMetrics(stage)
+    token = _current_stage.set(stage_metrics)
+    try:
+        yield stage_metrics
+    finally:
+        _current_stage.reset(token)
+
+def write_metrics_record(record: dict) -> None:
+    """Append one metrics record as a JSON line; failures are logged, never raised."""
+    try:
+        METRICS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record) + "\n"
+        with _write_lock, METRICS_FILE.open('a', encoding='utf-8') as file:
+            file.write(line)
+    except OSError as e:
+        logger.error(f"Error writing metrics to {METRICS_FILE}: {e}")
+
+def instrument(function):
+    """
+    Decorator that records a metrics line for every call of a fetch or process function.
+
+    The stage is named after the function. Its status is "error" if the function raised,
+    "failed" if it returned a false value and "ok" otherwise. The fetchers and processors log
+    their errors and return False (or an empty dict, or None), so only a True or non-empty
+    result counts as a success; a function that returns nothing is always recorded as failed.
+
+    Example:
+        @instrument
+        def fetch_csv_file(folder_name, filename, url): ...
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not METRICS_ENABLED:
+            return function(*args, **kwargs)
+        status = "error"
+        with collect_metrics(function.__name__) as stage:
+            try:
+                result = function(*args, **kwargs)
+                status = "ok" if result else "failed"
+                return result
+            finally:
+                write_metrics_record(stage.as_record(status))
+    return wrapper
+
+def load_metrics(file_path: pathlib.Path = METRICS_FILE) -> list:
+    """Read every metrics record from a JSON lines file, skipping lines that cannot be parsed."""
+    records = []
+    with pathlib.Path(file_path).open('r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+def summarize_metrics(records: list) -> dict:
+    """
+    Summarize metrics records per stage.
+
+    Returns:
+        dict: Maps each stage to runs, ok runs, last and median seconds, last rates and largest peak RSS.
+    """
+    by_stage = {}
+    for record in records:
+        by_stage.setdefault(record["stage"], []).append(record)
+    summary = {}
+    for stage, runs in sorted(by_stage.items()):
+        ok_runs = [run for run in runs if run["status"] == "ok"]
+        peaks = [run["peak_rss_bytes"] for run in runs if run.get("peak_rss_bytes") is not None]
+        summary[stage] = {
+            "runs": len(runs),
+            "ok_runs": len(ok_runs),
+            "last_seconds": runs[-1]["seconds"],
+            "median_ok_seconds": statistics.median(run["seconds"] for run in ok_runs) if ok_runs else None,
+            "last_rates": runs[-1].get("rates", {}),
+            "max_peak_rss_bytes": max(peaks) if peaks else None,
+        }
+    return summary
+
+#####################################
+# Main Execution
+#####################################
+
+def main() -> None:
+    """Print a per-stage summary of a metrics file."""
+    parser = argparse.ArgumentParser(description="Summarize the run metrics written by instrumented stages.")
+    parser.add_argument("metrics_file", nargs="?", default=METRICS_FILE, help="JSON lines metrics file.")
+    args = parser.parse_args()
+
+    summary = summarize_metrics(load_metrics(args.metrics_file))
+    print(f"{'stage':<28}{'runs':>6}{'ok':>6}{'last s':>10}{'median s':>10}{'peak MiB':>10}  last rates")
+    for stage, row in summary.items():
+        median = f"{row['median_ok_seconds']:.3f}" if row["median_ok_seconds"] is not None else "-"
+        peak = f"{row['max_peak_rss_bytes'] / 1024 / 1024:.1f}" if row["max_peak_rss_bytes"] is not None else "-"
+        rates = ", ".join(f"{name}={value:,.0f}" for name, value in row["last_rates"].items())
+        print(f"{stage:<28}{row['runs']:>6}{row['ok_runs']:>6}{row['last_seconds']:>10.3f}{median:>10}{peak:>10}  {rates}")
+
+if __name__ == "__main__":
+    main()
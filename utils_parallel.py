@@ -0,0 +1,85 @@
+"""
+Parallel File Splitting
+File: utils_parallel.py
+
+This script provides helpers for splitting one large line-oriented file (CSV, JSON Lines,
+plain text) into byte ranges that separate worker processes can read independently.
+
+Features:
+- Splits a file into roughly equal byte ranges whose edges always fall on line boundaries,
+  so no line is cut in half or read by two workers.
+- Reads the lines of one byte range without touching the rest of the file.
+
+Note: a line boundary is any newline byte, so CSV fields that contain quoted newlines
+cannot be split this way.
+"""
+#####################################
+# Import Modules
+#####################################
+import os
+import pathlib
+
+#####################################
+# Define Functions
+#####################################
+
+def default_worker_count() -> int:
+    """Return the number of worker processes to use when none is given."""
+    return os.cpu_count() or 1
+
+def split_file_ranges(file_path: pathlib.Path, parts: int, start_offset: int = 0) -> list:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        file_path (pathlib.Path): Path to the file to split.
+        parts (int): Number of ranges wanted. Fewer are returned for small files.
+        start_offset (int): Byte offset where the data starts, for example just after a CSV header.
+
+    Returns:
+        list: (start, end) byte offsets, covering start_offset to the end of the file with no gaps or overlaps.
+
+    Example:
+        split_file_ranges(pathlib.Path("fetched_data", "big.csv"), 8, start_offset=header_length)
+    """
+    file_size = pathlib.Path(file_path).stat().st_size
+    if file_size <= start_offset:
+        return []
+    parts = max(1, parts)
+    step = (file_size - start_offset) / parts
+    boundaries = [start_offset]
+    with pathlib.Path(file_path).open('rb') as file:
+        for index in range(1, parts):
+            guess = start_offset + int(step * index)
+            if guess <= boundaries[-1]:
+                continue
+            # Step back one byte so a guess that lands exactly on a line start keeps that line
+            file.seek(guess - 1)
+            file.readline()
+            boundary = file.tell()
+            if boundaries[-1] < boundary < file_size:
+                boundaries.append(boundary)
+    boundaries.append(file_size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+def iter_lines_in_range(file_path: pathlib.Path, start: int, end: int):
+    """
+    Yield the raw lines (as bytes) that start inside one byte range of a file.
+
+    Args:
+        file_path (pathlib.Path): Path to the file.
+        start (int): Offset of the first line, as returned by split_file_ranges().
+        end (int): Offset just past the last line.
+
+    Yields:
+        bytes: Each line, including its newline.
+    """
+    with pathlib.Path(file_path).open('rb') as file:
+        file.seek(start)
+        position = start
+        while position < end:
+            line = file.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line
@@ -0,0 +1,151 @@
+"""
+Multi-Term Search
+File: utils_search.py
+
+This script provides a matcher that counts many search terms in one pass over a piece of text.
+
+Features:
+- Builds an Aho-Corasick automaton once from the term list, so scanning text costs
+  O(length of text + number of matches) no matter how many terms there are.
+- Case-insensitive: terms and text are compared after lower().
+- Counts each term the same way str.count() does (left to right, non-overlapping),
+  so results match a simple loop of text.lower().count(term.lower()) per term.
+- A precompiled combined regex quickly rejects text that contains none of the terms.
+- Can scan a stream of text chunks, carrying the automaton state across chunks, so
+  matches that cross a chunk boundary are found without holding the whole text.
+"""
+#####################################
+# Import Modules
+#####################################
+import re
+
+#####################################
+# Define Classes
+#####################################
+
+class TermMatcher:
+    """Count occurrences of many terms at once with an Aho-Corasick automaton."""
+
+    def __init__(self, terms) -> None:
+        """
+        Build the automaton for a collection of terms.
+
+        Args:
+            terms: Iterable of search terms. Terms that only differ by case share one count.
+
+        Raises:
+            ValueError: If there are no terms or a term is empty.
+        """
+        self.terms: list = list(dict.fromkeys(terms))
+        if not self.terms:
+            raise ValueError("TermMatcher needs at least one term")
+        if any(not term for term in self.terms):
+            raise ValueError("TermMatcher terms must not be empty")
+
+        # Terms that differ only by case become one pattern
+        self.patterns: list = list(dict.fromkeys(term.lower() for term in self.terms))
+        pattern_ids = {pattern: index for index, pattern in enumerate(self.patterns)}
+        self.term_pattern_ids: dict = {term: pattern_ids[term.lower()] for term in self.terms}
+        self.pattern_lengths: list = [len(pattern) for pattern in self.patterns]
+
+        self.goto, self.fail, self.outputs = self.build_automaton(self.patterns)
+        # One combined regex, only used to check cheaply whether any term appears at all
+        alternation = "|".join(re.escape(pattern) for pattern in self.patterns)
+        self.prefilter = re.compile(alternation)
+
+    @staticmethod
+    def build_automaton(patterns: list) -> tuple:
+        """
+        Build the trie, failure links and output lists of an Aho-Corasick automaton.
+
+        Returns:
+            tuple: (goto, fail, outputs) where goto[state] maps a character to the next state,
+                fail[state] is the fallback state and outputs[state] lists the pattern ids ending there.
+        """
+        goto = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for character in pattern:
+                next_state = goto[state].get(character)
+                if next_state is None:
+                    goto.append({})
+                    outputs.append([])
+                    next_state = len(goto) - 1
+                    goto[state][character] = next_state
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        # Breadth-first pass to set failure links and inherit the outputs of suffix states
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for character, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and character not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(character, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+        return goto, fail, outputs
+
+    def count_patterns(self, text: str) -> list:
+        """
+        Count every pattern in already lower-cased text.
+
+        Returns:
+            list: Count per pattern, in the order of self.patterns.
+        """
+        if not self.prefilter.search(text):
+            return [0] * len(self.patterns)
+        return self.count_patterns_in_chunks([text], lower=False)
+
+    def count_patterns_in_chunks(self, chunks, lower: bool = True) -> list:
+        """
+        Count every pattern across a sequence of text chunks as if they were one string.
+
+        Args:
+            chunks: Iterable of strings, for example blocks read from a file.
+            lower (bool): Lower-case each chunk first; pass False if the chunks already are.
+
+        Returns:
+            list: Count per pattern, in the order of self.patterns.
+        """
+        counts = [0] * len(self.patterns)
+        goto, fail, outputs, lengths = self.goto, self.fail, self.outputs, self.pattern_lengths
+        # End (exclusive) of the last counted match of each pattern, to skip overlapping repeats
+        last_end = [0] * len(self.patterns)
+        state = 0
+        offset = 0
+        for chunk in chunks:
+            if lower:
+                chunk = chunk.lower()
+            for position, character in enumerate(chunk, start=offset + 1):
+                while state and character not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(character, 0)
+                for pattern_id in outputs[state]:
+                    if position - lengths[pattern_id] >= last_end[pattern_id]:
+                        counts[pattern_id] += 1
+                        last_end[pattern_id] = position
+            offset += len(chunk)
+        return counts
+
+    def count(self, text: str) -> dict:
+        """
+        Count every term in a piece of text, ignoring case.
+
+        Args:
+            text (str): The text to search.
+
+        Returns:
+            dict: Maps each term to its number of non-overlapping occurrences.
+
+        Example:
+            TermMatcher(["United States", "Canada"]).count("united states, Canada")
+        """
+        return self.counts_by_term(self.count_patterns(text.lower()))
+
+    def counts_by_term(self, pattern_counts: list) -> dict:
+        """Turn per-pattern counts into a dict of term -> count."""
+        return {term: pattern_counts[pattern_id] for term, pattern_id in self.term_pattern_ids.items()}
@@ -0,0 +1,146 @@
+"""
+Streaming Statistics
+File: utils_stats.py
+
+This script provides running statistics that are updated one value at a time,
+so a processor can summarise any number of columns in a single pass over its
+input without keeping the values in memory.
+
+Features:
+- RunningStats tracks count, null count, min, max, mean and sample standard
+  deviation using Welford's algorithm, which stays numerically stable on long inputs.
+- Partial RunningStats built by separate workers can be merged into one exact result
+  with the parallel variance formula (Chan et al.).
+- HyperLogLog estimates how many distinct values a stream has in a fixed few KB of memory,
+  with a typical error under 1%, for fields where an exact set would not fit in memory.
+"""
+#####################################
+# Import Modules
+#####################################
+import math
+import hashlib
+
+#####################################
+# Define Classes
+#####################################
+
+class RunningStats:
+    """Count, null count, min, max, mean and standard deviation of a stream of numbers."""
+
+    __slots__ = ("count", "null_count", "min", "max", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.null_count: int = 0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+        self.mean: float = 0.0
+        # Sum of squared differences from the current mean
+        self.m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Add one value, using Welford's update for the mean and variance."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Combine another partial result into this one, as if all values had been added here.
+
+        Uses the parallel variance update: M2 = M2_a + M2_b + delta^2 * n_a * n_b / n.
+
+        Returns:
+            RunningStats: self, so merges can be chained.
+        """
+        self.null_count += other.null_count
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def add_null(self) -> None:
+        """Record a missing or unparseable value."""
+        self.null_count += 1
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, 0 when there are fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation, matching statistics.stdev()."""
+        return math.sqrt(self.variance)
+
+    def as_dict(self) -> dict:
+        """Return the statistics as a plain dictionary; min, max and mean are None when empty."""
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "null_count": self.null_count,
+            "min": None if empty else self.min,
+            "max": None if empty else self.max,
+            "mean": None if empty else self.mean,
+            "stdev": self.stdev,
+        }
+
+class HyperLogLog:
+    """Approximate count of distinct values using a fixed number of small registers."""
+
+    def __init__(self, precision: int = 14) -> None:
+        """
+        Args:
+            precision (int): Number of index bits, 4 to 16. Uses 2**precision bytes of memory
+                and has a standard error of about 1.04 / sqrt(2**precision) (0.8% at 14).
+        """
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16")
+        self.precision: int = precision
+        self.register_count: int = 1 << precision
+        self.registers: bytearray = bytearray(self.register_count)
+
+    def add(self, value) -> None:
+        """Add a value; values are compared by their string form."""
+        hashed = int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+        index = hashed >> (64 - self.precision)
+        remaining_bits = 64 - self.precision
+        remainder = hashed & ((1 << remaining_bits) - 1)
+        # Position of the first 1 bit in the remaining bits, counting from 1
+        rank = remaining_bits - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Combine another sketch with the same precision into this one."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        self.registers = bytearray(max(mine, theirs) for mine, theirs in zip(self.registers, other.registers))
+        return self
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct values added."""
+        count = self.register_count
+        alpha = 0.7213 / (1 + 1.079 / count)
+        raw_estimate = alpha * count * count / sum(2.0 ** -register for register in self.registers)
+        empty_registers = self.registers.count(0)
+        if raw_estimate <= 2.5 * count and empty_registers:
+            # Small cardinalities are estimated more accurately by linear counting
+            return round(count * math.log(count / empty_registers))
+        return round(raw_estimate)
+
@@ -0,0 +1,154 @@
+"""
+Process-While-Downloading Streams
+File: utils_stream.py
+
+This script lets a processor consume a remote file while it is still downloading,
+instead of waiting for the fetcher to write the complete file to fetched_data/.
+
+Features:
+- A background thread reads the HTTP response in chunks and puts them on a bounded queue,
+  so network time overlaps with the processor's CPU time.
+- The queue is bounded: if the processor falls behind, the download thread waits, so memory
+  stays around queue_size chunks no matter how large the file is.
+- Chunks are decoded incrementally, so multi-byte characters split across chunks are handled.
+- iter_url_lines() splits the text into lines for csv.reader / csv.DictReader.
+- If the processor stops early or fails, the download thread is told to stop and the connection is closed.
+"""
+#####################################
+# Import Modules
+#####################################
+import codecs
+import queue
+import threading
+
+# Import from local project modules
+from utils_logger import logger
+from utils_fetch import DEFAULT_CHUNK_SIZE
+from utils_http import http_get
+from utils_metrics import count_metric
+
+#####################################
+# Declare Global Variables
+#####################################
+
+# Chunks buffered between the download thread and the processor
+DEFAULT_QUEUE_SIZE: int = 8
+
+# Marks the end of the download on the queue
+_END = object()
+
+#####################################
+# Define Functions
+#####################################
+
+def download_into_queue(url: str, chunk_queue: queue.Queue, stop: threading.Event, chunk_size: int) -> None:
+    """
+    Download thread: put the response body on the queue chunk by chunk, then the end marker.
+
+    Any error is put on the queue instead, so the processor re-raises it.
+    """
+    def put(item) -> bool:
+        # Wait for room on the queue, but give up as soon as the processor has stopped reading
+        while not stop.is_set():
+            try:
+                chunk_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        with http_get(url, stream=True) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk and not put(chunk):
+                    return
+        put(_END)
+    except Exception as e:
+        put(e)
+
+def iter_url_chunks(url: str, chunk_size: int = DEFAULT_CHUNK_SIZE, queue_size: int = DEFAULT_QUEUE_SIZE):
+    """
+    Yield the bytes of a remote file as they arrive, downloading ahead on a background thread.
+
+    Args:
+        url (str): URL of the file.
+        chunk_size (int): Bytes per chunk.
+        queue_size (int): Most chunks downloaded ahead of the consumer.
+
+    Yields:
+        bytes: The next chunk of the response body.
+
+    Raises:
+        requests.exceptions.RequestException: If the download fails, raised where the chunk would have been.
+    """
+    chunk_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    downloader = threading.Thread(
+        target=download_into_queue, args=(url, chunk_queue, stop, chunk_size), name="stream-download", daemon=True
+    )
+    downloader.start()
+    received = 0
+    try:
+        while True:
+            item = chunk_queue.get()
+            if item is _END:
+                break
+            if isinstance(item, Exception):
+                raise item
+            received += len(item)
+            yield item
+        count_metric("bytes", received)
+        logger.info(f"Streamed {received:,} bytes from {url}")
+    finally:
+        stop.set()
+        downloader.join()
+
+def iter_url_text(url: str, encoding: str = "utf-8", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  queue_size: int = DEFAULT_QUEUE_SIZE):
+    """
+    Yield the text of a remote file chunk by chunk as it downloads.
+
+    Args:
+        url (str): URL of the file.
+        encoding (str): Text encoding of the file; undecodable bytes are replaced.
+        chunk_size (int): Bytes per chunk.
+        queue_size (int): Most chunks downloaded ahead of the consumer.
+
+    Yields:
+        str: The next piece of decoded text.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    for chunk in iter_url_chunks(url, chunk_size, queue_size):
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+def iter_url_lines(url: str, encoding: str = "utf-8", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   queue_size: int = DEFAULT_QUEUE_SIZE):
+    """
+    Yield the lines of a remote text file as it downloads, each with its line ending.
+
+    Args:
+        url (str): URL of the file.
+        encoding (str): Text encoding of the file; undecodable bytes are replaced.
+        chunk_size (int): Bytes per chunk.
+        queue_size (int): Most chunks downloaded ahead of the consumer.
+
+    Yields:
+        str: The next line, including its trailing newline (the last line may have none).
+
+    Example:
+        for row in csv.DictReader(iter_url_lines("https://example.com/data.csv")): ...
+    """
+    pending = ""
+    for text in iter_url_text(url, encoding, chunk_size, queue_size):
+        lines = (pending + text).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending